@@ -4,10 +4,18 @@ Tools for serializing binary data, wrapping binary streams, and lazily reading/w
 
 from __future__ import annotations
 
+import array
+import bisect
+import io
 import math
+import mmap
 import os
+import struct
+import sys
+import threading
 import zlib
 from contextlib import contextmanager
+from dataclasses import dataclass, replace
 from types import TracebackType
 from typing import (
     BinaryIO,
@@ -16,6 +24,8 @@ from typing import (
     Iterable,
     Tuple,
     Dict,
+    Mapping,
+    NamedTuple,
     Optional,
     Any,
     Literal,
@@ -26,14 +36,32 @@ from typing import (
     List,
     TypeVar,
     Generic,
+    overload,
+    cast,
+)
+from collections import OrderedDict, namedtuple
+from collections.abc import Sized, Hashable, Sequence
+from relic.core.errors import (
+    RelicToolError,
+    MismatchError,
+    MagicMismatchError,
+    RelicSerializationSizeError,
 )
-from collections.abc import Sized
-from relic.core.errors import RelicToolError, MismatchError, RelicSerializationSizeError
 from relic.core.typeshed import Buffer
 
 ByteOrder = Literal["big", "little"]
 
 _KIBIBYTE = 1024
+_MEBIBYTE = 1024 * _KIBIBYTE
+
+_DEFAULT_CACHE_SIZE = 64 * _MEBIBYTE
+
+# Positional IO is unavailable on some platforms (e.g. Windows)
+_HAS_PREAD = hasattr(os, "pread") and hasattr(os, "pwrite")
+_HAS_PREADV = hasattr(os, "preadv")
+_HAS_PWRITEV = hasattr(os, "pwritev")
+# Most platforms limit a vectored write to 1024 buffers
+_IOV_MAX = 1024
 
 
 @runtime_checkable
@@ -76,6 +104,22 @@ def get_proxy(s: Union[BinaryProxy, BinaryIO]) -> BinaryIO:
     return s
 
 
+def _readinto(stream: Any, buffer: memoryview) -> int:
+    """
+    Read from the stream into the buffer, using the stream's readinto if it is available.
+
+    :returns: The number of bytes read into the buffer.
+    :rtype: int
+    """
+    readinto = getattr(stream, "readinto", None)
+    if readinto is not None:
+        read: Optional[int] = readinto(buffer)
+        return read or 0  # raw streams return None if no data is available
+    data = stream.read(len(buffer))
+    buffer[: len(data)] = data
+    return len(data)
+
+
 class BinaryWrapper(BinaryIO):
     """
     Allows a BinaryIO object to be wrapped and subclassed without altering the parent BinaryIO object
@@ -91,6 +135,9 @@ class BinaryWrapper(BinaryIO):
         self._close_parent = close_parent
         self._closed = False
         self._name = name
+        self._handle_now: Optional[int] = None  # last known position of the handle
+        # Nothing else should move a handle the wrapper owns (closes)
+        self._owns_handle = close_parent
 
     def __enter__(self) -> BinaryIO:
         return self
@@ -148,7 +195,26 @@ class BinaryWrapper(BinaryIO):
 
     def read(self, __n: int = -1) -> bytes:
         "`read() on python.org <https://docs.python.org/library/typing.html#typing.IO.read>`_"
-        return self._handle.read(__n)
+        data = self._handle.read(__n)
+        self._advance_handle(len(data))
+        return data
+
+    def readinto(self, __buffer: Buffer) -> int:
+        "`readinto() on python.org <https://docs.python.org/library/io.html#io.BufferedIOBase.readinto>`_"
+        read = _readinto(self._handle, memoryview(__buffer).cast("B"))
+        self._advance_handle(read)
+        return read
+
+    def readinto1(self, __buffer: Buffer) -> int:
+        "`readinto1() on python.org <https://docs.python.org/library/io.html#io.BufferedIOBase.readinto1>`_"
+        view = memoryview(__buffer).cast("B")
+        readinto1 = getattr(self._handle, "readinto1", None)
+        if readinto1 is not None:
+            read: int = readinto1(view)
+        else:
+            read = _readinto(self._handle, view)
+        self._advance_handle(read)
+        return read
 
     def readable(self) -> bool:
         "`readable() on python.org <https://docs.python.org/library/typing.html#typing.IO.readable>`_"
@@ -164,7 +230,26 @@ class BinaryWrapper(BinaryIO):
 
     def seek(self, __offset: int, __whence: int = 0) -> int:
         "`seek() on python.org <https://docs.python.org/library/typing.html#typing.IO.seek>`_"
-        return self._handle.seek(__offset, __whence)
+        self._handle_now = self._handle.seek(__offset, __whence)
+        return self._handle_now
+
+    def _seek_handle(self, offset: int) -> None:
+        """
+        Seek the underlying handle to the given absolute offset.
+
+        The seek is skipped if the handle is already known to be at the offset.
+        Unless the wrapper owns the handle (close_parent), the handle may have been moved by something else since;
+        so the known position is confirmed with tell() first.
+        """
+        if self._handle_now == offset and (
+            self._owns_handle or self._handle.tell() == offset
+        ):
+            return
+        self._handle_now = self._handle.seek(offset)
+
+    def _advance_handle(self, size: int) -> None:
+        if self._handle_now is not None:
+            self._handle_now += size
 
     def seekable(self) -> bool:
         "`seekable() on python.org <https://docs.python.org/library/typing.html#typing.IO.seekable>`_"
@@ -184,7 +269,9 @@ class BinaryWrapper(BinaryIO):
 
     def write(self, __s: Union[bytes, Buffer]) -> int:
         "`write() on python.org <https://docs.python.org/library/typing.html#typing.IO.write>`_"
-        return self._handle.write(__s)
+        written = self._handle.write(__s)
+        self._advance_handle(written)
+        return written
 
     def writelines(self, __lines: Iterable[Union[bytes, Buffer]]) -> None:
         "`writelines() on python.org <https://docs.python.org/library/typing.html#typing.IO.writelines>`_"
@@ -243,11 +330,454 @@ class BinaryWrapper(BinaryIO):
         )
 
 
-class BinaryWindow(BinaryWrapper):
+def _is_plain_file(handle: Any) -> bool:
+    """
+    Whether a handle reads the bytes of its file descriptor as-is; an io.FileIO, or a buffered reader/writer over one.
+
+    Other objects exposing fileno() (e.g. GzipFile, or wrappers) transform or offset the bytes of the descriptor.
+    """
+    if isinstance(handle, (io.BufferedReader, io.BufferedWriter, io.BufferedRandom)):
+        handle = handle.raw
+    return isinstance(handle, io.FileIO)
+
+
+class MappedSource(BinaryWrapper):
+    """
+    A read-only BinaryIO which memory-maps a file once.
+
+    Reads slice the map instead of issuing seek/read calls;
+    BinaryWindows, BinarySerializers and read_chunks over a MappedSource are served directly from the OS page cache.
+
+    :param parent: The file to map, must be a plain file (e.g. from open()) exposing a file descriptor via fileno()
+    :type parent: Union[BinaryIO, BinaryProxy]
+
+    :raises RelicToolError: The parent is not a plain file, or does not expose a file descriptor.
+    """
+
+    def __init__(
+        self,
+        parent: Union[BinaryIO, BinaryProxy],
+        close_parent: bool = True,
+        name: Optional[str] = None,
+    ):
+        super().__init__(parent, close_parent, name=name)
+        if not _is_plain_file(self._handle):
+            raise RelicToolError(
+                "Cannot memory-map a stream which is not a plain file!"
+            )
+        try:
+            fd = self._handle.fileno()
+        except (AttributeError, OSError, ValueError) as e:
+            raise RelicToolError(
+                "Cannot memory-map a stream without a file descriptor!"
+            ) from e
+        self._size = os.fstat(fd).st_size
+        # Empty files cannot be mapped
+        self._map: Optional[mmap.mmap] = (
+            mmap.mmap(fd, 0, access=mmap.ACCESS_READ) if self._size > 0 else None
+        )
+        self._now = 0
+
+    @classmethod
+    def open(cls, path: Union[str, os.PathLike[str]]) -> MappedSource:
+        """
+        Open and memory-map a file.
+
+        :param path: The path of the file to map.
+        :type path: Union[str, os.PathLike[str]]
+
+        :rtype: MappedSource
+        :returns: The mapped file; closing it will also close the file.
+        """
+        handle = open(path, "rb")  # pylint: disable=R1732
+        try:
+            return cls(handle, close_parent=True)
+        except BaseException:
+            handle.close()
+            raise
+
+    @property
+    def size(self) -> int:
+        """
+        The size of the mapped file in bytes.
+        """
+        return self._size
+
+    def read_at(self, offset: int, size: int = -1) -> bytes:
+        """
+        Read bytes from the map at the given offset, without moving the stream's pointer.
+
+        :param offset: The offset to read from.
+        :type offset: int
+
+        :param size: The maximum number of bytes to read, if negative, reads until the end of the map.
+        :type size: int, optional
+
+        :rtype: bytes
+        :returns: The bytes read; may be less than size if the end of the map was reached.
+        """
+        self._check_open()
+        if self._map is None:
+            return b""
+        end = self._size if size < 0 else offset + size
+        return self._map[offset:end]
+
+    def readinto_at(self, buffer: Buffer, offset: int) -> int:
+        """
+        Copy bytes from the map at the given offset into the buffer, without moving the stream's pointer.
+
+        :param buffer: The buffer to fill.
+        :type buffer: Buffer
+
+        :param offset: The offset to read from.
+        :type offset: int
+
+        :rtype: int
+        :returns: The number of bytes copied; may be less than the buffer's size if the end of the map was reached.
+        """
+        self._check_open()
+        view = memoryview(buffer).cast("B")
+        size = max(min(len(view), self._size - offset), 0)
+        if size > 0:
+            with self.view(offset, size) as src:
+                view[:size] = src
+        return size
+
+    def view(self, offset: int = 0, size: int = -1) -> memoryview:
+        """
+        Get a zero-copy view into the map.
+
+        The view must be released before the MappedSource is closed,
+        otherwise the map is only closed once the view is collected.
+
+        :param offset: The offset of the view.
+        :type offset: int, optional
+
+        :param size: The maximum size of the view, if negative, the view ends at the end of the map.
+        :type size: int, optional
+
+        :rtype: memoryview
+        :returns: A read-only view of the mapped file.
+        """
+        self._check_open()
+        if self._map is None:
+            return memoryview(b"")
+        end = self._size if size < 0 else offset + size
+        return memoryview(self._map)[offset:end]
+
+    def find(self, sub: bytes, start: int = 0, end: int = -1) -> int:
+        """
+        Find the lowest offset of sub in the map, without copying the map.
+
+        :param sub: The bytes to find.
+        :type sub: bytes
+
+        :param start: The offset to start searching from. By default, 0.
+        :type start: int, optional
+
+        :param end: The offset to stop searching at, if negative, searches until the end of the map.
+        :type end: int, optional
+
+        :rtype: int
+        :returns: The offset of sub, or -1 if it was not found.
+        """
+        self._check_open()
+        if self._map is None:
+            return -1
+        return self._map.find(sub, start, self._size if end < 0 else end)
+
+    def _check_open(self) -> None:
+        if self._closed:
+            raise ValueError("I/O operation on closed file.")
+
+    def close(self) -> None:
+        if self._map is not None:
+            try:
+                self._map.close()
+            except BufferError:
+                # views still exported; the map is released once they are collected
+                pass
+            self._map = None
+        super().close()
+
+    def __exit__(
+        self,
+        __t: Union[Type[BaseException], None],
+        __value: Union[BaseException, None],
+        __traceback: Union[TracebackType, None],
+    ) -> None:
+        self.close()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed or (self._close_parent and self._handle.closed)
+
+    def read(self, __n: int = -1) -> bytes:
+        if __n < 0:
+            __n = max(self._size - self._now, 0)
+        buffer = self.read_at(self._now, __n)
+        self._now += len(buffer)
+        return buffer
+
+    def readinto(self, __buffer: Buffer) -> int:
+        read = self.readinto_at(__buffer, self._now)
+        self._now += read
+        return read
+
+    def readinto1(self, __buffer: Buffer) -> int:
+        return self.readinto(__buffer)
+
+    def readline(self, __limit: int = -1) -> bytes:
+        raise NotImplementedError
+
+    def readlines(self, __hint: int = -1) -> List[bytes]:
+        raise NotImplementedError
+
+    def seek(self, __offset: int, __whence: int = 0) -> int:
+        if __whence == os.SEEK_SET:
+            new_now = __offset
+        elif __whence == os.SEEK_CUR:
+            new_now = __offset + self._now
+        elif __whence == os.SEEK_END:
+            new_now = self._size + __offset
+        else:
+            raise ValueError(__whence)
+        if new_now < 0:
+            raise RelicToolError("Invalid Seek: seeking past start of stream!")
+        self._now = new_now
+        return self._now
+
+    def tell(self) -> int:
+        return self._now
+
+    def readable(self) -> bool:
+        return True
+
+    def writable(self) -> bool:
+        return False
+
+    def truncate(self, __size: Optional[int] = None) -> int:
+        raise NotImplementedError
+
+    def write(self, __s: Union[bytes, Buffer]) -> int:
+        raise NotImplementedError
+
+    def writelines(self, __lines: Iterable[Union[bytes, Buffer]]) -> None:
+        raise NotImplementedError
+
+
+def _positional_fileno(handle: Any) -> Optional[int]:
+    """
+    Get the file descriptor of a handle, if it can be used for positional (pread/pwrite) IO.
+
+    Only plain files are positional; see _is_plain_file.
+
+    :returns: The file descriptor, or None if positional IO is not supported for the handle.
+    :rtype: Optional[int]
+    """
+    if not _HAS_PREAD:
+        return None
+    if not _is_plain_file(handle):
+        return None
+    try:
+        if not handle.seekable():  # pipes, sockets, etc.
+            return None
+        fd: int = handle.fileno()
+        return fd
+    except (OSError, ValueError):
+        return None
+
+
+class _PositionalIO:
+    """
+    Reads/writes a BinaryIO at absolute offsets.
+
+    When the handle exposes a usable file descriptor, os.pread/os.pwrite are used;
+    this never touches the handle's file pointer, so multiple readers may safely share the handle across threads.
+    Otherwise, the handle is seeked before reading/writing.
+    """
+
+    def __init__(self, handle: BinaryIO):
+        self.handle = handle
+        self._mapped: Optional[MappedSource] = None
+        self._read_fd: Optional[int] = None
+        self._write_fd: Optional[int] = None
+        self._flush_before_read = False
+
+        if isinstance(handle, MappedSource):
+            self._mapped = handle
+            return
+
+        fd = _positional_fileno(handle)
+        if fd is None:  # also the case for closed handles
+            return
+        readable = handle.readable()
+        writable = handle.writable()
+        mode = getattr(handle, "mode", "")
+        if readable:
+            self._read_fd = fd
+            # Buffered writers may hold data the OS hasn't seen yet
+            self._flush_before_read = writable
+        # pwrite bypasses any buffer held by the handle (which may later be flushed over it),
+        # and ignores the offset for files opened in append mode
+        if writable and isinstance(handle, io.RawIOBase) and "a" not in mode:
+            self._write_fd = fd
+
+    @property
+    def positional(self) -> bool:
+        """
+        Whether reads are performed without touching the handle's file pointer.
+        """
+        return self._read_fd is not None or self._mapped is not None
+
+    def _check_open(self) -> None:
+        # The descriptor is cached; once the handle is closed, it may be reused by an unrelated file
+        if self.handle.closed:
+            raise ValueError("I/O operation on closed file.")
+
+    def read(self, offset: int, size: int = -1) -> bytes:
+        """
+        Read bytes from the handle at the given offset.
+
+        :param offset: The absolute offset to read from.
+        :type offset: int
+
+        :param size: The maximum number of bytes to read, if negative, reads until the end of the handle.
+        :type size: int, optional
+
+        :rtype: bytes
+        :returns: The bytes read; may be less than size if the end of the handle was reached.
+        """
+        if self._mapped is not None:
+            return self._mapped.read_at(offset, size)
+        fd = self._read_fd
+        if fd is None:
+            self.handle.seek(offset)
+            return self.handle.read(size)
+
+        self._check_open()
+        if self._flush_before_read:
+            self.handle.flush()
+        if size < 0:
+            size = max(os.fstat(fd).st_size - offset, 0)
+        buffer = os.pread(fd, size, offset)
+        if len(buffer) == size or len(buffer) == 0:
+            return buffer
+        # Short read; keep reading until EOF or the request is filled
+        parts = [buffer]
+        read = len(buffer)
+        while read < size:
+            part = os.pread(fd, size - read, offset + read)
+            if len(part) == 0:
+                break
+            parts.append(part)
+            read += len(part)
+        return b"".join(parts)
+
+    def readinto(self, buffer: memoryview, offset: int) -> int:
+        """
+        Read bytes from the handle at the given offset into the buffer.
+
+        :param buffer: The buffer to fill.
+        :type buffer: memoryview
+
+        :param offset: The absolute offset to read from.
+        :type offset: int
+
+        :rtype: int
+        :returns: The number of bytes read; may be less than the buffer's size if the end of the handle was reached.
+        """
+        if self._mapped is not None:
+            return self._mapped.readinto_at(buffer, offset)
+        fd = self._read_fd
+        if fd is None:
+            self.handle.seek(offset)
+            return _readinto(self.handle, buffer)
+
+        self._check_open()
+        if self._flush_before_read:
+            self.handle.flush()
+        read = 0
+        while read < len(buffer):
+            if _HAS_PREADV:
+                part = os.preadv(fd, [buffer[read:]], offset + read)
+            else:
+                data = os.pread(fd, len(buffer) - read, offset + read)
+                part = len(data)
+                buffer[read : read + part] = data
+            if part == 0:
+                break
+            read += part
+        return read
+
+    def write(self, data: Union[bytes, Buffer], offset: int) -> int:
+        """
+        Write bytes to the handle at the given offset.
+
+        :param data: The buffer to write.
+        :type data: Union[bytes, Buffer]
+
+        :param offset: The absolute offset to write to.
+        :type offset: int
+
+        :rtype: int
+        :returns: The number of bytes written.
+        """
+        fd = self._write_fd
+        if fd is None:
+            self.handle.seek(offset)
+            return self.handle.write(data)
+
+        self._check_open()
+        view = memoryview(data).cast("B")
+        written = 0
+        while written < len(view):
+            written += os.pwrite(fd, view[written:], offset + written)
+        return written
+
+    def writev(self, buffers: List[bytes], offset: int) -> int:
+        """
+        Write several buffers to the handle, one after another, starting at the given offset.
+
+        :param buffers: The buffers to write.
+        :type buffers: List[bytes]
+
+        :param offset: The absolute offset to write the first buffer to.
+        :type offset: int
+
+        :rtype: int
+        :returns: The number of bytes written.
+        """
+        fd = self._write_fd
+        if fd is None or not _HAS_PWRITEV:
+            return self.write(b"".join(buffers), offset)
+
+        self._check_open()
+        written = 0
+        for batch_start in range(0, len(buffers), _IOV_MAX):
+            batch = buffers[batch_start : batch_start + _IOV_MAX]
+            size = sum(len(buffer) for buffer in batch)
+            batch_written = os.pwritev(fd, batch, offset + written)
+            if batch_written < size:  # short write; finish the remainder
+                remainder = b"".join(batch)[batch_written:]
+                batch_written += self.write(remainder, offset + written + batch_written)
+            written += batch_written
+        return written
+
+
+class BinaryWindow(BinaryWrapper):  # pylint: disable=too-many-instance-attributes
     """
     A BinaryIO which only exposes a 'slice' of the stream
 
     Maintains an internal pointer to the current position of the window, ignoring the parent stream's current position
+
+    If the parent stream has a usable file descriptor, reads/writes are positional (pread/pwrite)
+    and the parent stream's pointer is never moved; allowing windows sharing a parent to be read from multiple threads.
+    Otherwise, the parent stream is seeked for every read/write, and its pointer is left after the last one.
+    Callers should not rely on the parent stream's position after using the window.
+
+    A window over another window is flattened into a window over the root stream,
+    so the cost of a read does not depend on how deeply windows are nested.
     """
 
     def __init__(  # pylint: disable=R0917
@@ -259,9 +789,51 @@ class BinaryWindow(BinaryWrapper):
         name: Optional[str] = None,
     ):
         super().__init__(parent, close_parent, name=name)
+        self._parent = self._handle
+        handle: BinaryIO = self._handle
+        owns_handle = close_parent
+        # Only flatten exact types; subclasses may transform the data they expose
+        while isinstance(handle, BinaryWrapper) and type(handle) in (
+            BinaryWindow,
+            BinaryWrapper,
+        ):
+            if self._name is None:
+                self._name = handle.name
+            if isinstance(handle, BinaryWindow):
+                # Clamp to the parent's bounds; the parent would have clamped reads/writes past its end
+                size = min(size, max(handle._size - start, 0))
+                start += handle._start
+            owns_handle = owns_handle and handle._close_parent
+            handle = handle._handle
+        self._handle = handle
+        self._owns_handle = owns_handle
         self._now = 0
-        self._start = start
-        self._size = size
+        self._start: int = start
+        self._size: int = size
+        self._io_cache: Optional[_PositionalIO] = None
+
+    def close(self) -> None:
+        """
+        Closes this object. The parent stream is also closed if `close_parent` was True in `__init__`.
+        """
+        if self._close_parent:
+            self._parent.close()
+        self._closed = True
+
+    @property
+    def closed(self) -> bool:
+        """
+        Whether this stream is closed.
+
+        If the parent stream is already closed, this will return True, even if `closed` was not called.
+        """
+        return self._parent.closed or self._closed
+
+    @property
+    def _io(self) -> _PositionalIO:
+        if self._io_cache is None:
+            self._io_cache = _PositionalIO(self._handle)
+        return self._io_cache
 
     @property
     def _end(self) -> int:
@@ -274,12 +846,6 @@ class BinaryWindow(BinaryWrapper):
     def tell(self) -> int:
         return self._now
 
-    @contextmanager
-    def __rw_ctx(self) -> Generator[None, None, None]:
-        self.seek(self._now)
-        yield
-        self._now = super().tell() - self._start
-
     def seek(self, __offset: int, __whence: int = 0) -> int:
         if __whence == os.SEEK_SET:
             new_now = __offset
@@ -292,7 +858,8 @@ class BinaryWindow(BinaryWrapper):
 
         if new_now < 0:  # or new_now > self._size # Allow seek past end of file?
             raise RelicToolError("Invalid Seek: seeking past start of stream!")
-        super().seek(self._start + new_now)
+        if not self._io.positional:  # positional IO ignores the parent's pointer
+            super().seek(self._start + new_now)
         self._now = new_now
         return self._now
 
@@ -304,8 +871,31 @@ class BinaryWindow(BinaryWrapper):
         elif __n > remaining:  # Clamp
             __n = remaining
 
-        with self.__rw_ctx():
-            return super().read(__n)
+        if self._io.positional:
+            buffer = self._io.read(self._start + self._now, __n)
+            self._now += len(buffer)
+            return buffer
+
+        self._seek_handle(self._start + self._now)
+        buffer = super().read(__n)
+        self._now += len(buffer)
+        return buffer
+
+    def readinto(self, __buffer: Buffer) -> int:
+        view = memoryview(__buffer).cast("B")[: self._remaining]
+
+        if self._io.positional:
+            read = self._io.readinto(view, self._start + self._now)
+            self._now += read
+            return read
+
+        self._seek_handle(self._start + self._now)
+        read = super().readinto(view)
+        self._now += read
+        return read
+
+    def readinto1(self, __buffer: Buffer) -> int:
+        return self.readinto(__buffer)
 
     def readline(self, __limit: int = ...) -> bytes:
         raise NotImplementedError
@@ -321,8 +911,15 @@ class BinaryWindow(BinaryWrapper):
                 f"Cannot write {len(__s)} bytes, only {remaining} bytes remaining!"
             )
 
-        with self.__rw_ctx():
-            return super().write(__s)
+        if self._io.positional:
+            written = self._io.write(__s, self._start + self._now)
+            self._now += written
+            return written
+
+        self._seek_handle(self._start + self._now)
+        written = super().write(__s)
+        self._now += written
+        return written
 
     def writelines(self, __lines: Iterable[Union[bytes, Buffer]]) -> None:
         raise NotImplementedError
@@ -361,6 +958,93 @@ class _CStringOps:
         buffer = self.pack(value, encoding=encoding, size=size, padding=padding)
         return self._serializer.write_bytes(buffer, offset, size)
 
+    @staticmethod
+    def terminator(encoding: str) -> bytes:
+        """
+        Get the null terminator of an encoding (e.g. 2 bytes for UTF-16), excluding any byte order mark.
+        """
+        width = len("\0".encode(encoding)) - len("".encode(encoding))
+        return b"\0" * width
+
+    def read_terminated(
+        self,
+        offset: int,
+        *,
+        encoding: str,
+        max_len: Optional[int] = None,
+    ) -> Tuple[str, int]:
+        """
+        Read a null-terminated C-String of unknown size.
+
+        The terminator is found by scanning the stream in growing blocks (or searching the map directly,
+        if the stream is a MappedSource); avoiding both per-byte reads and over-reading a guessed size.
+
+        :param offset: The offset of the string.
+        :type offset: int
+
+        :param encoding: The encoding of the string.
+        :type encoding: str
+
+        :param max_len: The maximum size of the string in bytes, excluding the terminator. By default, unlimited.
+        :type max_len: Optional[int], optional
+
+        :raises RelicToolError: No terminator was found within max_len bytes or before the end of the stream.
+
+        :rtype: Tuple[str, int]
+        :returns: The decoded string, and the number of bytes consumed (including the terminator).
+        """
+        terminator = self.terminator(encoding)
+        width = len(terminator)
+        limit = max_len + width if max_len is not None else None
+
+        stream = self._serializer.stream
+        if isinstance(stream, MappedSource) and not self._serializer.has_pending_writes:
+            end = -1 if limit is None else offset + limit
+            index = stream.find(terminator, offset, end)
+            while index != -1 and (index - offset) % width != 0:  # misaligned match
+                index = stream.find(terminator, index + 1, end)
+            if index == -1:
+                raise RelicToolError(
+                    f"Unterminated C-String @{offset}; no '{encoding}' terminator found"
+                )
+            return (
+                stream.read_at(offset, index - offset).decode(encoding),
+                index - offset + width,
+            )
+
+        buffer = bytearray()
+        search = 0
+        block = 64
+        while True:
+            size = block if limit is None else min(block, limit - len(buffer))
+            chunk = self._serializer.read_bytes(
+                offset + len(buffer), size, exact_size=False
+            )
+            buffer += chunk
+            index = buffer.find(terminator, search)
+            while index != -1 and index % width != 0:  # misaligned match
+                index = buffer.find(terminator, index + 1)
+            if index != -1:
+                return buffer[:index].decode(encoding), index + width
+            if len(chunk) < size or (limit is not None and len(buffer) >= limit):
+                raise RelicToolError(
+                    f"Unterminated C-String @{offset}; no '{encoding}' terminator found"
+                    + (f" within {max_len} bytes" if max_len is not None else "")
+                )
+            # resume from the last whole character
+            search = len(buffer) - len(buffer) % width
+            block = min(block * 2, 64 * _KIBIBYTE)
+
+    def write_terminated(self, value: str, offset: int, *, encoding: str) -> int:
+        """
+        Write a null-terminated C-String.
+
+        :rtype: int
+        :returns: The number of bytes written (including the terminator).
+        """
+        buffer = self.pack(value, encoding=encoding) + self.terminator(encoding)
+        return self._serializer.write_bytes(buffer, offset)
+
     @classmethod
     def unpack(cls, b: bytes, encoding: str, padding: Optional[str] = None) -> str:
         value: str = b.decode(encoding)
@@ -460,28 +1144,80 @@ class _IntOps:
         return v.to_bytes(length, byteorder, signed=signed)
 
 
+_STRUCT_FORMATS = {
+    "u8": "B",
+    "i8": "b",
+    "u16": "H",
+    "i16": "h",
+    "u32": "I",
+    "i32": "i",
+    "u64": "Q",
+    "i64": "q",
+    "f32": "f",
+    "f64": "d",
+}
+_BYTEORDER_PREFIXES = {"little": "<", "big": ">"}
+
+# Precompiled codecs, keyed by (type, byteorder); e.g. ("u32", "little")
+_CODECS: Dict[Tuple[str, str], struct.Struct] = {
+    (name, byteorder): struct.Struct(prefix + fmt)
+    for name, fmt in _STRUCT_FORMATS.items()
+    for byteorder, prefix in _BYTEORDER_PREFIXES.items()
+}
+
+
+def _array_typecode(name: str) -> str:
+    """
+    Get the array typecode matching a codec's type; array's integer itemsizes vary by platform.
+    """
+    size = _CODECS[name, "little"].size
+    if name[0] == "f":
+        candidates = "fd"
+    else:
+        candidates = "bhilq" if name[0] == "i" else "BHILQ"
+    for typecode in candidates:
+        if array.array(typecode).itemsize == size:
+            return typecode
+    raise RelicToolError(f"No array typecode is {size} bytes on this platform")
+
+
+_ARRAY_TYPECODES = {name: _array_typecode(name) for name in _STRUCT_FORMATS}
+
+
 class _SizedIntOps(_IntOps):
     """
     Provides utility functions for serializing Sized & Signed Integers
 
     Provides more validation over input/output then _IntOps
+
+    Sizes with a precompiled codec (1, 2, 4 & 8 bytes) are packed/unpacked via struct,
+    other sizes fall back to int.from_bytes/int.to_bytes
     """
 
     def __init__(self, serializer: BinarySerializer, size: int, signed: bool):
         super().__init__(serializer)
         self._size = size
         self._signed = signed
+        name = f"{'i' if signed else 'u'}{size * 8}"
+        self._codecs: Optional[Dict[str, struct.Struct]] = (
+            {byteorder: _CODECS[name, byteorder] for byteorder in _BYTEORDER_PREFIXES}
+            if name in _STRUCT_FORMATS
+            else None
+        )
 
     def _validate_args(
         self, size: Optional[int], signed: Optional[bool] = None
     ) -> None:
+        if size is None and signed is None:  # fast path; nothing to validate
+            return
         received_size = size if size is not None else self._size
         received_signed = signed if signed is not None else self._signed
+        if received_size == self._size and received_signed == self._signed:
+            return
 
         expected = f"{'' if self._signed else 'U'}Int-{self._size * 8}"
         received = f"{'' if received_signed else 'U'}Int-{received_size * 8}"
-        if expected != received:
-            raise MismatchError("Int Type", received, expected)
+        raise MismatchError("Int Type", received, expected)
 
     def read(
         self,
@@ -493,7 +1229,7 @@ class _SizedIntOps(_IntOps):
     ) -> int:
         self._validate_args(size, signed)
         buffer = self._serializer.read_bytes(offset, self._size, exact_size=True)
-        result = self.unpack(buffer, byteorder=byteorder, signed=self._signed)
+        result = self.unpack(buffer, byteorder=byteorder)
         return result
 
     def write(
@@ -535,6 +1271,12 @@ class _SizedIntOps(_IntOps):
         signed: Optional[bool] = None,
     ) -> int:
         self._validate_args(length, signed)
+        if self._codecs is not None:
+            try:
+                value: int = self._codecs[byteorder].unpack(data)[0]
+                return value
+            except struct.error:  # e.g. a short buffer; keep int.from_bytes' behaviour
+                pass
         return int.from_bytes(data, byteorder=byteorder, signed=self._signed)
 
     def pack(
@@ -565,32 +1307,665 @@ class _SizedIntOps(_IntOps):
         """
 
         self._validate_args(length, signed)
+        if self._codecs is not None:
+            try:
+                return self._codecs[byteorder].pack(value)
+            except struct.error:
+                # out of range; let int.to_bytes raise its OverflowError
+                pass
         return value.to_bytes(self._size, byteorder=byteorder, signed=self._signed)
 
 
-class BinarySerializer(BinaryProxy):  # pylint: disable= too-many-instance-attributes
+class _FloatOps:
     """
-    A utility object that allows serializing/deserializing most data types
-
-    Acts as a BinaryProxy which points to the parent object it reads from/writes to
+    Provides utility functions for serializing IEEE 754 floats (single/double precision)
     """
 
-    def __init__(
+    def __init__(self, serializer: BinarySerializer, size: int):
+        name = f"f{size * 8}"
+        if name not in _STRUCT_FORMATS:
+            raise RelicToolError(f"Unsupported float size '{size}'; expected 4 or 8")
+        self._serializer = serializer
+        self._size = size
+        self._codecs = {
+            byteorder: _CODECS[name, byteorder] for byteorder in _BYTEORDER_PREFIXES
+        }
+
+    def read(
+        self, offset: int, *, byteorder: Literal["little", "big"] = "little"
+    ) -> float:
+        buffer = self._serializer.read_bytes(offset, self._size, exact_size=True)
+        return self.unpack(buffer, byteorder=byteorder)
+
+    def write(
         self,
-        parent: Union[BinaryIO, BinaryProxy],
-        close_parent: bool = False,
-        cacheable: Optional[bool] = None,
-    ):
-        self._proxy = parent
-        self._close = close_parent
-        if cacheable is None:
-            handle = get_proxy(parent)
-            cacheable = handle.readable() and not handle.writable()
+        value: float,
+        offset: int,
+        *,
+        byteorder: Literal["little", "big"] = "little",
+    ) -> int:
+        buffer = self.pack(value, byteorder=byteorder)
+        return self._serializer.write_bytes(buffer, offset, self._size)
 
-        self._cache: Optional[Dict[Tuple[int, int], bytes]] = {} if cacheable else None
+    def read_le(self, offset: int) -> float:
+        """Read little endian float"""
+        return self.read(offset=offset, byteorder="little")
 
-        self.c_string = _CStringOps(self)
-        self.int = _IntOps(self)
+    def write_le(self, value: float, offset: int) -> int:
+        """Write little endian float"""
+        return self.write(value=value, offset=offset, byteorder="little")
+
+    def read_be(self, offset: int) -> float:
+        """Read big endian float"""
+        return self.read(offset=offset, byteorder="big")
+
+    def write_be(self, value: float, offset: int) -> int:
+        """Write big endian float"""
+        return self.write(value=value, offset=offset, byteorder="big")
+
+    def unpack(
+        self, data: bytes, byteorder: Literal["little", "big"] = "little"
+    ) -> float:
+        if len(data) != self._size:
+            raise MismatchError("Buffer Size", len(data), self._size)
+        value: float = self._codecs[byteorder].unpack(data)[0]
+        return value
+
+    def pack(
+        self, value: float, byteorder: Literal["little", "big"] = "little"
+    ) -> bytes:
+        return self._codecs[byteorder].pack(value)
+
+
+_K = TypeVar("_K", bound=Hashable)
+
+
+@dataclass
+class CacheStats:
+    """
+    A snapshot of a ByteCache's counters.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    resident_bytes: int = 0
+    max_bytes: Optional[int] = None
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        The fraction of lookups which were served from the cache; 0 if the cache has not been used.
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0.0
+
+
+class ByteCache(Generic[_K]):
+    """
+    A thread-safe LRU cache of byte buffers, bounded by the total size of the buffers it holds.
+
+    :param max_bytes: The byte budget of the cache; when exceeded, the least recently used buffers are evicted.
+        If None, the cache never evicts.
+    :type max_bytes: Optional[int], optional
+    """
+
+    def __init__(self, max_bytes: Optional[int] = _DEFAULT_CACHE_SIZE):
+        if max_bytes is not None and max_bytes < 0:
+            raise RelicToolError(f"Cache budget cannot be negative; got '{max_bytes}'")
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[_K, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = CacheStats(max_bytes=max_bytes)
+
+    @property
+    def stats(self) -> CacheStats:
+        """
+        A snapshot of the cache's hit/miss/eviction/resident-bytes counters.
+        """
+        with self._lock:
+            return replace(self._stats)
+
+    def __contains__(self, key: _K) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: _K) -> Optional[bytes]:
+        """
+        Get a buffer from the cache, marking it as recently used.
+
+        :rtype: Optional[bytes]
+        :returns: The cached buffer, or None if the key is not cached.
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self._stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return value
+
+    def peek(self, key: _K) -> Optional[bytes]:
+        """
+        Get a buffer from the cache without marking it as recently used; does not affect the counters.
+
+        :rtype: Optional[bytes]
+        :returns: The cached buffer, or None if the key is not cached.
+        """
+        with self._lock:
+            return self._entries.get(key)
+
+    def put(self, key: _K, value: bytes) -> None:
+        """
+        Add a buffer to the cache, evicting the least recently used buffers if the budget is exceeded.
+
+        Buffers larger than the budget are not cached.
+        """
+        size = len(value)
+        with self._lock:
+            self._discard(key)
+            if self._max_bytes is not None and size > self._max_bytes:
+                return
+            self._entries[key] = value
+            self._added(key, value)
+            self._stats.resident_bytes += size
+            self._evict()
+
+    def update(self, key: _K, value: bytes) -> None:
+        """
+        Replace a cached buffer without marking it as recently used; does nothing if the key is not cached.
+        """
+        with self._lock:
+            previous = self._entries.get(key)
+            if previous is None:
+                return
+            self._entries[key] = value
+            self._added(key, value)
+            self._stats.resident_bytes += len(value) - len(previous)
+            self._evict()
+
+    def items(self) -> List[Tuple[_K, bytes]]:
+        """
+        A snapshot of the cached buffers, from least to most recently used; does not affect the counters.
+        """
+        with self._lock:
+            return list(self._entries.items())
+
+    def _evict(self) -> None:
+        if self._max_bytes is None:
+            return
+        while self._stats.resident_bytes > self._max_bytes:
+            key, evicted = self._entries.popitem(last=False)
+            self._removed(key)
+            self._stats.resident_bytes -= len(evicted)
+            self._stats.evictions += 1
+
+    def discard(self, key: _K) -> None:
+        """
+        Remove a buffer from the cache, if it is cached.
+        """
+        with self._lock:
+            self._discard(key)
+
+    def _discard(self, key: _K) -> None:
+        value = self._entries.pop(key, None)
+        if value is not None:
+            self._removed(key)
+            self._stats.resident_bytes -= len(value)
+
+    def _added(self, key: _K, value: bytes) -> None:
+        """Called (with the lock held) after a buffer is added or replaced; lets subclasses index their keys."""
+
+    def _removed(self, key: _K) -> None:
+        """Called (with the lock held) after a buffer is removed; lets subclasses index their keys."""
+
+    def clear(self) -> None:
+        """
+        Remove all buffers from the cache; counters are preserved.
+        """
+        with self._lock:
+            for key in list(self._entries):
+                self._removed(key)
+            self._entries.clear()
+            self._stats.resident_bytes = 0
+
+
+class _RangeCache(ByteCache[Tuple[int, int]]):
+    """
+    A cache of exact (offset, size) reads, which keeps its keys sorted by offset;
+    so the reads a write overlaps can be found without scanning the whole cache.
+
+    The sorted keys are only built on the first lookup of overlapping reads (i.e. the first write);
+    read-only streams never pay for keeping them sorted.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = _DEFAULT_CACHE_SIZE):
+        super().__init__(max_bytes)
+        self._keys: Optional[List[Tuple[int, int]]] = None
+        # reads cut short by the end of the stream
+        self._short: Dict[Tuple[int, int], None] = {}
+        self._max_size = 0
+
+    def _added(self, key: Tuple[int, int], value: bytes) -> None:
+        self._max_size = max(self._max_size, key[1])
+        keys = self._keys
+        if keys is not None:
+            index = bisect.bisect_left(keys, key)
+            if index == len(keys) or keys[index] != key:
+                keys.insert(index, key)
+        if len(value) < key[1]:
+            self._short[key] = None
+        else:
+            self._short.pop(key, None)
+
+    def _removed(self, key: Tuple[int, int]) -> None:
+        keys = self._keys
+        if keys is not None:  # only cached keys are removed; so the key is always found
+            del keys[bisect.bisect_left(keys, key)]
+        self._short.pop(key, None)
+
+    def overlapping(self, offset: int, end: int) -> List[Tuple[Tuple[int, int], bytes]]:
+        """
+        Get the cached reads which overlap a range, and every read cut short by the end of the stream.
+
+        Does not affect the counters.
+        """
+        with self._lock:
+            keys = self._keys
+            if keys is None:
+                keys = self._keys = sorted(self._entries)
+            # No read is longer than _max_size; so reads starting before offset - _max_size cannot overlap
+            lo = bisect.bisect_right(keys, (offset - self._max_size, sys.maxsize))
+            hi = bisect.bisect_left(keys, (end,))
+            found = {key: None for key in keys[lo:hi] if key[0] + key[1] > offset}
+            found.update(self._short)
+            return [(key, self._entries[key]) for key in found]
+
+
+class _BlockCache:
+    """
+    Caches a stream as aligned blocks,
+    allowing any range contained in (or spanning) cached blocks to be served from memory.
+    """
+
+    def __init__(self, block_size: int, max_bytes: Optional[int]):
+        if block_size <= 0:
+            raise RelicToolError(f"Block size must be positive; got '{block_size}'")
+        self.block_size = block_size
+        self.blocks: ByteCache[int] = ByteCache(max_bytes)
+        # the index of the last (partial) block, when it was cached
+        self._eof: Optional[int] = None
+
+    def align(self, start: int, end: int) -> Tuple[int, int]:
+        """
+        Expand a range to the nearest block boundaries.
+        """
+        return (
+            start - start % self.block_size,
+            math.ceil(end / self.block_size) * self.block_size,
+        )
+
+    def lookup(self, offset: int, size: int) -> Optional[bytes]:
+        """
+        Get a range from the cache, if every block it touches is cached.
+        """
+        block_size = self.block_size
+        first = offset // block_size
+        last = (offset + size - 1) // block_size
+        blocks = []
+        for index in range(first, last + 1):
+            block = self.blocks.get(index)
+            if block is None:
+                return None
+            blocks.append(block)
+            if len(block) < block_size:  # end of stream
+                break
+        start = offset - first * block_size
+        if len(blocks) == 1:
+            return blocks[0][start : start + size]
+        return b"".join(blocks)[start : start + size]
+
+    def store(self, offset: int, data: Buffer) -> None:
+        """
+        Split a block-aligned buffer into blocks and add them to the cache.
+        """
+        block_size = self.block_size
+        first = offset // block_size
+        with memoryview(data) as view:
+            for index in range(math.ceil(len(view) / block_size)):
+                block = bytes(view[index * block_size : (index + 1) * block_size])
+                self.blocks.put(first + index, block)
+                if len(block) < block_size:
+                    self._eof = first + index
+
+    def patch(self, offset: int, data: Buffer) -> None:
+        """
+        Apply a write to every cached block it overlaps.
+
+        Blocks at the end of the stream which the write extends past are discarded instead.
+        """
+        block_size = self.block_size
+        with memoryview(data) as view:
+            write_end = offset + len(view)
+            if write_end == offset:
+                return
+            indices = list(
+                range(offset // block_size, (write_end - 1) // block_size + 1)
+            )
+            if len(indices) > len(self.blocks):
+                indices = [index for index, _ in self.blocks.items()]
+            elif self._eof is not None and self._eof < indices[0]:
+                # the write may extend the last (partial) block
+                indices.append(self._eof)
+            for index in indices:
+                block = self.blocks.peek(index)
+                if block is None:
+                    continue
+                block_start = index * block_size
+                block_end = block_start + len(block)
+                if len(block) < block_size and write_end > block_end:
+                    if offset > block_end:  # would leave a hole in the block
+                        self.blocks.discard(index)
+                        continue
+                elif offset >= block_end or write_end <= block_start:
+                    continue
+                start = max(offset, block_start)
+                end = min(write_end, block_start + block_size)
+                patched = (
+                    block[: start - block_start]
+                    + view[start - offset : end - offset]
+                    + block[end - block_start :]
+                )
+                self.blocks.update(index, patched)
+
+    def read(self, io_: _PositionalIO, offset: int, size: int) -> bytes:
+        """
+        Read a range through the cache; missing blocks are fetched together with a single read.
+        """
+        cached = self.lookup(offset, size)
+        if cached is not None:
+            return cached
+        start, end = self.align(offset, offset + size)
+        data = io_.read(start, end - start)
+        self.store(start, data)
+        return data[offset - start : offset - start + size]
+
+
+class _ReadAhead:
+    """
+    Buffers a window of the stream around the last missed read, serving nearby reads from memory.
+
+    The window doubles while misses are sequential (up to max_size) and resets on random access;
+    reads at least as large as the window bypass the buffer (streaming), so linear scans do not thrash it.
+    """
+
+    def __init__(self, max_size: int, min_size: int = 4 * _KIBIBYTE):
+        if max_size <= 0:
+            raise RelicToolError(f"Read-ahead size must be positive; got '{max_size}'")
+        self.min_size = min(min_size, max_size)
+        self.max_size = max_size
+        self.window = self.min_size
+        # (start, data, hit end of stream)
+        self._buffer: Tuple[int, bytes, bool] = (0, b"", False)
+        self._last_end: Optional[int] = None
+
+    def read(self, io_: _PositionalIO, offset: int, size: int) -> bytes:
+        """
+        Read a range through the buffer, refilling it on a miss.
+        """
+        if size < 0:
+            return io_.read(offset, size)
+
+        end = offset + size
+        start, buffer, eof = self._buffer
+        if start <= offset and (end <= start + len(buffer) or eof):
+            self._last_end = end
+            return buffer[offset - start : end - start]
+
+        sequential = offset == self._last_end
+        self.window = (
+            min(self.window * 2, self.max_size) if sequential else self.min_size
+        )
+        self._last_end = end
+        if size >= self.window:  # streaming; buffering would only add a copy
+            return io_.read(offset, size)
+
+        # also cover reads just before the request
+        fetch_start = offset - offset % self.min_size
+        fetch_size = max(self.window, end - fetch_start)
+        data = io_.read(fetch_start, fetch_size)
+        self._buffer = (fetch_start, data, len(data) < fetch_size)
+        return data[offset - fetch_start : end - fetch_start]
+
+    def patch(self, offset: int, data: bytes) -> None:
+        """
+        Keep the buffer coherent with a write.
+        """
+        start, buffer, eof = self._buffer
+        end = start + len(buffer)
+        write_end = offset + len(data)
+        if eof and write_end > end:  # the write moves the end of the stream
+            self.clear()
+        elif offset < end and write_end > start:
+            lo, hi = max(offset, start), min(write_end, end)
+            patched = (
+                buffer[: lo - start]
+                + data[lo - offset : hi - offset]
+                + buffer[hi - start :]
+            )
+            self._buffer = (start, patched, eof)
+
+    def clear(self) -> None:
+        """
+        Drop the buffered window.
+        """
+        self._buffer = (0, b"", False)
+        self._last_end = None
+
+
+class _PendingWrite:
+    """
+    A contiguous run of pending writes; adjacent writes are appended as separate chunks to avoid copying.
+    """
+
+    def __init__(self, start: int, data: bytes):
+        self.start = start
+        self.chunks = [data]
+        self.size = len(data)
+
+    @property
+    def end(self) -> int:
+        """
+        The offset immediately after the last pending byte.
+        """
+        return self.start + self.size
+
+    def data(self) -> bytes:
+        """
+        The pending bytes as a single buffer.
+        """
+        if len(self.chunks) > 1:
+            self.chunks = [b"".join(self.chunks)]
+        return self.chunks[0]
+
+
+class _WriteBehind:
+    """
+    Collects pending (offset, data) writes, merging contiguous and overlapping writes.
+    """
+
+    def __init__(self, max_bytes: int):
+        if max_bytes < 0:
+            raise RelicToolError(
+                f"Write-behind budget cannot be negative; got '{max_bytes}'"
+            )
+        self.max_bytes = max_bytes
+        self.pending = 0
+        self._writes: List[_PendingWrite] = []  # sorted & disjoint
+        self._starts: List[int] = []
+
+    def add(self, offset: int, data: bytes) -> None:
+        """
+        Add a write, merging it with any pending writes it touches.
+        """
+        if len(data) == 0:
+            return
+        end = offset + len(data)
+        first = bisect.bisect_right(self._starts, offset) - 1
+        if first < 0 or self._writes[first].end < offset:
+            first += 1
+        last = first
+        while last < len(self._writes) and self._writes[last].start <= end:
+            last += 1
+
+        touched = self._writes[first:last]
+        replaced = sum(write.size for write in touched)
+        if not touched:
+            merged = _PendingWrite(offset, data)
+        elif len(touched) == 1 and touched[0].end == offset:  # sequential append
+            merged = touched[0]
+            merged.chunks.append(data)
+            merged.size += len(data)
+        else:
+            start = min(offset, touched[0].start)
+            buffer = bytearray(max(end, touched[-1].end) - start)
+            for write in touched:
+                buffer[write.start - start : write.end - start] = write.data()
+            buffer[offset - start : end - start] = data
+            merged = _PendingWrite(start, bytes(buffer))
+
+        self.pending += merged.size - replaced
+        self._writes[first:last] = [merged]
+        self._starts[first:last] = [merged.start]
+
+    def overlay(self, offset: int, size: int, data: bytes) -> bytes:
+        """
+        Apply pending writes to bytes read from the underlying stream.
+
+        Reads cut short by the end of the stream are extended to the furthest pending write,
+        zero-filling any gap; matching what the stream will hold once the writes are flushed.
+        """
+        end = offset + size
+        first = bisect.bisect_right(self._starts, offset) - 1
+        first = max(first, 0)
+        result: Optional[bytearray] = None
+        if len(data) < size and len(self._writes) > 0:
+            extended = min(end, self._writes[-1].end) - offset
+            if extended > len(data):
+                result = bytearray(data)
+                result.extend(bytes(extended - len(data)))
+        for write in self._writes[first:]:
+            if write.start >= end:
+                break
+            if write.end <= offset:
+                continue
+            if result is None:
+                result = bytearray(data)
+            # The result already extends to the furthest pending write in range
+            lo, hi = max(offset, write.start), min(end, write.end)
+            result[lo - offset : hi - offset] = write.data()[
+                lo - write.start : hi - write.start
+            ]
+        return data if result is None else bytes(result)
+
+    def drain(self) -> List[Tuple[int, List[bytes]]]:
+        """
+        Remove all pending writes, returned in offset order as (offset, chunks) pairs.
+        """
+        drained = [(write.start, write.chunks) for write in self._writes]
+        self._writes = []
+        self._starts = []
+        self.pending = 0
+        return drained
+
+
+class BinarySerializer(BinaryProxy):  # pylint: disable= too-many-instance-attributes
+    """
+    A utility object that allows serializing/deserializing most data types
+
+    Acts as a BinaryProxy which points to the parent object it reads from/writes to
+
+    If the underlying stream has a usable file descriptor, reads/writes are positional (pread/pwrite)
+    and do not move the stream's pointer; allowing the serializer to be read from multiple threads.
+    Otherwise, the stream is seeked for every read/write, and its pointer is left after the last one.
+    Callers should not rely on the stream's position after using the serializer.
+
+    :param parent: The stream to read from/write to.
+    :type parent: Union[BinaryIO, BinaryProxy]
+
+    :param close_parent: Whether the parent should be closed when the serializer is closed. By default, False.
+    :type close_parent: bool, optional
+
+    :param cacheable: Whether reads should be cached;
+        if None, reads are cached when the stream is readable but not writable.
+        Caching writable streams is safe as long as writes go through the serializer;
+        write_bytes updates every cached range it overlaps (write-through).
+    :type cacheable: Optional[bool], optional
+
+    :param cache_size: The byte budget of the read cache; least recently used reads are evicted once exceeded.
+        If None, the cache is unbounded. By default, 64 MiB.
+    :type cache_size: Optional[int], optional
+
+    :param block_size: If specified, reads are cached as aligned blocks of this size instead of by (offset, size);
+        any range contained in (or overlapping) cached blocks is served from memory.
+        By default, None.
+    :type block_size: Optional[int], optional
+
+    :param write_behind: If specified, writes are held in memory and coalesced until flush()/close() is called,
+        or more than this many bytes are pending. Reads always see pending writes.
+        By default, None (writes are issued immediately).
+    :type write_behind: Optional[int], optional
+
+    :param read_ahead: If specified, reads which miss the read cache fetch a larger window of the stream
+        (growing up to this many bytes while reads are sequential) and serve nearby reads from it;
+        large sequential reads bypass the window. Not used when `block_size` is specified.
+        By default, None.
+    :type read_ahead: Optional[int], optional
+    """
+
+    def __init__(  # pylint: disable=R0913, R0917
+        self,
+        parent: Union[BinaryIO, BinaryProxy],
+        close_parent: bool = False,
+        cacheable: Optional[bool] = None,
+        cache_size: Optional[int] = _DEFAULT_CACHE_SIZE,
+        block_size: Optional[int] = None,
+        write_behind: Optional[int] = None,
+        read_ahead: Optional[int] = None,
+    ):
+        self._proxy = parent
+        self._close = close_parent
+        if cacheable is None:
+            handle = get_proxy(parent)
+            # Mapped sources are already served from memory
+            cacheable = (
+                handle.readable()
+                and not handle.writable()
+                and not isinstance(handle, MappedSource)
+            )
+
+        self._cache: Optional[_RangeCache] = None
+        self._block_cache: Optional[_BlockCache] = None
+        if cacheable and block_size is None:
+            self._cache = _RangeCache(cache_size)
+        elif cacheable and block_size is not None:
+            self._block_cache = _BlockCache(block_size, cache_size)
+        self._io_cache: Optional[_PositionalIO] = None
+        self._write_behind = (
+            _WriteBehind(write_behind) if write_behind is not None else None
+        )
+        self._read_ahead = _ReadAhead(read_ahead) if read_ahead is not None else None
+        # incremented on every write; lets cursors detect stale buffers
+        self._generation = 0
+
+        self.c_string = _CStringOps(self)
+        self.int = _IntOps(self)
+
+        self.uint8 = _SizedIntOps(self, 1, signed=False)
+        self.int8 = _SizedIntOps(self, 1, signed=True)
 
         self.uint16 = _SizedIntOps(self, 2, signed=False)
         self.int16 = _SizedIntOps(self, 2, signed=True)
@@ -598,6 +1973,18 @@ class BinarySerializer(BinaryProxy):  # pylint: disable= too-many-instance-attri
         self.uint32 = _SizedIntOps(self, 4, signed=False)
         self.int32 = _SizedIntOps(self, 4, signed=True)
 
+        self.uint64 = _SizedIntOps(self, 8, signed=False)
+        self.int64 = _SizedIntOps(self, 8, signed=True)
+
+        self.float32 = _FloatOps(self, 4)
+        self.float64 = _FloatOps(self, 8)
+
+    codecs: Mapping[Tuple[str, str], struct.Struct] = _CODECS
+    """
+    Precompiled struct codecs, keyed by (type, byteorder);
+    types are u8/i8/u16/i16/u32/i32/u64/i64/f32/f64, byteorders are "little"/"big".
+    """
+
     def __binio_proxy__(self) -> Union[BinaryIO, BinaryProxy]:
         return self._proxy
 
@@ -608,6 +1995,43 @@ class BinarySerializer(BinaryProxy):  # pylint: disable= too-many-instance-attri
         """
         return get_proxy(self._proxy)
 
+    @property
+    def _io(self) -> _PositionalIO:
+        if self._io_cache is None:
+            self._io_cache = _PositionalIO(self.stream)
+        return self._io_cache
+
+    @property
+    def has_pending_writes(self) -> bool:
+        """
+        Whether writes are being held by the write-behind buffer, and are not yet in the underlying stream.
+        """
+        return self._write_behind is not None and self._write_behind.pending > 0
+
+    @property
+    def cache_stats(self) -> Optional[CacheStats]:
+        """
+        A snapshot of the read cache's counters, or None if reads are not cached.
+        """
+        if self._block_cache is not None:
+            return self._block_cache.blocks.stats
+        return self._cache.stats if self._cache is not None else None
+
+    def cursor(self, start: int = 0, buffer_size: int = 64 * _KIBIBYTE) -> BinaryCursor:
+        """
+        Create a cursor which decodes the stream sequentially from the given offset.
+
+        :param start: The offset the cursor starts at. By default, 0.
+        :type start: int, optional
+
+        :param buffer_size: The minimum number of bytes the cursor reads when refilling its buffer. By default, 64 KiB.
+        :type buffer_size: int, optional
+
+        :rtype: BinaryCursor
+        :returns: A cursor positioned at start.
+        """
+        return BinaryCursor(self, start, buffer_size)
+
     # Bytes
     def read_bytes(self, offset: int, size: int, *, exact_size: bool = True) -> bytes:
         """
@@ -627,21 +2051,118 @@ class BinarySerializer(BinaryProxy):  # pylint: disable= too-many-instance-attri
         :returns: The bytes read from the underlying stream
         """
 
-        def _read() -> bytes:
-            self.stream.seek(offset)
-            b = self.stream.read(size)
-            if exact_size and len(b) != size:
-                raise MismatchError("Read Mismatch", len(b), size)
-            return b
+        value = self._read(offset, size)
+        if self._write_behind is not None and self._write_behind.pending > 0:
+            value = self._write_behind.overlay(offset, size, value)
+        if exact_size and len(value) != size:
+            raise MismatchError("Read Mismatch", len(value), size)
+        return value
 
-        if self._cache is not None:
-            key = (offset, size)
-            if key in self._cache:
-                return self._cache[key]
-            value = self._cache[key] = _read()
-            return value
+    def _read(self, offset: int, size: int) -> bytes:
+        """
+        Read bytes through the read cache, ignoring pending writes.
+        """
+        if self._block_cache is not None and size > 0:
+            return self._block_cache.read(self._io, offset, size)
+        if self._cache is None:
+            return self._read_stream(offset, size)
+        key = (offset, size)
+        value = self._cache.get(key)
+        if value is None:
+            value = self._read_stream(offset, size)
+            self._cache.put(key, value)
+        return value
+
+    def _read_stream(self, offset: int, size: int) -> bytes:
+        if self._read_ahead is not None:
+            return self._read_ahead.read(self._io, offset, size)
+        return self._io.read(offset, size)
 
-        return _read()
+    def read_many(  # pylint: disable=too-many-locals, too-many-branches
+        self,
+        ranges: Iterable[Tuple[int, int]],
+        *,
+        exact_size: bool = True,
+        max_gap: int = 4 * _KIBIBYTE,
+    ) -> List[bytes]:
+        """
+        Read multiple ranges from the underlying stream with as few physical reads as possible.
+
+        Ranges are sorted by offset and merged when they are adjacent, overlapping,
+        or separated by no more than max_gap bytes; each merged range is read with a single call.
+
+        :param ranges: The (offset, size) pairs to read.
+        :type ranges: Iterable[Tuple[int, int]]
+
+        :param exact_size: If True, the number of bytes read for each range must match the range's size.
+            By default, True.
+        :type exact_size: bool, optional
+
+        :param max_gap: The largest number of unrequested bytes that may be read to merge two ranges.
+            By default, 4 KiB.
+        :type max_gap: int, optional
+
+        :raises MismatchError: exact_size was True and a range could not be fully read.
+
+        :rtype: List[bytes]
+        :returns: The bytes read for each range, in the order the ranges were given.
+        """
+        requests = list(ranges)
+        results: List[bytes] = [b""] * len(requests)
+
+        pending = []
+        for index, key in enumerate(requests):
+            if self._block_cache is not None and key[1] > 0:
+                cached = self._block_cache.lookup(*key)
+            elif self._cache is not None:
+                cached = self._cache.get(key)
+            else:
+                cached = None
+            if cached is not None:
+                results[index] = cached
+            elif key[1] > 0:
+                pending.append(index)
+        pending.sort(key=lambda i: requests[i][0])
+
+        def _read_run(run: List[int], run_start: int, run_end: int) -> None:
+            if self._block_cache is not None:
+                run_start, run_end = self._block_cache.align(run_start, run_end)
+            buffer = bytearray(run_end - run_start)
+            with memoryview(buffer) as view:
+                read = self._io.readinto(view, run_start)
+                if self._block_cache is not None:
+                    self._block_cache.store(run_start, view[:read])
+                for index in run:
+                    offset, size = requests[index]
+                    start = offset - run_start
+                    value = bytes(view[start : min(start + size, read)])
+                    if self._cache is not None:
+                        self._cache.put((offset, size), value)
+                    results[index] = value
+
+        run: List[int] = []
+        run_start = run_end = 0
+        for index in pending:
+            offset, size = requests[index]
+            if run and offset > run_end + max_gap:
+                _read_run(run, run_start, run_end)
+                run = []
+            if not run:
+                run_start, run_end = offset, offset + size
+            else:
+                run_end = max(run_end, offset + size)
+            run.append(index)
+        if run:
+            _read_run(run, run_start, run_end)
+
+        for index, (offset, size) in enumerate(requests):
+            if self._write_behind is not None and self._write_behind.pending > 0:
+                results[index] = self._write_behind.overlay(
+                    offset, size, results[index]
+                )
+            if exact_size and len(results[index]) != size:
+                raise MismatchError("Read Mismatch", len(results[index]), size)
+        return results
 
     def write_bytes(self, data: bytes, offset: int, size: Optional[int] = None) -> int:
         """
@@ -660,14 +2181,416 @@ class BinarySerializer(BinaryProxy):  # pylint: disable= too-many-instance-attri
         """
         if size is not None and len(data) != size:
             raise MismatchError("Write Mismatch", len(data), size)
-        self.stream.seek(offset)
-        return self.stream.write(data)
+        self._generation += 1
+        if self._write_behind is not None:
+            self._write_behind.add(offset, bytes(data))
+            if self._write_behind.pending > self._write_behind.max_bytes:
+                self._flush_pending()
+            return len(data)
+        written = self._io.write(data, offset)
+        self._patch_cache(offset, data[:written])
+        return written
+
+    def _flush_pending(self) -> None:
+        """
+        Write all pending writes to the underlying stream, in offset order.
+        """
+        if self._write_behind is None:
+            return
+        for start, chunks in self._write_behind.drain():
+            self._io.writev(chunks, start)
+            self._patch_cache(start, b"".join(chunks))
 
+    def flush(self) -> None:
+        """
+        Write any pending writes to the underlying stream, then flush the underlying stream.
+        """
+        self._flush_pending()
+        self.stream.flush()
+
+    def close(self) -> None:
+        """
+        Write any pending writes to the underlying stream.
+        The underlying stream is also closed if `close_parent` was True in `__init__`.
+        """
+        self._flush_pending()
+        if self._close:
+            self.stream.close()
+
+    def _patch_cache(self, offset: int, data: bytes) -> None:
+        """
+        Keep cached reads coherent with a write; overlapping ranges are updated in place,
+        cached reads cut short by the end of the stream are discarded if the write extends past them.
+        """
+        if self._block_cache is not None:
+            self._block_cache.patch(offset, data)
+        if self._read_ahead is not None:
+            self._read_ahead.patch(offset, data)
+        if self._cache is None or len(data) == 0:
+            return
+        write_end = offset + len(data)
+        for key, value in self._cache.overlapping(offset, write_end):
+            start, size = key
+            end = start + len(value)
+            if len(value) < size and write_end > end:
+                self._cache.discard(key)
+            elif offset < end and write_end > start:
+                lo, hi = max(offset, start), min(write_end, end)
+                patched = (
+                    value[: lo - start]
+                    + data[lo - offset : hi - offset]
+                    + value[hi - start :]
+                )
+                self._cache.update(key, patched)
+
+    # Arrays
+    def read_array(
+        self,
+        offset: int,
+        count: int,
+        dtype: str = "u32",
+        byteorder: Literal["little", "big"] = "little",
+    ) -> array.array[Any]:
+        """
+        Read a table of fixed-size values with a single read.
+
+        :param offset: The offset of the first value.
+        :type offset: int
 
-class BinaryProxySerializer(BinaryProxy):  # pylint: disable= R0903
+        :param count: The number of values to read.
+        :type count: int
+
+        :param dtype: The type of each value; one of u8/i8/u16/i16/u32/i32/u64/i64/f32/f64. By default, "u32".
+        :type dtype: str, optional
+
+        :param byteorder: The byteorder or 'endianness' of the values. By default, "little"
+        :type byteorder: Literal["little", "big"], optional
+
+        :raises MismatchError: The stream ended before count values could be read.
+
+        :rtype: array.array
+        :returns: The values, in host byteorder.
+        """
+        values = array.array(self._array_typecode(dtype))
+        values.frombytes(self.read_bytes(offset, count * values.itemsize))
+        if byteorder != sys.byteorder:
+            values.byteswap()
+        return values
+
+    def write_array(
+        self,
+        values: Iterable[Union[int, float]],
+        offset: int,
+        dtype: str = "u32",
+        byteorder: Literal["little", "big"] = "little",
+    ) -> int:
+        """
+        Write a table of fixed-size values with a single write.
+
+        :param values: The values to write; an array.array of the matching type is written without conversion.
+        :type values: Iterable[Union[int, float]]
+
+        :param offset: The offset to write the first value to.
+        :type offset: int
+
+        :param dtype: The type of each value; one of u8/i8/u16/i16/u32/i32/u64/i64/f32/f64. By default, "u32".
+        :type dtype: str, optional
+
+        :param byteorder: The byteorder or 'endianness' of the values. By default, "little"
+        :type byteorder: Literal["little", "big"], optional
+
+        :rtype: int
+        :returns: The number of bytes written.
+        """
+        typecode = self._array_typecode(dtype)
+        if isinstance(values, array.array) and values.typecode == typecode:
+            buffer = values
+        else:
+            buffer = array.array(typecode, values)
+        if byteorder != sys.byteorder:
+            if buffer is values:  # don't modify the caller's array
+                buffer = array.array(typecode, buffer)
+            buffer.byteswap()
+        return self.write_bytes(buffer.tobytes(), offset)
+
+    @staticmethod
+    def _array_typecode(dtype: str) -> str:
+        typecode = _ARRAY_TYPECODES.get(dtype)
+        if typecode is None:
+            raise RelicToolError(
+                f"Unsupported array type '{dtype}'; expected one of {list(_ARRAY_TYPECODES)}"
+            )
+        return typecode
+
+
+class BinaryCursor:  # pylint: disable=protected-access
+    """
+    Decodes a BinarySerializer sequentially; each call reads at, then advances, the cursor's position.
+
+    Fields are served from an internal buffer which is refilled with a single large read,
+    so decoding a run of records costs one read per buffer rather than one per field.
+    Writes made through the serializer invalidate the buffer.
+
+    :param serializer: The serializer to read from.
+    :type serializer: BinarySerializer
+
+    :param start: The offset the cursor starts at. By default, 0.
+    :type start: int, optional
+
+    :param buffer_size: The minimum number of bytes read when refilling the buffer. By default, 64 KiB.
+    :type buffer_size: int, optional
+    """
+
+    def __init__(
+        self,
+        serializer: BinarySerializer,
+        start: int = 0,
+        buffer_size: int = 64 * _KIBIBYTE,
+    ):
+        if buffer_size <= 0:
+            raise RelicToolError(f"Buffer size must be positive; got '{buffer_size}'")
+        self._serializer = serializer
+        self._buffer_size = buffer_size
+        self._now = start
+        self._buffer = b""
+        self._buffer_start = start
+        self._generation = serializer._generation
+
+    def tell(self) -> int:
+        """
+        The absolute offset the next field is read from.
+        """
+        return self._now
+
+    def seek(self, offset: int) -> int:
+        """
+        Move the cursor to an absolute offset; the buffer is kept if the offset falls inside it.
+        """
+        if offset < 0:
+            raise RelicToolError("Invalid Seek: seeking past start of stream!")
+        self._now = offset
+        return self._now
+
+    def skip(self, size: int) -> int:
+        """
+        Advance the cursor without reading.
+
+        :rtype: int
+        :returns: The new position of the cursor.
+        """
+        return self.seek(self._now + size)
+
+    def align(self, alignment: int) -> int:
+        """
+        Advance the cursor to the next multiple of alignment; the cursor is not moved if it is already aligned.
+
+        :rtype: int
+        :returns: The new position of the cursor.
+        """
+        if alignment <= 0:
+            raise RelicToolError(f"Alignment must be positive; got '{alignment}'")
+        return self.seek(-(-self._now // alignment) * alignment)
+
+    def read_int(
+        self,
+        size: int,
+        *,
+        byteorder: Literal["little", "big"] = "little",
+        signed: bool = False,
+    ) -> int:
+        """
+        Read the next integer of the given size.
+        """
+        return int.from_bytes(self.bytes(size), byteorder, signed=signed)
+
+    def uint8(self, byteorder: Literal["little", "big"] = "little") -> int:
+        """Read the next unsigned 8-bit integer"""
+        value: int = self._unpack("u8", 1, byteorder)
+        return value
+
+    def int8(self, byteorder: Literal["little", "big"] = "little") -> int:
+        """Read the next signed 8-bit integer"""
+        value: int = self._unpack("i8", 1, byteorder)
+        return value
+
+    def uint16(self, byteorder: Literal["little", "big"] = "little") -> int:
+        """Read the next unsigned 16-bit integer"""
+        value: int = self._unpack("u16", 2, byteorder)
+        return value
+
+    def int16(self, byteorder: Literal["little", "big"] = "little") -> int:
+        """Read the next signed 16-bit integer"""
+        value: int = self._unpack("i16", 2, byteorder)
+        return value
+
+    def uint32(self, byteorder: Literal["little", "big"] = "little") -> int:
+        """Read the next unsigned 32-bit integer"""
+        value: int = self._unpack("u32", 4, byteorder)
+        return value
+
+    def int32(self, byteorder: Literal["little", "big"] = "little") -> int:
+        """Read the next signed 32-bit integer"""
+        value: int = self._unpack("i32", 4, byteorder)
+        return value
+
+    def uint64(self, byteorder: Literal["little", "big"] = "little") -> int:
+        """Read the next unsigned 64-bit integer"""
+        value: int = self._unpack("u64", 8, byteorder)
+        return value
+
+    def int64(self, byteorder: Literal["little", "big"] = "little") -> int:
+        """Read the next signed 64-bit integer"""
+        value: int = self._unpack("i64", 8, byteorder)
+        return value
+
+    def float32(self, byteorder: Literal["little", "big"] = "little") -> float:
+        """Read the next single precision float"""
+        value: float = self._unpack("f32", 4, byteorder)
+        return value
+
+    def float64(self, byteorder: Literal["little", "big"] = "little") -> float:
+        """Read the next double precision float"""
+        value: float = self._unpack("f64", 8, byteorder)
+        return value
+
+    def c_string(
+        self, size: int, *, encoding: str, padding: Optional[str] = None
+    ) -> str:
+        """
+        Read the next fixed-size C-String.
+        """
+        return _CStringOps.unpack(self.bytes(size), encoding=encoding, padding=padding)
+
+    def _refill(self, size: int) -> None:
+        self._generation = self._serializer._generation
+        self._buffer = self._serializer.read_bytes(
+            self._now, max(size, self._buffer_size), exact_size=False
+        )
+        self._buffer_start = self._now
+
+    def _reserve(self, size: int) -> int:
+        """
+        Ensure the next size bytes are buffered and advance past them.
+
+        :rtype: int
+        :returns: The index of the reserved bytes within the buffer.
+        """
+        start = self._now - self._buffer_start
+        if (
+            start < 0
+            or start + size > len(self._buffer)
+            or self._generation != self._serializer._generation
+        ):
+            self._refill(size)
+            start = 0
+            if size > len(self._buffer):
+                raise MismatchError("Read Mismatch", len(self._buffer), size)
+        self._now += size
+        return start
+
+    def _unpack(self, name: str, size: int, byteorder: str) -> Any:
+        start = self._reserve(size)  # may refill the buffer
+        return _CODECS[name, byteorder].unpack_from(self._buffer, start)[0]
+
+    # Defined last; within the class body, the name shadows the builtin used in annotations
+    def bytes(self, size: int) -> bytes:
+        """
+        Read the next size bytes.
+
+        :raises MismatchError: The stream ended before size bytes could be read.
+        """
+        start = self._reserve(size)
+        return self._buffer[start : start + size]
+
+
+class _HeaderSnapshot:
+    """
+    An in-memory copy of a header region, loaded with a single read on first access.
+
+    Writes patch the copy and are written back together by flush().
+    """
+
+    def __init__(self, serializer: BinarySerializer, start: int, size: int):
+        self._serializer = serializer
+        self.start = start
+        self.size = size
+        self._data: Optional[bytearray] = None
+        # (start, end) relative to the header
+        self._dirty: Optional[Tuple[int, int]] = None
+
+    def _load(self) -> bytearray:
+        if self._data is None:
+            self._data = bytearray(
+                self._serializer.read_bytes(self.start, self.size, exact_size=False)
+            )
+        return self._data
+
+    def read(self, offset: int, size: int) -> Optional[bytes]:
+        """
+        Read a range from the snapshot; None if the range is not (entirely) inside the loaded header.
+        """
+        lo = offset - self.start
+        data = self._load()
+        if lo < 0 or lo + size > len(data):
+            return None
+        return bytes(data[lo : lo + size])
+
+    def write(self, offset: int, buffer: bytes) -> bool:
+        """
+        Write a range into the snapshot; False if the range is not (entirely) inside the loaded header.
+        """
+        lo = offset - self.start
+        hi = lo + len(buffer)
+        data = self._load()
+        if lo < 0 or hi > len(data):
+            return False
+        data[lo:hi] = buffer
+        if self._dirty is None:
+            self._dirty = (lo, hi)
+        else:
+            self._dirty = (min(self._dirty[0], lo), max(self._dirty[1], hi))
+        return True
+
+    def flush(self) -> None:
+        """
+        Write every pending change back to the serializer with a single write.
+        """
+        if self._dirty is None or self._data is None:
+            return
+        lo, hi = self._dirty
+        self._serializer.write_bytes(bytes(self._data[lo:hi]), self.start + lo)
+        self._dirty = None
+
+    def invalidate(self) -> None:
+        """
+        Drop the snapshot (including unflushed writes); the next access re-reads the header.
+        """
+        self._data = None
+        self._dirty = None
+
+
+_ProxySerializerT = TypeVar("_ProxySerializerT", bound="BinaryProxySerializer")
+
+
+class BinaryProxySerializer(BinaryProxy):
     """
     A Mixin-like class which allows the class to be treated as a BinaryIO via proxying,
      and automatically creates a serializer to be used to read/write data lazily
+
+    If the class declares a `__header_span__`, the header is loaded with a single read on the first
+    BinaryProperty access, and every BinaryProperty inside it is served from that snapshot;
+    writes go to the snapshot and are written back together by flush() or close().
+    Can be used as a context manager, which calls close() on exit.
+    """
+
+    __header_span__: Union[None, bool, Tuple[int, int]] = None
+    """
+    The (offset, size) of the header to snapshot;
+    True derives the span from the class's BinaryProperty descriptors. By default, None (no snapshot).
+
+    Header writes stay in the snapshot until flush() or close() is called;
+    until then, other reads of the stream (e.g. through another serializer or window) do not see them,
+    and they are lost if the object is discarded.
     """
 
     def __init__(
@@ -675,54 +2598,532 @@ class BinaryProxySerializer(BinaryProxy):  # pylint: disable= R0903
         stream: Union[BinaryIO, BinaryProxy],
     ):
         self._serializer = BinarySerializer(stream)
+        self._header: Optional[_HeaderSnapshot] = None
 
     def __binio_proxy__(self) -> Union[BinaryIO, BinaryProxy]:
         return self._serializer
 
+    @classmethod
+    def _get_header_span(cls) -> Optional[Tuple[int, int]]:
+        span = cls.__header_span__
+        if span is None or span is False:
+            return None
+        if span is not True:
+            return span
+        start: Optional[int] = None
+        end = 0
+        for klass in cls.__mro__:
+            for attr in vars(klass).values():
+                if isinstance(attr, BinaryProperty):
+                    # pylint: disable=protected-access
+                    start = attr._start if start is None else min(start, attr._start)
+                    end = max(end, attr._start + attr._size)
+        return (start, end - start) if start is not None else None
+
+    def _get_header(self) -> Optional[_HeaderSnapshot]:
+        """
+        The header snapshot, or None if the class does not declare a header span.
+        """
+        header: Optional[_HeaderSnapshot] = getattr(self, "_header", None)
+        if header is None:
+            span = self._get_header_span()
+            if span is None:
+                return None
+            header = self._header = _HeaderSnapshot(self._serializer, *span)
+        return header
+
+    def flush(self) -> None:
+        """
+        Write any pending header changes, then flush the serializer.
+        """
+        header = self._get_header()
+        if header is not None:
+            header.flush()
+        self._serializer.flush()
+
+    def close(self) -> None:
+        """
+        Write any pending header changes, then close the serializer.
+        """
+        header = getattr(self, "_header", None)
+        if header is not None:
+            header.flush()
+        self._serializer.close()
+
+    def __enter__(self: _ProxySerializerT) -> _ProxySerializerT:
+        return self
+
+    def __exit__(
+        self,
+        __t: Union[Type[BaseException], None],
+        __value: Union[BaseException, None],
+        __traceback: Union[TracebackType, None],
+    ) -> None:
+        self.close()
+
+    def invalidate_header(self) -> None:
+        """
+        Drop the header snapshot (including unflushed writes), for when the stream is changed by other means.
+        """
+        header = getattr(self, "_header", None)
+        if header is not None:
+            header.invalidate()
+
 
 # This was definitely used for compressed chunks in SGA
 # But SGA now handles that by decompressing the blob so we can write directly to it, right?
 # Deprecate?
-class ZLibFileReader(BinaryWrapper):
+_ZLIB_WINDOW = 32 * _KIBIBYTE
+_ZLIB_SYNC_MARKER = b"\x00\x00\xff\xff"
+
+
+class _ZLibCheckpoint:  # pylint: disable=too-few-public-methods
+    """
+    A point in a zlib stream which decompression can resume from.
+
+    Either holds a copy of the decompressor's state (in-memory only),
+    or the last 32 KiB of output before a byte-aligned block boundary (which can be persisted).
+
+    The in_offset is where reading the compressed stream resumes;
+    a copied decompressor also keeps any input it had not yet consumed, which precedes in_offset.
+    """
+
+    __slots__ = ("out_offset", "in_offset", "_state", "window")
+
+    def __init__(
+        self,
+        out_offset: int,
+        in_offset: int,
+        *,
+        state: Optional[Any] = None,
+        window: Optional[bytes] = None,
+    ):
+        self.out_offset = out_offset
+        self.in_offset = in_offset
+        self._state = state
+        self.window = window
+
+    def decompressor(self) -> Any:
+        """
+        Create a decompressor positioned at this checkpoint.
+        """
+        if self._state is not None:
+            return self._state.copy()
+        if self.window is not None:
+            return zlib.decompressobj(-zlib.MAX_WBITS, zdict=self.window)
+        return zlib.decompressobj()
+
+
+class ZLibIndex:  # pylint: disable=too-many-instance-attributes
+    """
+    An index of checkpoints into a zlib stream; allowing a ZLibFileReader to seek without decompressing from the start.
+
+    Checkpoints are recorded by a ZLibFileReader as it decompresses, roughly every interval bytes of output.
+
+    Most checkpoints are copies of the decompressor's state, and only exist in memory.
+    Python's zlib cannot restore a decompressor mid-block (there is no inflatePrime),
+    so only checkpoints at byte-aligned block boundaries can be saved;
+    these are found after sync / full flush markers (00 00 FF FF) and verified before being recorded.
+    Streams written without flushes (e.g. by zlib.compress) have no such boundaries.
+
+    The index also records a checksum of the compressed stream
+    (of its first KiB, and its last KiB once its length is known); so an index can't be used with another stream.
+
+    :param interval: The (minimum) number of decompressed bytes between checkpoints. By default, 4 MiB.
+    :type interval: int, optional
+    """
+
+    _MAGIC = b"RZIX"
+    _VERSION = 2
+    # magic, version, interval, size + 1, compressed size + 1, checksum + 1 (0 if unknown), count
+    _HEADER = struct.Struct("<4sBQQQQI")
+    _ENTRY = struct.Struct("<QQI")  # out offset, in offset, window size
+
+    def __init__(self, interval: int = 4 * _MEBIBYTE):
+        if interval <= 0:
+            raise RelicToolError(
+                f"Checkpoint interval must be positive; got '{interval}'"
+            )
+        self._interval = interval
+        self._start = _ZLibCheckpoint(0, 0)
+        self._checkpoints: List[_ZLibCheckpoint] = []
+        self._offsets: List[int] = []
+        self._last_aligned = 0
+        self._size: Optional[int] = None
+        self._in_size: Optional[int] = None
+        self._checksum: Optional[int] = None
+
+    @property
+    def interval(self) -> int:
+        """
+        The (minimum) number of decompressed bytes between checkpoints.
+        """
+        return self._interval
+
+    @property
+    def size(self) -> Optional[int]:
+        """
+        The decompressed size of the stream, if it has been decompressed to the end.
+        """
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._checkpoints)
+
+    @property
+    def _last(self) -> int:
+        return self._offsets[-1] if len(self._offsets) > 0 else 0
+
+    def _find(self, offset: int) -> _ZLibCheckpoint:
+        index = bisect.bisect_right(self._offsets, offset) - 1
+        return self._checkpoints[index] if index >= 0 else self._start
+
+    def _add(self, checkpoint: _ZLibCheckpoint) -> None:
+        if checkpoint.out_offset <= self._last:
+            return
+        self._checkpoints.append(checkpoint)
+        self._offsets.append(checkpoint.out_offset)
+        if checkpoint.window is not None:
+            self._last_aligned = checkpoint.out_offset
+
+    def save(self, stream: BinaryIO) -> int:
+        """
+        Write the persistable (byte-aligned) checkpoints to a stream; e.g. a sidecar file.
+
+        :param stream: The stream to write to.
+        :type stream: BinaryIO
+
+        :rtype: int
+        :returns: The number of checkpoints written.
+        """
+        checkpoints = [cp for cp in self._checkpoints if cp.window is not None]
+        size = self._size + 1 if self._size is not None else 0
+        in_size = self._in_size + 1 if self._in_size is not None else 0
+        checksum = self._checksum + 1 if self._checksum is not None else 0
+        stream.write(
+            self._HEADER.pack(
+                self._MAGIC,
+                self._VERSION,
+                self._interval,
+                size,
+                in_size,
+                checksum,
+                len(checkpoints),
+            )
+        )
+        for checkpoint in checkpoints:
+            window = cast(bytes, checkpoint.window)
+            stream.write(
+                self._ENTRY.pack(
+                    checkpoint.out_offset, checkpoint.in_offset, len(window)
+                )
+            )
+            stream.write(window)
+        return len(checkpoints)
+
+    @staticmethod
+    def _read_exact(stream: BinaryIO, size: int) -> bytes:
+        buffer = stream.read(size)
+        if len(buffer) != size:
+            raise RelicSerializationSizeError(
+                "ZLib Index is truncated", size=len(buffer), expected=size
+            )
+        return buffer
+
+    @classmethod
+    def load(cls, stream: BinaryIO) -> ZLibIndex:
+        """
+        Read an index written by save.
+
+        :param stream: The stream to read from.
+        :type stream: BinaryIO
+
+        :raises MagicMismatchError: The stream is not a ZLib Index.
+        :raises MismatchError: The index was written by an unsupported version.
+        :raises RelicSerializationSizeError: The index is truncated.
+
+        :rtype: ZLibIndex
+        """
+        magic, version, interval, size, in_size, checksum, count = cls._HEADER.unpack(
+            cls._read_exact(stream, cls._HEADER.size)
+        )
+        if magic != cls._MAGIC:
+            raise MagicMismatchError("ZLib Index Magic", magic, cls._MAGIC)
+        if version != cls._VERSION:
+            raise MismatchError("ZLib Index Version", version, cls._VERSION)
+        index = cls(interval)
+        index._size = size - 1 if size != 0 else None
+        index._in_size = in_size - 1 if in_size != 0 else None
+        index._checksum = checksum - 1 if checksum != 0 else None
+        for _ in range(count):
+            out_offset, in_offset, window_size = cls._ENTRY.unpack(
+                cls._read_exact(stream, cls._ENTRY.size)
+            )
+            window = cls._read_exact(stream, window_size)
+            index._add(_ZLibCheckpoint(out_offset, in_offset, window=window))
+        return index
+
+    @classmethod
+    def build(
+        cls,
+        parent: Union[BinaryIO, BinaryProxy],
+        interval: int = 4 * _MEBIBYTE,
+        *,
+        chunk_size: int = 16 * _KIBIBYTE,
+    ) -> ZLibIndex:
+        """
+        Build an index by decompressing an entire stream once, without holding its output.
+
+        :param parent: The zlib compressed stream, positioned at the start of the compressed data.
+        :type parent: Union[BinaryIO, BinaryProxy]
+
+        :param interval: The (minimum) number of decompressed bytes between checkpoints. By default, 4 MiB.
+        :type interval: int, optional
+
+        :rtype: ZLibIndex
+        """
+        index = cls(interval)
+        ZLibFileReader(parent, chunk_size=chunk_size, index=index).seek(0, os.SEEK_END)
+        return index
+
+
+class ZLibFileReader(BinaryWrapper):  # pylint: disable=too-many-instance-attributes
     """
     A wrapper which lazily reads a Z-Lib compressed file.
+
+    The file is only decompressed as far as the furthest offset requested so far;
+    output is kept, and decompression resumes from where it stopped on the next request.
+
+    If an index is given, only output near the current position is kept;
+    and seeking resumes decompression from the nearest checkpoint in the index (which requires a seekable parent).
+    The index is extended with new checkpoints as the file is decompressed.
+
+    :param parent: The zlib compressed stream, positioned at the start of the compressed data.
+    :type parent: Union[BinaryIO, BinaryProxy]
+
+    :param chunk_size: The number of compressed bytes read at a time. By default, 16 KiB.
+    :type chunk_size: int, optional
+
+    :param index: The checkpoint index of the file. By default, no index is used.
+    :type index: Optional[ZLibIndex], optional
+
+    :raises MismatchError: The index was built from a different stream.
     """
 
+    # pylint: disable=protected-access
+
     def __init__(
-        self, parent: Union[BinaryIO, BinaryProxy], *, chunk_size: int = 16 * _KIBIBYTE
+        self,
+        parent: Union[BinaryIO, BinaryProxy],
+        *,
+        chunk_size: int = 16 * _KIBIBYTE,
+        index: Optional[ZLibIndex] = None,
     ):
         super().__init__(parent)
-        self._data_cache: Optional[bytes] = None
+        self._buffer = bytearray()
+        self._buffer_start = 0
+        self._decompressor = zlib.decompressobj()
+        self._eof = False
         self._now = 0
         self._chunk_size = chunk_size
+        self._index = index
+        self._origin = self._handle.tell() if index is not None else 0
+        self._read_pos = 0  # compressed bytes read from the parent, relative to origin
+        self._pending_input = b""
+        self._at_marker = False
+        if index is not None:
+            checksum = self._checksum(index._in_size)
+            if index._checksum is None:
+                index._checksum = checksum
+            elif checksum != index._checksum:
+                raise MismatchError("ZLib Index Checksum", checksum, index._checksum)
 
     @property
-    def _remaining(self) -> int:
-        return len(self._data) - self._now
+    def index(self) -> Optional[ZLibIndex]:
+        """
+        The checkpoint index of the file, if one is used.
+        """
+        return self._index
+
+    def _next_input(self) -> bytes:
+        data = self._pending_input
+        self._pending_input = b""
+        if len(data) == 0:
+            data = self._handle.read(self._chunk_size)
+            self._read_pos += len(data)
+        index = self._index
+        if (
+            index is not None
+            and self._buffer_start + len(self._buffer)
+            >= index._last_aligned + index.interval
+        ):
+            # Stop the input just after a sync marker; so the block boundary can be checkpointed
+            marker = data.find(_ZLIB_SYNC_MARKER)
+            if marker != -1:
+                split = marker + len(_ZLIB_SYNC_MARKER)
+                self._pending_input = data[split:]
+                self._at_marker = True
+                return data[:split]
+        return data
+
+    def _checksum(self, in_size: Optional[int]) -> int:
+        # Identifies the compressed stream; by its first KiB, and its last KiB if its length is known
+        position = self._handle.tell()
+        self._handle.seek(self._origin)
+        checksum = zlib.adler32(self._handle.read(_KIBIBYTE))
+        if in_size is not None:
+            self._handle.seek(self._origin + max(in_size - _KIBIBYTE, 0))
+            tail = self._handle.read(min(in_size, _KIBIBYTE))
+            checksum = zlib.adler32(tail, checksum)
+        self._handle.seek(position)
+        return checksum
+
+    def _verify_aligned(self, in_offset: int, window: bytes) -> bool:
+        # Sync markers can occur by chance in compressed data; a true block boundary decompresses identically
+        position = self._handle.tell()
+        self._handle.seek(self._origin + in_offset)
+        probe = self._handle.read(_ZLIB_WINDOW)
+        self._handle.seek(position)
+        try:
+            expected = self._decompressor.copy().decompress(probe, _ZLIB_WINDOW)
+            raw = zlib.decompressobj(-zlib.MAX_WBITS, zdict=window)
+            return bool(raw.decompress(probe, _ZLIB_WINDOW) == expected)
+        except zlib.error:
+            return False
+
+    def _checkpoint(self, index: ZLibIndex) -> None:
+        decompressor = self._decompressor
+        out_offset = self._buffer_start + len(self._buffer)
+        # The decompressor (and so a copy of it) still holds its unconsumed input; reading resumes after it
+        in_offset = self._read_pos - len(self._pending_input)
+        if self._at_marker and len(decompressor.unconsumed_tail) == 0:
+            self._at_marker = False
+            window_start = max(len(self._buffer) - _ZLIB_WINDOW, 0)
+            # Offsets up to index._last are already indexed, when resumed from a checkpoint
+            if (
+                out_offset > index._last
+                and out_offset >= index._last_aligned + index.interval
+                and (self._buffer_start == 0 or window_start > 0)
+            ):
+                window = bytes(self._buffer[window_start:])
+                if self._verify_aligned(in_offset, window):
+                    index._add(_ZLibCheckpoint(out_offset, in_offset, window=window))
+                    return
+        if out_offset >= index._last + index.interval:
+            index._add(
+                _ZLibCheckpoint(out_offset, in_offset, state=decompressor.copy())
+            )
 
-    @property
-    def _data(self) -> bytes:
-        if self._data_cache is None:
-            parts = []
-            decompressor = zlib.decompressobj()
-            while True:
-                chunk = self._handle.read(self._chunk_size)
-                if len(chunk) == 0:
+    def _restore(self, checkpoint: _ZLibCheckpoint) -> None:
+        self._decompressor = checkpoint.decompressor()
+        self._handle.seek(self._origin + checkpoint.in_offset)
+        self._read_pos = checkpoint.in_offset
+        self._pending_input = b""
+        self._at_marker = False
+        self._buffer = bytearray()
+        self._buffer_start = checkpoint.out_offset
+        self._eof = False
+
+    def _seek_buffer(self, offset: int) -> None:
+        # Resume from a checkpoint if offset was discarded, or a checkpoint is closer than the current output
+        index = self._index
+        if index is None:
+            return
+        if offset < self._buffer_start:
+            self._restore(index._find(offset))
+        elif not self._eof:
+            checkpoint = index._find(offset)
+            if checkpoint.out_offset > self._buffer_start + len(self._buffer):
+                self._restore(checkpoint)
+
+    def _decompress(
+        self, end: Optional[int] = None, keep: Optional[int] = None
+    ) -> None:
+        """
+        Decompress until at least end bytes are available, or the file is exhausted.
+
+        :param end: The number of bytes required; if None, decompresses the entire file.
+        :type end: Optional[int], optional
+
+        :param keep: The offset from which output must be kept, when using an index. By default, the current position.
+        :type keep: Optional[int], optional
+        """
+        buffer = self._buffer
+        index = self._index
+        keep = self._now if keep is None else keep
+        while not self._eof and (end is None or self._buffer_start + len(buffer) < end):
+            decompressor = self._decompressor
+            data = decompressor.unconsumed_tail
+            if len(data) == 0:
+                data = self._next_input()
+                if len(data) == 0:
+                    buffer += decompressor.flush()
+                    self._eof = True
                     break
-                part = decompressor.decompress(chunk)
-                parts.append(part)
-            last = decompressor.flush()
-            parts.append(last)
-            self._data_cache = b"".join(parts)
-        return self._data_cache
+            # max_length stops a small read from inflating a whole chunk's worth of highly compressed data
+            max_length = (
+                0
+                if end is None
+                else max(end - self._buffer_start - len(buffer), self._chunk_size)
+            )
+            buffer += decompressor.decompress(data, max_length)
+            if decompressor.eof:
+                self._eof = True
+            elif index is not None:
+                self._checkpoint(index)
+            if index is not None:
+                # Discard output that is behind the kept offset (and the window of the next aligned checkpoint)
+                out_offset = self._buffer_start + len(buffer)
+                discard = min(keep, out_offset - _ZLIB_WINDOW) - self._buffer_start
+                if discard >= index.interval:
+                    del buffer[:discard]
+                    self._buffer_start += discard
+        if index is not None and self._eof:
+            index._size = self._buffer_start + len(buffer)
+            if index._in_size is None:
+                unused = len(self._pending_input) + len(self._decompressor.unused_data)
+                index._in_size = self._read_pos - unused
+                index._checksum = self._checksum(index._in_size)
+
+    def _get_size(self) -> int:
+        if self._index is not None:
+            if self._index.size is None:
+                self._seek_buffer(sys.maxsize)  # resume from the last checkpoint
+                self._decompress(keep=sys.maxsize)
+            return cast(int, self._index.size)
+        self._decompress()
+        return len(self._buffer)
+
+    @property
+    def _remaining(self) -> int:
+        return self._get_size() - self._now
 
     def read(self, __n: int = -1) -> bytes:
-        remaining = self._remaining
-        size = min(remaining, __n) if __n != -1 else remaining
-        buffer = self._data[self._now : self._now + size]
+        self._seek_buffer(self._now)
+        if __n < 0:
+            self._decompress()
+        else:
+            self._decompress(self._now + __n)
+        start = self._now - self._buffer_start
+        available = max(len(self._buffer) - start, 0)
+        size = min(available, __n) if __n >= 0 else available
+        buffer = bytes(self._buffer[start : start + size])
         self._now += size
         return buffer
 
+    def readinto(self, __buffer: Buffer) -> int:
+        view = memoryview(__buffer).cast("B")
+        self._seek_buffer(self._now)
+        self._decompress(self._now + len(view))
+        start = self._now - self._buffer_start
+        size = max(min(len(view), len(self._buffer) - start), 0)
+        view[:size] = self._buffer[start : start + size]
+        self._now += size
+        return size
+
+    def readinto1(self, __buffer: Buffer) -> int:
+        return self.readinto(__buffer)
+
     def readline(self, __limit: int = -1) -> bytes:
         raise NotImplementedError
 
@@ -735,7 +3136,7 @@ class ZLibFileReader(BinaryWrapper):
         elif __whence == os.SEEK_CUR:
             new_now = __offset + self._now
         elif __whence == os.SEEK_END:
-            new_now = len(self._data) - __offset
+            new_now = self._get_size() - __offset
         else:
             raise ValueError(__whence)
         self._now = new_now
@@ -768,12 +3169,36 @@ def tell_end(stream: BinaryIO) -> int:
     return end
 
 
-def read_chunks(
+@overload
+def read_chunks(
+    stream: Union[BinaryIO, bytes, bytearray],
+    start: Optional[int] = None,
+    size: Optional[int] = None,
+    chunk_size: int = _KIBIBYTE * 16,
+    *,
+    buffer: None = None,
+) -> Iterable[bytes]: ...
+
+
+@overload
+def read_chunks(
+    stream: Union[BinaryIO, bytes, bytearray],
+    start: Optional[int] = None,
+    size: Optional[int] = None,
+    chunk_size: int = _KIBIBYTE * 16,
+    *,
+    buffer: Union[bytearray, memoryview],
+) -> Iterable[memoryview]: ...
+
+
+def read_chunks(  # pylint: disable=R0912
     stream: Union[BinaryIO, bytes, bytearray],
     start: Optional[int] = None,
     size: Optional[int] = None,
     chunk_size: int = _KIBIBYTE * 16,
-) -> Iterable[bytes]:
+    *,
+    buffer: Optional[Union[bytearray, memoryview]] = None,
+) -> Iterable[Union[bytes, memoryview]]:
     """
     Yields chunks from the stream until the size or the end of the stream is reached
 
@@ -794,35 +3219,88 @@ def read_chunks(
         By default, this is 16 KiB
     :type chunk_size: int
 
+    :param buffer: A caller-provided buffer to read chunks into (via readinto), replacing chunk_size.
+        If given, memoryviews are yielded instead of bytes; each view is only valid until the next chunk is requested.
+        When reading from a bytes-like, the views point directly into the source instead.
+        By default, this is None
+    :type buffer: Optional[Union[bytearray, memoryview]], optional
+
     :returns: An iterable of bytes containing all data from start to start + size
-    :rtype: Iterable[bytes]
+    :rtype: Iterable[Union[bytes, memoryview]]
     """
+    if buffer is not None:
+        view = memoryview(buffer).cast("B")
+        chunk_size = len(view)
+        if chunk_size == 0:
+            raise RelicToolError("Cannot read chunks into an empty buffer!")
 
     if isinstance(stream, (bytes, bytearray)):
         if start is None:
             start = 0
         if size is None:
             size = len(stream) - start
+        source = memoryview(stream) if buffer is not None else stream
         for index in range(math.ceil(size / chunk_size)):
             read_start = start + index * chunk_size
             read_end = start + min((index + 1) * chunk_size, size)
-            yield stream[read_start:read_end]
+            yield source[read_start:read_end]
+    elif buffer is not None:
+        if start is not None:
+            stream.seek(start)
+        while size is None or size > 0:
+            target = view if size is None or size >= chunk_size else view[:size]
+            read = _readinto(stream, target)
+            if read == 0:
+                return
+            if size is not None:
+                size -= read
+            yield target[:read]
     else:
         if start is not None:
             stream.seek(start)
         if size is None:
             while True:
-                buffer = stream.read(chunk_size)
-                if len(buffer) == 0:
+                chunk = stream.read(chunk_size)
+                if len(chunk) == 0:
                     return
-                yield buffer
+                yield chunk
         else:
             while size > 0:
-                buffer = stream.read(min(size, chunk_size))
-                size -= len(buffer)
-                if len(buffer) == 0:
+                chunk = stream.read(min(size, chunk_size))
+                size -= len(chunk)
+                if len(chunk) == 0:
                     return
-                yield buffer
+                yield chunk
+
+
+def _chunk_copy_into(  # pylint: disable=R0917
+    src: BinaryIO,
+    dest: bytearray,
+    src_start: int,
+    size: int,
+    dst_start: int,
+    chunk_size: int,
+) -> None:
+    """
+    Reads from the source stream directly into the destination buffer, growing the buffer if needed.
+    """
+    end = dst_start + size
+    initial_size = len(dest)
+    if end > initial_size:
+        dest.extend(bytes(end - initial_size))
+
+    src.seek(src_start)
+    copied = 0
+    with memoryview(dest) as view:
+        while copied < size:
+            read_end = dst_start + min(copied + chunk_size, size)
+            read = _readinto(src, view[dst_start + copied : read_end])
+            if read == 0:
+                break
+            copied += read
+
+    # Drop any space we reserved that was not filled
+    del dest[max(initial_size, dst_start + copied) :]
 
 
 def chunk_copy(  # pylint: disable=R0917
@@ -836,6 +3314,9 @@ def chunk_copy(  # pylint: disable=R0917
     """
     Copies from a source bytes-like to a destination bytes-like in chunks.
 
+    Streams are read with readinto; directly into the destination if it is a bytearray,
+    otherwise into a single reusable chunk buffer.
+
     :param src: The source bytes-like
     :type src: Union[BinaryIO, bytes, bytearray]
 
@@ -865,6 +3346,14 @@ def chunk_copy(  # pylint: disable=R0917
         if dst_start is None:
             dst_start = 0
 
+        if (
+            size is not None
+            and not isinstance(src, (bytes, bytearray))
+            and dst_start <= len(dest)
+        ):
+            _chunk_copy_into(src, dest, src_start, size, dst_start, chunk_size)
+            return
+
         for i, chunk in enumerate(read_chunks(src, src_start, size, chunk_size)):
             chunk_offset = i * chunk_size
             chunk_size = len(chunk)
@@ -876,8 +3365,9 @@ def chunk_copy(  # pylint: disable=R0917
     else:
         if dst_start is not None:
             dest.seek(dst_start)
-        for chunk in read_chunks(src, src_start, size, chunk_size):
-            dest.write(chunk)
+        with memoryview(bytearray(chunk_size)) as buffer:
+            for view in read_chunks(src, src_start, size, buffer=buffer):
+                dest.write(view)
 
 
 _T = TypeVar("_T")
@@ -973,23 +3463,61 @@ class CStringConverter(BinaryConverter[str]):
 class BinaryProperty(Generic[_T]):
     """
     Helper class to convert binary data to typed data as a lazy property
-    Expect a BinaryIO '_serializer' object on the parent object
+    Expect a BinarySerializer (or BinaryIO) '_serializer' object on the parent object
+
+    BinarySerializers are read from/written to directly (positionally);
+    a BinaryWindow is only used when '_serializer' is a plain stream.
     """
 
+    # pylint: disable=protected-access
+
     def __init__(self, start: int, size: int, converter: BinaryConverter[_T]):
         self._start = start
         self._size = size
         self._converter = converter
 
     def __get__(self, instance: Any, owner: Any) -> _T:
-        serializer = instance._serializer
-        buffer = self._read(serializer)
+        buffer = self._get_buffer(instance)
         value = self._converter.bytes2value(buffer)
         return value
 
     def __set__(self, instance: Any, value: _T) -> None:
-        serializer = instance._serializer
         buffer = self._converter.value2bytes(value)
+        self._set_buffer(instance, buffer)
+
+    @staticmethod
+    def _header(instance: Any) -> Optional[_HeaderSnapshot]:
+        if isinstance(instance, BinaryProxySerializer):
+            return instance._get_header()
+        return None
+
+    def _get_buffer(self, instance: Any) -> bytes:
+        """Read this property's byte buffer; from the instance's header snapshot if it has one"""
+        header = self._header(instance)
+        if header is not None:
+            buffer = header.read(self._start, self._size)
+            if buffer is not None:
+                return buffer
+        serializer = instance._serializer
+        if isinstance(serializer, BinarySerializer):
+            # like a window, reads are clamped to the end of the stream
+            return serializer.read_bytes(self._start, self._size, exact_size=False)
+        return self._read(serializer)
+
+    def _set_buffer(self, instance: Any, buffer: bytes) -> None:
+        """Write this property's byte buffer; to the instance's header snapshot if it has one"""
+        header = self._header(instance)
+        if header is not None and len(buffer) <= self._size:
+            if header.write(self._start, buffer):
+                return
+        serializer = instance._serializer
+        if isinstance(serializer, BinarySerializer):
+            if len(buffer) > self._size:
+                raise RelicToolError(
+                    f"Cannot write {len(buffer)} bytes, only {self._size} bytes remaining!"
+                )
+            serializer.write_bytes(buffer, self._start)
+            return
         self._write(serializer, buffer)
 
     @contextmanager
@@ -1008,6 +3536,58 @@ class BinaryProperty(Generic[_T]):
             window.write(value)
 
 
+class CachedBinaryProperty(BinaryProperty[_T]):
+    """
+    A BinaryProperty which stores the decoded value on the instance after the first read
+
+    Setting the property writes the value and updates the cached value;
+    if the underlying stream is changed by other means, call invalidate (or invalidate_all) to re-read it.
+    Requires the parent object to have a __dict__
+    """
+
+    def __init__(self, start: int, size: int, converter: BinaryConverter[_T]):
+        super().__init__(start, size, converter)
+        self._key = f"_cached_binary_property_{id(self)}"
+
+    def __set_name__(self, owner: Any, name: str) -> None:
+        # a data descriptor takes precedence over the instance __dict__
+        self._key = name
+
+    def __get__(self, instance: Any, owner: Any) -> _T:
+        # accessed on the class; allow `Class.prop.invalidate(obj)`
+        if instance is None:
+            return self  # type: ignore[return-value]
+        cache = vars(instance)
+        if self._key in cache:
+            value: _T = cache[self._key]
+            return value
+        value = super().__get__(instance, owner)
+        cache[self._key] = value
+        return value
+
+    def __set__(self, instance: Any, value: _T) -> None:
+        buffer = self._converter.value2bytes(value)
+        self._set_buffer(instance, buffer)
+        # cache what a read would return (e.g. without padding)
+        vars(instance)[self._key] = self._converter.bytes2value(buffer)
+
+    def invalidate(self, instance: Any) -> None:
+        """
+        Drop the cached value of this property; the next access re-reads it from the stream.
+        """
+        vars(instance).pop(self._key, None)
+
+    @staticmethod
+    def invalidate_all(instance: Any) -> None:
+        """
+        Drop the cached value of every CachedBinaryProperty on the instance.
+        """
+        for cls in type(instance).__mro__:
+            for attr in vars(cls).values():
+                if isinstance(attr, CachedBinaryProperty):
+                    attr.invalidate(instance)
+
+
 class ConstProperty(Generic[_T]):
     """
     A property for a constant value
@@ -1023,3 +3603,711 @@ class ConstProperty(Generic[_T]):
 
     def __set__(self, instance: Any, value: _T) -> None:
         raise self._err
+
+
+def _import_numpy() -> Any:
+    """
+    Import NumPy, which is an optional dependency.
+
+    :raises RelicToolError: NumPy is not installed.
+    """
+    try:
+        import numpy  # pylint: disable=import-outside-toplevel
+    except ImportError as e:
+        raise RelicToolError(
+            "NumPy is required for this operation; install 'relic-tool-core[numpy]'"
+        ) from e
+    return numpy
+
+
+class StructField(NamedTuple):
+    """
+    A field of a StructLayout.
+
+    :param name: The name of the field on the decoded record.
+    :type name: str
+
+    :param kind: A codec type (u8/i8/u16/i16/u32/i32/u64/i64/f32/f64) or a BinaryConverter.
+    :type kind: Union[str, BinaryConverter[Any]]
+
+    :param offset: The offset of the field from the start of the record.
+    :type offset: int
+
+    :param size: The size of the field in bytes;
+        only required for converters whose size cannot be determined (e.g. ByteConverter).
+    :type size: Optional[int], optional
+    """
+
+    name: str
+    kind: Union[str, BinaryConverter[Any]]
+    offset: int
+    size: Optional[int] = None
+
+
+class StructLayout:  # pylint: disable=protected-access
+    """
+    A fixed-size record, declared as fields at byte offsets and compiled into a single struct.Struct.
+
+    Gaps between fields are compiled to padding, so a record is decoded with one read and one unpack;
+    fields using a converter are unpacked as raw bytes and passed through the converter.
+
+    :param fields: The fields of the record; either StructFields or (name, kind, offset[, size]) tuples.
+    :type fields: Iterable[Union[StructField, Tuple[Any, ...]]]
+
+    :param byteorder: The byteorder of the codec fields. By default, "little"
+    :type byteorder: Literal["little", "big"], optional
+
+    :param size: The total size of the record, if larger than the end of the last field. By default, None.
+    :type size: Optional[int], optional
+
+    :param name: The name of the record type. By default, "Record".
+    :type name: str, optional
+
+    :raises RelicToolError: Fields overlap, or the size of a field could not be determined.
+    """
+
+    def __init__(
+        self,
+        fields: Iterable[Union[StructField, Tuple[Any, ...]]],
+        *,
+        byteorder: Literal["little", "big"] = "little",
+        size: Optional[int] = None,
+        name: str = "Record",
+    ):
+        self.fields = sorted(
+            (StructField(*field) for field in fields), key=lambda field: field.offset
+        )
+        self.byteorder = byteorder
+        formats = [_BYTEORDER_PREFIXES[byteorder]]
+        # (index in record, converter, size) of fields unpacked as raw bytes
+        self._converters: List[Tuple[int, BinaryConverter[Any], int]] = []
+        end = 0
+        for index, field in enumerate(self.fields):
+            if field.offset < end:
+                raise RelicToolError(
+                    f"Field '{field.name}' (@{field.offset}) overlaps the previous field (ends @{end})"
+                )
+            if field.offset > end:
+                formats.append(f"{field.offset - end}x")
+            code, field_size = self._compile_field(field)
+            if code == "s":
+                formats.append(f"{field_size}s")
+                self._converters.append(
+                    (index, cast(BinaryConverter[Any], field.kind), field_size)
+                )
+            else:
+                formats.append(code)
+            end = field.offset + field_size
+        if size is not None:
+            if size < end:
+                raise RelicToolError(
+                    f"Record size '{size}' is smaller than its fields (ends @{end})"
+                )
+            if size > end:
+                formats.append(f"{size - end}x")
+        self.struct = struct.Struct("".join(formats))
+        self.record: Any = namedtuple(  # type: ignore[misc]
+            name, [field.name for field in self.fields]
+        )
+
+    def _compile_field(self, field: StructField) -> Tuple[str, int]:
+        """
+        Get the struct code and size of a field; "s" denotes raw bytes passed through the field's converter.
+        """
+        kind = field.kind
+        if isinstance(kind, str):
+            if kind not in _STRUCT_FORMATS:
+                raise RelicToolError(
+                    f"Unsupported type '{kind}' for field '{field.name}'; expected one of {list(_STRUCT_FORMATS)}"
+                )
+            return _STRUCT_FORMATS[kind], _CODECS[kind, "little"].size
+        if isinstance(kind, IntConverter):
+            name = f"{'i' if kind._signed else 'u'}{kind._length * 8}"
+            if name in _STRUCT_FORMATS and (
+                kind._length == 1 or kind._byteorder == self.byteorder
+            ):
+                return _STRUCT_FORMATS[name], kind._length
+            return "s", kind._length
+        field_size = field.size
+        if field_size is None and isinstance(kind, CStringConverter):
+            field_size = kind._size
+        if field_size is None:
+            raise RelicToolError(f"Cannot determine the size of field '{field.name}'")
+        return "s", field_size
+
+    @property
+    def size(self) -> int:
+        """
+        The size of a record in bytes.
+        """
+        return self.struct.size
+
+    def _codec_name(self, field: StructField) -> Optional[str]:
+        """
+        Get the codec type of a numeric field (e.g. "u32"), or None if the field is not numeric.
+        """
+        kind = field.kind
+        if isinstance(kind, IntConverter):
+            kind = f"{'i' if kind._signed else 'u'}{kind._length * 8}"
+        return kind if isinstance(kind, str) and kind in _STRUCT_FORMATS else None
+
+    def numpy_dtype(self, itemsize: Optional[int] = None) -> Any:
+        """
+        Get an equivalent NumPy structured dtype; requires NumPy.
+
+        Numeric fields keep their byteorder, other fields are exposed as raw bytes ('S<size>').
+
+        :param itemsize: The size of each item; by default, the size of the layout.
+        :type itemsize: Optional[int], optional
+
+        :raises RelicToolError: NumPy is not installed.
+
+        :rtype: numpy.dtype
+        """
+        np = _import_numpy()
+        formats = []
+        for field in self.fields:
+            name = self._codec_name(field)
+            _, field_size = self._compile_field(field)
+            if name is None:
+                formats.append(f"S{field_size}")
+                continue
+            byteorder = (
+                field.kind._byteorder
+                if isinstance(field.kind, IntConverter)
+                else self.byteorder
+            )
+            formats.append(f"{_BYTEORDER_PREFIXES[byteorder]}{name[0]}{field_size}")
+        return np.dtype(
+            {
+                "names": [field.name for field in self.fields],
+                "formats": formats,
+                "offsets": [field.offset for field in self.fields],
+                "itemsize": itemsize if itemsize is not None else self.size,
+            }
+        )
+
+    def columns(
+        self, rows: Iterable[Tuple[Any, ...]]
+    ) -> Dict[str, Union[array.array[Any], List[Any]]]:
+        """
+        Transpose rows unpacked by this layout's struct into columns.
+
+        Numeric fields are returned as an array.array, other fields as a list of converted values.
+
+        :param rows: The raw rows, e.g. from `layout.struct.iter_unpack`.
+        :type rows: Iterable[Tuple[Any, ...]]
+
+        :rtype: Dict[str, Union[array.array, List[Any]]]
+        """
+        columns: List[List[Any]] = [list(column) for column in zip(*rows)] or [
+            [] for _ in self.fields
+        ]
+        for index, converter, _ in self._converters:
+            columns[index] = [converter.bytes2value(value) for value in columns[index]]
+        result: Dict[str, Union[array.array[Any], List[Any]]] = {}
+        for field, column in zip(self.fields, columns):
+            name = self._codec_name(field)
+            result[field.name] = (
+                array.array(_ARRAY_TYPECODES[name], column)
+                if name is not None
+                else column
+            )
+        return result
+
+    def unpack(self, buffer: Buffer, offset: int = 0) -> Any:
+        """
+        Decode a record from a buffer.
+
+        :param buffer: The buffer to decode from.
+        :type buffer: Buffer
+
+        :param offset: The offset of the record in the buffer. By default, 0.
+        :type offset: int, optional
+
+        :rtype: Any
+        :returns: A record (namedtuple) with a value per field.
+        """
+        values = self.struct.unpack_from(buffer, offset)
+        if not self._converters:
+            return self.record._make(values)
+        converted = list(values)
+        for index, converter, _ in self._converters:
+            converted[index] = converter.bytes2value(converted[index])
+        return self.record._make(converted)
+
+    def _values(self, record: Iterable[Any]) -> List[Any]:
+        values = list(record)
+        for index, converter, field_size in self._converters:
+            buffer = converter.value2bytes(values[index])
+            if len(buffer) != field_size:  # struct would silently pad/truncate
+                raise RelicSerializationSizeError(
+                    f"`{buffer!r}` expected '{field_size}' bytes, got '{len(buffer)}' bytes"
+                )
+            values[index] = buffer
+        return values
+
+    def pack(self, record: Iterable[Any]) -> bytes:
+        """
+        Encode a record; gaps between fields are zero-filled.
+
+        :param record: The values of the record, in field (offset) order.
+        :type record: Iterable[Any]
+
+        :rtype: bytes
+        """
+        return self.struct.pack(*self._values(record))
+
+    def pack_into(self, buffer: Buffer, offset: int, record: Iterable[Any]) -> None:
+        """
+        Encode a record into a writable buffer; gaps between fields are zero-filled.
+
+        :param buffer: The buffer to encode into.
+        :type buffer: Buffer
+
+        :param offset: The offset of the record in the buffer.
+        :type offset: int
+
+        :param record: The values of the record, in field (offset) order.
+        :type record: Iterable[Any]
+        """
+        self.struct.pack_into(buffer, offset, *self._values(record))
+
+    def read(self, serializer: BinarySerializer, offset: int) -> Any:
+        """
+        Read a record with a single read.
+
+        :param serializer: The serializer to read from.
+        :type serializer: BinarySerializer
+
+        :param offset: The offset of the record.
+        :type offset: int
+
+        :rtype: Any
+        :returns: A record (namedtuple) with a value per field.
+        """
+        return self.unpack(serializer.read_bytes(offset, self.size))
+
+    def write(
+        self, serializer: BinarySerializer, offset: int, record: Iterable[Any]
+    ) -> int:
+        """
+        Write a record with a single write; gaps between fields are zero-filled.
+
+        :param serializer: The serializer to write to.
+        :type serializer: BinarySerializer
+
+        :param offset: The offset of the record.
+        :type offset: int
+
+        :param record: The values of the record, in field (offset) order.
+        :type record: Iterable[Any]
+
+        :rtype: int
+        :returns: The number of bytes written.
+        """
+        return serializer.write_bytes(self.pack(record), offset, self.size)
+
+
+class RecordArray(Sequence[Any]):
+    """
+    A lazy, read-only view over a table of fixed-size records.
+
+    Nothing is read until a record is accessed; indexing reads a single record,
+    while iterating reads many records per read.
+
+    :param serializer: The serializer to read from.
+    :type serializer: BinarySerializer
+
+    :param offset: The offset of the first record.
+    :type offset: int
+
+    :param count: The number of records in the table.
+    :type count: int
+
+    :param layout: The layout of each record.
+    :type layout: StructLayout
+
+    :param stride: The distance between the start of consecutive records; by default, the size of the layout.
+    :type stride: Optional[int], optional
+
+    :param chunk_size: The (approximate) number of bytes read at a time when iterating. By default, 64 KiB.
+    :type chunk_size: int, optional
+    """
+
+    def __init__(  # pylint: disable=R0913, R0917
+        self,
+        serializer: BinarySerializer,
+        offset: int,
+        count: int,
+        layout: StructLayout,
+        stride: Optional[int] = None,
+        chunk_size: int = 64 * _KIBIBYTE,
+    ):
+        if count < 0:
+            raise RelicToolError(f"Record count cannot be negative; got '{count}'")
+        if stride == 0:
+            raise RelicToolError("Record stride cannot be 0")
+        self._serializer = serializer
+        self._offset = offset
+        self._count = count
+        self._layout = layout
+        self._stride = stride if stride is not None else layout.size
+        self._chunk_size = chunk_size
+
+    @property
+    def layout(self) -> StructLayout:
+        """
+        The layout of each record.
+        """
+        return self._layout
+
+    def __len__(self) -> int:
+        return self._count
+
+    @overload
+    def __getitem__(self, index: int) -> Any: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> RecordArray: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            indices = range(self._count)[index]
+            # An empty slice's start may lie outside the table (e.g. [-20::-1])
+            start = indices.start if len(indices) > 0 else 0
+            return RecordArray(
+                self._serializer,
+                self._offset + start * self._stride,
+                len(indices),
+                self._layout,
+                stride=self._stride * indices.step,
+                chunk_size=self._chunk_size,
+            )
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError(
+                f"Record index out of range; got '{index}' for '{self._count}' records"
+            )
+        return self._layout.read(self._serializer, self._offset + index * self._stride)
+
+    def __iter__(self) -> Iterator[Any]:
+        size = self._layout.size
+        per_chunk = max(1, self._chunk_size // abs(self._stride))
+        for first in range(0, self._count, per_chunk):
+            count = min(per_chunk, self._count - first)
+            start = self._offset + first * self._stride
+            end = start + (count - 1) * self._stride
+            low = min(start, end)
+            # one read covering every record in the chunk (in either direction)
+            buffer = self._serializer.read_bytes(low, abs(end - start) + size)
+            for index in range(count):
+                yield self._layout.unpack(buffer, start - low + index * self._stride)
+
+    def _span(self) -> Tuple[int, int]:
+        """
+        The (offset, size) of the region covering every record; requires at least one record.
+        """
+        last = self._offset + (self._count - 1) * self._stride
+        return min(self._offset, last), abs(last - self._offset) + self._layout.size
+
+    def to_numpy(self) -> Any:
+        """
+        Decode the table into a NumPy structured array with a single read; requires NumPy.
+
+        Over a MappedSource, the array is a zero-copy view of the map (unless writes are pending);
+        otherwise it is a view of the bytes read.
+        Columns can be filtered vectorized; e.g. `table[table["size"] > 1024]`.
+
+        :raises RelicToolError: NumPy is not installed.
+
+        :rtype: numpy.ndarray
+        """
+        np = _import_numpy()
+        if self._count == 0:
+            return np.empty(0, dtype=self._layout.numpy_dtype())
+        low, span = self._span()
+        stream = self._serializer.stream
+        buffer: Buffer
+        if (
+            isinstance(stream, MappedSource)
+            and span > 0
+            and not self._serializer.has_pending_writes
+        ):
+            buffer = stream.view(low, span)
+        else:
+            buffer = self._serializer.read_bytes(low, span)
+        return np.ndarray(
+            shape=(self._count,),
+            dtype=self._layout.numpy_dtype(),
+            buffer=buffer,
+            offset=self._offset - low,
+            strides=(self._stride,),
+        )
+
+    def to_columns(self) -> Dict[str, Union[array.array[Any], List[Any]]]:
+        """
+        Decode the table into columns with a single read; does not require NumPy.
+
+        Integer and float fields are returned as an array.array, converter fields as a list of values.
+
+        :rtype: Dict[str, Union[array.array, List[Any]]]
+        """
+        layout = self._layout
+        if self._count == 0:
+            return layout.columns(())
+        low, span = self._span()
+        buffer = self._serializer.read_bytes(low, span)
+        start = self._offset - low
+        if self._stride == layout.size and start == 0:
+            return layout.columns(layout.struct.iter_unpack(buffer))
+        return layout.columns(
+            layout.struct.unpack_from(buffer, start + index * self._stride)
+            for index in range(self._count)
+        )
+
+
+class StringTable(Mapping[int, str]):  # pylint: disable=too-many-instance-attributes
+    """
+    A lazy, read-only view over a table of null-terminated strings, looked up by their offset in the table.
+
+    The table is read with a single read on first use, and an index of every string's (start, end) is built once.
+    Strings are decoded on access and interned; repeated strings share a single object.
+
+    Offsets that point into the middle of a string (e.g. a shared suffix) resolve to the rest of that string,
+    but are not included when iterating.
+
+    :param serializer: The serializer to read from.
+    :type serializer: BinarySerializer
+
+    :param offset: The offset of the table.
+    :type offset: int
+
+    :param size: The size of the table in bytes.
+    :type size: int
+
+    :param encoding: The encoding of the strings. By default, 'ascii'.
+    :type encoding: str, optional
+    """
+
+    def __init__(
+        self,
+        serializer: BinarySerializer,
+        offset: int,
+        size: int,
+        *,
+        encoding: str = "ascii",
+    ):
+        if size < 0:
+            raise RelicToolError(f"String table size cannot be negative; got '{size}'")
+        self._serializer = serializer
+        self._offset = offset
+        self._size = size
+        self._encoding = encoding
+        self._terminator = _CStringOps.terminator(encoding)
+        self._blob: Optional[bytes] = None
+        self._starts: Optional[array.array[int]] = None
+        self._ends: Optional[array.array[int]] = None
+        self._decoded: Dict[int, str] = {}
+        self._interned: Dict[bytes, str] = {}
+
+    @property
+    def encoding(self) -> str:
+        """
+        The encoding of the strings.
+        """
+        return self._encoding
+
+    def _get_blob(self) -> bytes:
+        if self._blob is None:
+            self._blob = self._serializer.read_bytes(self._offset, self._size)
+        return self._blob
+
+    def _get_index(self) -> Tuple[array.array[int], array.array[int]]:
+        if self._starts is None or self._ends is None:
+            blob = self._get_blob()
+            terminator = self._terminator
+            width = len(terminator)
+            starts, ends = array.array("q"), array.array("q")
+            start = 0
+            index = blob.find(terminator)
+            while index != -1:
+                if (index - start) % width != 0:  # misaligned match
+                    index = blob.find(terminator, index + 1)
+                    continue
+                starts.append(start)
+                ends.append(index)
+                start = index + width
+                index = blob.find(terminator, start)
+            self._starts, self._ends = starts, ends
+        return self._starts, self._ends
+
+    def span(self, offset: int) -> Tuple[int, int]:
+        """
+        Get the (start, end) of the string at an offset, excluding the terminator.
+
+        :param offset: The offset of the string, relative to the table.
+        :type offset: int
+
+        :raises KeyError: The offset is outside the table.
+        :raises RelicToolError: The offset is past the last terminator in the table.
+
+        :rtype: Tuple[int, int]
+        """
+        if not 0 <= offset < self._size:
+            raise KeyError(offset)
+        starts, ends = self._get_index()
+        index = bisect.bisect_right(starts, offset) - 1
+        if index < 0 or offset > ends[index]:
+            raise RelicToolError(
+                f"Unterminated C-String @{offset} in string table @{self._offset}"
+            )
+        return offset, ends[index]
+
+    def __getitem__(self, offset: int) -> str:
+        value = self._decoded.get(offset)
+        if value is not None:
+            return value
+        start, end = self.span(offset)
+        raw = self._get_blob()[start:end]
+        value = self._interned.get(raw)
+        if value is None:
+            value = self._interned[raw] = raw.decode(self._encoding)
+        self._decoded[offset] = value
+        return value
+
+    def __iter__(self) -> Iterator[int]:
+        starts, _ = self._get_index()
+        return iter(starts)
+
+    def __len__(self) -> int:
+        starts, _ = self._get_index()
+        return len(starts)
+
+    def __contains__(self, offset: object) -> bool:
+        if not isinstance(offset, int):
+            return False
+        try:
+            self.span(offset)
+        except (KeyError, RelicToolError):
+            return False
+        return True
+
+    def invalidate(self) -> None:
+        """
+        Discard the loaded table, index and decoded strings; the table is re-read on next use.
+        """
+        self._blob = None
+        self._starts = None
+        self._ends = None
+        self._decoded.clear()
+        self._interned.clear()
+
+
+class StringPoolBuilder:
+    """
+    Builds a table of deduplicated null-terminated strings, to be written with a single write.
+
+    Each unique string is encoded once; with suffix sharing, a string which is the tail of another string
+    (e.g. 'data' and 'texturedata') is not written at all, and instead points into the longer string.
+
+    The offsets produced are relative to the start of the table; and can be read back with a StringTable.
+
+    :param encoding: The encoding of the strings. By default, 'ascii'.
+    :type encoding: str, optional
+
+    :param share_suffixes: Whether strings that are suffixes of other strings should share their bytes.
+    :type share_suffixes: bool, optional
+    """
+
+    def __init__(self, encoding: str = "ascii", *, share_suffixes: bool = False):
+        self._encoding = encoding
+        self._share_suffixes = share_suffixes
+        self._terminator = _CStringOps.terminator(encoding)
+        self._encoded: Dict[str, bytes] = {}
+
+    @property
+    def encoding(self) -> str:
+        """
+        The encoding of the strings.
+        """
+        return self._encoding
+
+    def add(self, value: str) -> None:
+        """
+        Add a string to the pool; adding a string already in the pool does nothing.
+        """
+        if value not in self._encoded:
+            self._encoded[value] = value.encode(self._encoding) + self._terminator
+
+    def extend(self, values: Iterable[str]) -> None:
+        """
+        Add many strings to the pool.
+        """
+        for value in values:
+            self.add(value)
+
+    def __len__(self) -> int:
+        return len(self._encoded)
+
+    def __contains__(self, value: object) -> bool:
+        return value in self._encoded
+
+    def _get_owners(self) -> Dict[str, str]:
+        # Maps each string to the string whose bytes it is written in (possibly itself)
+        encoded = self._encoded
+        if not self._share_suffixes:
+            return {value: value for value in encoded}
+        owners: Dict[str, str] = {}
+        root: Optional[str] = None
+        # Sorting on the reversed bytes places every suffix directly after a string that ends with it
+        for value in sorted(encoded, key=lambda v: encoded[v][::-1], reverse=True):
+            if root is not None and encoded[root].endswith(encoded[value]):
+                owners[value] = root
+            else:
+                owners[value] = root = value
+        return owners
+
+    def build(self) -> Tuple[bytes, Dict[str, int]]:
+        """
+        Build the table.
+
+        Strings are laid out in the order they were first added.
+
+        :rtype: Tuple[bytes, Dict[str, int]]
+        :returns: The encoded table, and the offset of each string within it.
+        """
+        encoded = self._encoded
+        owners = self._get_owners()
+        parts: List[bytes] = []
+        offsets: Dict[str, int] = {}
+        size = 0
+        for value, raw in encoded.items():
+            if owners[value] == value:
+                offsets[value] = size
+                parts.append(raw)
+                size += len(raw)
+        for value, owner in owners.items():
+            if owner != value:
+                offsets[value] = (
+                    offsets[owner] + len(encoded[owner]) - len(encoded[value])
+                )
+        return b"".join(parts), {value: offsets[value] for value in encoded}
+
+    def write(self, serializer: BinarySerializer, offset: int) -> Dict[str, int]:
+        """
+        Build the table and write it with a single write.
+
+        :param serializer: The serializer to write to.
+        :type serializer: BinarySerializer
+
+        :param offset: The offset to write the table at.
+        :type offset: int
+
+        :rtype: Dict[str, int]
+        :returns: The offset of each string, relative to the start of the table.
+        """
+        buffer, offsets = self.build()
+        serializer.write_bytes(buffer, offset)
+        return offsets
@@ -0,0 +1,123 @@
+"""
+Micro-benchmarks for relic.core.lazyio's per-field decoding.
+
+Not collected by pytest; run directly:
+    python -m tests.benchmarks.bench_lazyio
+"""
+
+import timeit
+from io import BytesIO
+from typing import Callable, List, Tuple
+
+from relic.core.lazyio import (
+    BinaryProperty,
+    BinaryProxySerializer,
+    BinarySerializer,
+    IntConverter,
+    _IntOps,
+)
+
+_FIELDS = 4096
+_REPEAT = 5
+
+
+def _per_field_ns(func: Callable[[], object], fields: int) -> float:
+    number = 10
+    best = min(timeit.repeat(func, number=number, repeat=_REPEAT))
+    return best / (number * fields) * 1e9
+
+
+def _benchmarks() -> List[Tuple[str, Callable[[], object]]]:
+    buffer = bytes(range(256)) * (_FIELDS * 4 // 256)
+    fields = [buffer[i : i + 4] for i in range(0, len(buffer), 4)]
+    serializer = BinarySerializer(BytesIO(buffer), cacheable=True)
+    uint32 = serializer.uint32
+    codec = serializer.codecs["u32", "little"]
+
+    def generic_unpack() -> None:
+        # The int.from_bytes path all sized ops used before precompiled codecs
+        for field in fields:
+            _IntOps.unpack_int(field, 4, "little", False)
+
+    def sized_unpack() -> None:
+        for field in fields:
+            uint32.unpack(field)
+
+    def codec_unpack() -> None:
+        for offset in range(0, len(buffer), 4):
+            codec.unpack_from(buffer, offset)
+
+    def sized_read() -> None:
+        for offset in range(0, len(buffer), 4):
+            uint32.read(offset)
+
+    def cursor_read() -> None:
+        cursor = serializer.cursor()
+        for _ in range(_FIELDS):
+            cursor.uint32()
+
+    def array_read() -> None:
+        serializer.read_array(0, _FIELDS, "u32")
+
+    def array_read_swapped() -> None:
+        serializer.read_array(0, _FIELDS, "u32", "big")
+
+    return [
+        ("int.from_bytes (generic _IntOps)", generic_unpack),
+        ("serializer.uint32.unpack", sized_unpack),
+        ("serializer.codecs[u32].unpack_from", codec_unpack),
+        ("serializer.uint32.read (cached)", sized_read),
+        ("serializer.cursor().uint32", cursor_read),
+        ("serializer.read_array(u32)", array_read),
+        ("serializer.read_array(u32, big)", array_read_swapped),
+    ]
+
+
+class _Header(BinaryProxySerializer):
+    size = BinaryProperty(4, 4, IntConverter(4))
+
+
+class _StreamHeader:
+    """A header whose '_serializer' is a plain stream; properties go through a BinaryWindow"""
+
+    size = BinaryProperty(4, 4, IntConverter(4))
+
+    def __init__(self, stream: BytesIO):
+        self._serializer = stream
+
+
+def _property_benchmarks() -> List[Tuple[str, Callable[[], object]]]:
+    header = _Header(BytesIO(bytes(64)))
+    stream_header = _StreamHeader(BytesIO(bytes(64)))
+
+    def get(obj: object) -> Callable[[], object]:
+        def wrapped() -> None:
+            for _ in range(_FIELDS):
+                _ = obj.size  # type: ignore[attr-defined]
+
+        return wrapped
+
+    def set_(obj: object) -> Callable[[], object]:
+        def wrapped() -> None:
+            for value in range(_FIELDS):
+                obj.size = value  # type: ignore[attr-defined]
+
+        return wrapped
+
+    return [
+        ("BinaryProperty get (serializer)", get(header)),
+        ("BinaryProperty get (window)", get(stream_header)),
+        ("BinaryProperty set (serializer)", set_(header)),
+        ("BinaryProperty set (window)", set_(stream_header)),
+    ]
+
+
+def main() -> None:
+    for name, func in _benchmarks():
+        print(f"{name:<40} {_per_field_ns(func, _FIELDS):8.1f} ns/field")
+    for name, func in _property_benchmarks():
+        print(f"{name:<40} {_per_field_ns(func, _FIELDS):8.1f} ns/op")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,28 @@
+import array
+import bz2
 import contextlib
+import gzip
 import io
+import lzma
 import os
+import random
+import struct
+import sys
+import tempfile
 import zlib
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from io import BytesIO
-from typing import BinaryIO, Optional, Any, Tuple, TypeVar, Type, Generator, Union
+from typing import BinaryIO, Optional, Any, Tuple, TypeVar, Type, Generator, Union, List
 
 import pytest
 
-from relic.core.errors import RelicSerializationSizeError, RelicToolError, MismatchError
+from relic.core.errors import (
+    RelicSerializationSizeError,
+    RelicToolError,
+    MismatchError,
+    MagicMismatchError,
+)
 from relic.core.lazyio import (
     BinaryWrapper,
     BinarySerializer,
@@ -25,12 +39,27 @@ from relic.core.lazyio import (
     get_proxy,
     tell_end,
     ZLibFileReader,
+    ZLibIndex,
     BinaryProxy,
     is_proxy,
     _SizedIntOps,
     _IntOps,
     _CStringOps,
+    _PositionalIO,
+    _FloatOps,
+    _array_typecode,
+    MappedSource,
+    ByteCache,
+    CacheStats,
+    StructLayout,
+    StructField,
+    RecordArray,
+    CachedBinaryProperty,
+    StringTable,
+    StringPoolBuilder,
+    BinaryCursor,
 )
+from tests.util import TempFileHandle
 
 _TestBinaryWrapper_AutoNamed = [BytesIO()]
 
@@ -204,6 +233,169 @@ class TestBinaryProperty:
                 assert read == buffer
 
 
+class _StreamHeader:
+    size = BinaryProperty(1, 4, IntConverter(4))
+
+    def __init__(self, stream: BinaryIO):
+        self._serializer = stream
+
+
+class TestBinaryPropertyFastPath:
+    def test_no_window(self, monkeypatch):
+        monkeypatch.setattr(BinaryProperty, "_window", None)  # fails if used
+        with BytesIO(b"\0" * 5) as h:
+            header = _CachedHeader(h)
+            prop = BinaryProperty(1, 4, IntConverter(4))
+            prop.__set__(header, 1234)
+            assert prop.__get__(header, None) == 1234
+            assert h.getvalue() == b"\0" + (1234).to_bytes(4, "little")
+
+    def test_stream(self):
+        with BytesIO(b"\0" * 5) as h:
+            header = _StreamHeader(h)
+            header.size = 1234
+            assert header.size == 1234
+            assert h.getvalue() == b"\0" + (1234).to_bytes(4, "little")
+
+    def test_write_too_large(self):
+        with BytesIO(b"\0" * 8) as h:
+            prop = BinaryProperty(1, 2, ByteConverter)
+            with pytest.raises(RelicToolError):
+                prop.__set__(BinaryProxySerializer(h), b"\1\2\3")
+
+    def test_read_clamped(self):
+        with BytesIO(b"\0\1\2") as h:
+            prop = BinaryProperty(1, 4, ByteConverter)
+            assert prop.__get__(BinaryProxySerializer(h), None) == b"\1\2"
+
+
+class _CachedHeader(BinaryProxySerializer):
+    size = CachedBinaryProperty(0, 4, IntConverter(4))
+    name = CachedBinaryProperty(4, 8, CStringConverter(padding="\0", size=8))
+
+
+class TestCachedBinaryProperty:
+    @contextlib.contextmanager
+    def _get_header(self):
+        with _CountingBytesIO(b"\x10\0\0\0" + b"bob\0\0\0\0\0") as h:
+            yield h, _CachedHeader(h)
+
+    def test_get_cached(self):
+        with self._get_header() as (h, header):
+            assert [header.size for _ in range(10)] == [16] * 10
+            assert header.name == "bob"
+            assert h.reads == 2
+
+    def test_set(self):
+        with self._get_header() as (h, header):
+            header.name = "lob\0"
+            assert header.name == "lob"
+            assert h.getvalue()[4:] == b"lob\0\0\0\0\0"
+            assert h.reads == 0
+
+    def test_invalidate(self):
+        with self._get_header() as (h, header):
+            assert header.size == 16
+            h.seek(0)
+            h.write(b"\x20")
+            assert header.size == 16
+            _CachedHeader.size.invalidate(header)
+            assert header.size == 32
+            assert header.name == "bob"
+            h.seek(4)
+            h.write(b"law")
+            CachedBinaryProperty.invalidate_all(header)
+            assert (header.size, header.name) == (32, "law")
+            assert h.reads == 5
+
+
+class _PrefetchedHeader(BinaryProxySerializer):
+    __header_span__ = True
+    version = BinaryProperty(4, 2, IntConverter(2))
+    size = BinaryProperty(6, 4, IntConverter(4))
+    name = CachedBinaryProperty(10, 6, CStringConverter(padding="\0", size=6))
+
+
+class _DeclaredHeader(_PrefetchedHeader):
+    __header_span__ = (0, 32)
+
+
+class TestHeaderSnapshot:
+    _BUFFER = b"MAGI" + b"\2\0" + b"\x40\0\0\0" + b"bob\0\0\0" + b"\xff" * 16
+
+    @contextlib.contextmanager
+    def _get_header(self, cls=_PrefetchedHeader):
+        with _CountingBytesIO(self._BUFFER) as h:
+            yield h, cls(h)
+
+    def test_span(self):
+        assert _PrefetchedHeader._get_header_span() == (4, 12)
+        assert _DeclaredHeader._get_header_span() == (0, 32)
+        assert BinaryProxySerializer._get_header_span() is None
+
+    @pytest.mark.parametrize("cls", [_PrefetchedHeader, _DeclaredHeader])
+    def test_single_read(self, cls):
+        with self._get_header(cls) as (h, header):
+            assert h.reads == 0
+            assert (header.version, header.size, header.name) == (2, 64, "bob")
+            assert header.version == 2
+            assert h.reads == 1
+
+    def test_write_flush(self):
+        with self._get_header() as (h, header):
+            header.version = 3
+            header.name = "law"
+            header.size = 65
+            assert (header.version, header.size, header.name) == (3, 65, "law")
+            assert h.getvalue() == self._BUFFER
+            header.flush()
+            assert h.getvalue()[4:16] == b"\3\0\x41\0\0\0law\0\0\0"
+            assert h.getvalue()[16:] == self._BUFFER[16:]
+            assert h.reads == 1
+
+    def test_truncated(self):
+        # Properties past the end of the stream are not in the snapshot; they are read (and clamped) as usual
+        with _CountingBytesIO(self._BUFFER[:13]) as h:
+            header = _PrefetchedHeader(h)
+            assert (header.version, header.size) == (2, 64)
+            with pytest.raises(RelicSerializationSizeError):
+                _ = header.name
+            header.flush()  # nothing written
+            assert h.getvalue() == self._BUFFER[:13]
+
+    def test_no_span(self):
+        with BytesIO(self._BUFFER) as h:
+            proxy = BinaryProxySerializer(h)
+            proxy.flush()
+            proxy.invalidate_header()
+            assert proxy._get_header() is None
+
+    def test_close(self):
+        with _CountingBytesIO(self._BUFFER) as h:
+            with _PrefetchedHeader(h) as header:
+                header.version = 3
+                assert h.getvalue() == self._BUFFER
+            assert h.getvalue()[4:6] == b"\3\0"
+            assert not h.closed  # the serializer does not own the stream
+            _PrefetchedHeader(h).close()  # no header loaded; nothing to write
+
+    def test_invalidate(self):
+        with self._get_header() as (h, header):
+            assert header.version == 2
+            h.seek(4)
+            h.write(b"\7")
+            assert header.version == 2
+            header.invalidate_header()
+            assert header.version == 7
+
+    def test_past_end(self):
+        with BytesIO(self._BUFFER[:8]) as h:
+            header = _PrefetchedHeader(h)
+            assert header.version == 2
+            header.size = 1  # outside the loaded header; written directly
+            assert h.getvalue()[6:] == b"\1\0\0\0"
+
+
 @pytest.mark.parametrize(
     ["value", "err"], [(4, ValueError("Blah")), ("Rugrats", TypeError("Pickles"))]
 )
@@ -414,6 +606,213 @@ class TestZlibFileReader:
             assert writable is False
 
 
+class TestZlibFileReaderIncremental:
+    # Incompressible data; so peeking must not read (or inflate) the whole stream
+    _BUFFER = random.Random(40000).randbytes(256 * 1024)
+
+    def test_peek(self):
+        with BytesIO(_zcomp(self._BUFFER)) as h:
+            reader = ZLibFileReader(h, chunk_size=4 * 1024)
+            assert reader.read(16) == self._BUFFER[:16]
+            assert h.tell() <= 4 * 1024
+            assert len(reader._buffer) < 16 * 1024
+
+    def test_resume(self):
+        with BytesIO(_zcomp(self._BUFFER)) as h:
+            reader = ZLibFileReader(h, chunk_size=4 * 1024)
+            parts = [reader.read(10_000) for _ in range(10)]
+            assert b"".join(parts) == self._BUFFER[:100_000]
+            reader.seek(200_000)
+            assert reader.read(16) == self._BUFFER[200_000:200_016]
+            assert h.tell() < len(_zcomp(self._BUFFER))
+            assert reader.read() == self._BUFFER[200_016:]
+            assert reader.read(16) == b""
+
+    def test_truncated(self):
+        # A truncated stream ends where its input runs out
+        compressed = _zcomp(self._BUFFER)
+        with BytesIO(compressed[: len(compressed) // 2]) as h:
+            reader = ZLibFileReader(h, chunk_size=4 * 1024)
+            buffer = reader.read()
+            assert 0 < len(buffer) < len(self._BUFFER)
+            assert buffer == self._BUFFER[: len(buffer)]
+            assert reader.read(16) == b""
+
+    def test_seek_end(self):
+        with BytesIO(_zcomp(self._BUFFER) + b"Trailing") as h:
+            reader = ZLibFileReader(h, chunk_size=4 * 1024)
+            assert reader.seek(0, os.SEEK_END) == len(self._BUFFER)
+            reader.seek(-16, os.SEEK_CUR)
+            assert reader.read() == self._BUFFER[-16:]
+
+
+def _zcomp_flushed(b: bytes, every: int, mode: int = zlib.Z_SYNC_FLUSH) -> bytes:
+    compressor = zlib.compressobj()
+    parts = []
+    for i in range(0, len(b), every):
+        parts.append(compressor.compress(b[i : i + every]))
+        parts.append(compressor.flush(mode))
+    parts.append(compressor.flush())
+    return b"".join(parts)
+
+
+class TestZLibIndex:
+    _WORDS = [b"Blood", b"For", b"The", b"Blood", b"God", b"Skulls", b"Throne"]
+    _BUFFER = b"".join(random.Random(25).choices(_WORDS, k=256 * 1024))
+    _INTERVAL = 64 * 1024
+    _CHUNK = 1024
+
+    def _check(self, reader: ZLibFileReader, offsets: List[int]):
+        for offset in offsets:
+            reader.seek(offset)
+            assert reader.read(100) == self._BUFFER[offset : offset + 100]
+
+    def test_in_memory(self):
+        index = ZLibIndex(self._INTERVAL)
+        with BytesIO(_zcomp(self._BUFFER)) as h:
+            reader = ZLibFileReader(h, chunk_size=self._CHUNK, index=index)
+            assert reader.seek(0, os.SEEK_END) == len(self._BUFFER)
+            assert index.size == len(self._BUFFER)
+            assert len(index) >= len(self._BUFFER) // (2 * self._INTERVAL)
+            # The whole stream was scanned, but only output near the end was kept
+            assert len(reader._buffer) < 2 * self._INTERVAL + 32 * 1024
+            self._check(reader, [len(self._BUFFER) - 200, 1000, 700_000, 5, 300_000])
+            assert len(reader._buffer) < 3 * self._INTERVAL + 32 * 1024
+
+    def test_seek_backwards(self):
+        index = ZLibIndex(self._INTERVAL)
+        with _CountingBytesIO(_zcomp(self._BUFFER)) as h:
+            reader = ZLibFileReader(h, chunk_size=self._CHUNK, index=index)
+            reader.seek(0, os.SEEK_END)
+            scan = h.reads
+            self._check(reader, [len(self._BUFFER) // 2])
+            # Resumed from a checkpoint; not from the start
+            assert h.reads - scan < scan // 4
+
+    @pytest.mark.parametrize("mode", [zlib.Z_SYNC_FLUSH, zlib.Z_FULL_FLUSH])
+    def test_save_load(self, mode: int):
+        compressed = _zcomp_flushed(self._BUFFER, 16 * 1024, mode)
+        with BytesIO(compressed) as h:
+            index = ZLibIndex.build(h, self._INTERVAL, chunk_size=self._CHUNK)
+        with BytesIO() as sidecar:
+            assert index.save(sidecar) > 0
+            sidecar.seek(0)
+            loaded = ZLibIndex.load(sidecar)
+        assert loaded.size == len(self._BUFFER)
+        assert loaded.interval == self._INTERVAL
+        assert len(loaded) == index.save(BytesIO())
+        with _CountingBytesIO(b"Head" + compressed) as h:
+            h.seek(4)
+            reader = ZLibFileReader(h, chunk_size=self._CHUNK, index=loaded)
+            verified = h.reads  # the checksum of the stream
+            assert reader.seek(0, os.SEEK_END) == len(self._BUFFER)
+            assert h.reads == verified
+            self._check(reader, [len(self._BUFFER) - 200, 200_000, 10])
+            assert h.reads - verified < len(compressed) // self._CHUNK // 2
+
+    def test_false_markers(self):
+        # Stored blocks copy the markers verbatim; they are not block boundaries and must be rejected
+        rng = random.Random(40000)
+        buffer = b"".join(rng.randbytes(1000) + b"\x00\x00\xff\xff" for _ in range(300))
+        compressed = zlib.compress(buffer, 0)
+        with BytesIO(compressed) as h:
+            index = ZLibIndex.build(h, 16 * 1024, chunk_size=self._CHUNK)
+        assert len(index) > 0
+        assert index.save(BytesIO()) == 0
+
+    @pytest.mark.parametrize("persisted", [False, True])
+    @pytest.mark.parametrize("mode", [None, zlib.Z_SYNC_FLUSH, zlib.Z_FULL_FLUSH])
+    def test_random_access(self, mode: Optional[int], persisted: bool):
+        # Mixed incompressible and compressible data; so checkpoints land both with and without pending input
+        rng = random.Random(3)
+        buffer = b"".join(
+            rng.randbytes(15000) if i % 3 == 0 else b"".join(rng.choices(self._WORDS, k=3000))
+            for i in range(150)
+        )
+        compressed = _zcomp(buffer) if mode is None else _zcomp_flushed(buffer, 50_000, mode)
+        index = ZLibIndex(self._INTERVAL)
+        if persisted:
+            with BytesIO(compressed) as h:
+                with BytesIO() as sidecar:
+                    ZLibIndex.build(h, self._INTERVAL).save(sidecar)
+                    sidecar.seek(0)
+                    index = ZLibIndex.load(sidecar)
+        with BytesIO(compressed) as h:
+            reader = ZLibFileReader(h, chunk_size=4 * 1024, index=index)
+            for _ in range(200):
+                offset, size = rng.randrange(len(buffer)), rng.randrange(1, 20000)
+                reader.seek(offset)
+                assert reader.read(size) == buffer[offset : offset + size]
+
+    def test_load_out_of_order(self):
+        # Entries at or before an earlier entry are ignored; lookups rely on the offsets being sorted
+        compressed = _zcomp_flushed(self._BUFFER, 16 * 1024)
+        with BytesIO(compressed) as h:
+            index = ZLibIndex.build(h, self._INTERVAL)
+        with BytesIO() as sidecar:
+            count = index.save(sidecar)
+            buffer = sidecar.getvalue()
+        assert count > 0
+        header = list(ZLibIndex._HEADER.unpack_from(buffer))
+        _, _, window_size = ZLibIndex._ENTRY.unpack_from(buffer, ZLibIndex._HEADER.size)
+        first = buffer[ZLibIndex._HEADER.size : ZLibIndex._HEADER.size + ZLibIndex._ENTRY.size + window_size]
+        header[-1] = count + 1
+        loaded = ZLibIndex.load(BytesIO(ZLibIndex._HEADER.pack(*header) + buffer[ZLibIndex._HEADER.size :] + first))
+        assert len(loaded) == count
+        with BytesIO(compressed) as h:
+            reader = ZLibFileReader(h, index=loaded)
+            assert reader.index is loaded
+            self._check(reader, [300_000, 10])
+
+    def test_wrong_stream(self):
+        compressed = _zcomp_flushed(self._BUFFER, 16 * 1024, zlib.Z_SYNC_FLUSH)
+        with BytesIO(compressed) as h:
+            index = ZLibIndex.build(h, self._INTERVAL)
+        assert index._in_size == len(compressed)
+        with BytesIO() as sidecar:
+            index.save(sidecar)
+            sidecar.seek(0)
+            loaded = ZLibIndex.load(sidecar)
+        other = _zcomp_flushed(self._BUFFER[::-1], 16 * 1024, zlib.Z_SYNC_FLUSH)
+        for stream in (other, compressed[:-1], compressed[:-4] + bytes(4)):
+            with pytest.raises(MismatchError):
+                ZLibFileReader(BytesIO(stream), index=loaded)
+        # Trailing data is not part of the stream
+        reader = ZLibFileReader(BytesIO(compressed + b"Tail"), index=loaded)
+        assert reader.read(100) == self._BUFFER[:100]
+
+    def test_wrong_stream_partial(self):
+        # Only the head of the stream is known before it has been decompressed to the end
+        index = ZLibIndex(self._INTERVAL)
+        reader = ZLibFileReader(BytesIO(_zcomp(self._BUFFER)), index=index)
+        assert reader.read(100) == self._BUFFER[:100]
+        assert index._in_size is None
+        with pytest.raises(MismatchError):
+            ZLibFileReader(BytesIO(_zcomp(self._BUFFER[::-1])), index=index)
+
+    def test_save_unflushed(self):
+        with BytesIO(_zcomp(self._BUFFER)) as h:
+            index = ZLibIndex.build(h, self._INTERVAL)
+        with BytesIO() as sidecar:
+            assert len(index) > 0
+            assert index.save(sidecar) == 0
+
+    def test_load_errors(self):
+        with BytesIO() as sidecar:
+            ZLibIndex(self._INTERVAL).save(sidecar)
+            buffer = sidecar.getvalue()
+        with pytest.raises(MagicMismatchError):
+            ZLibIndex.load(BytesIO(b"ZZZZ" + buffer[4:]))
+        with pytest.raises(MismatchError):
+            ZLibIndex.load(BytesIO(buffer[:4] + b"\xff" + buffer[5:]))
+        with pytest.raises(RelicSerializationSizeError):
+            ZLibIndex.load(BytesIO(buffer[:-1]))
+
+    def test_bad_interval(self):
+        with pytest.raises(RelicToolError):
+            ZLibIndex(0)
+
+
 def test_binary_proxy_serializer():
     with BytesIO() as handler:
         proxy = BinaryProxySerializer(handler)
@@ -737,6 +1136,76 @@ class TestSizedIntOps:
                 assert result2 == buffer
 
 
+class TestStructCodecs:
+    @pytest.mark.parametrize(
+        ["attr", "value", "size"],
+        [
+            ("uint8", 200, 1),
+            ("int8", -100, 1),
+            ("uint64", 2**63 + 5, 8),
+            ("int64", -(2**40), 8),
+        ],
+    )
+    @pytest.mark.parametrize("byteorder", ["little", "big"])
+    def test_roundtrip(self, attr: str, value: int, size: int, byteorder: str):
+        with BytesIO(b"\0" * (size + 1)) as h:
+            ops = getattr(BinarySerializer(h), attr)
+            ops.write(value, 1, byteorder=byteorder)
+            assert h.getvalue()[1:] == value.to_bytes(size, byteorder, signed=value < 0)  # type: ignore
+            assert ops.read(1, byteorder=byteorder) == value
+
+    def test_codec_table(self):
+        codecs = BinarySerializer.codecs
+        assert len(codecs) == 20
+        assert codecs["u32", "little"].unpack(b"\1\0\0\0") == (1,)
+        assert codecs["i16", "big"].unpack(b"\xff\xfe") == (-2,)
+        assert codecs["f64", "little"].size == 8
+
+    def test_overflow(self):
+        with BytesIO() as h:
+            with pytest.raises(OverflowError):
+                BinarySerializer(h).uint16.pack(2**16)
+
+    def test_short_buffer(self):
+        with BytesIO() as h:
+            assert BinarySerializer(h).uint32.unpack(b"\1\1") == 0x0101
+
+    @pytest.mark.parametrize("byteorder", ["little", "big"])
+    def test_no_codec(self, byteorder: str):
+        # Sizes without a struct format use int.from_bytes/int.to_bytes
+        with BytesIO() as h:
+            ops = _SizedIntOps(BinarySerializer(h), 3, True)
+            buffer = ops.pack(-2, byteorder=byteorder)
+            assert buffer == (-2).to_bytes(3, byteorder, signed=True)  # type: ignore
+            assert ops.unpack(buffer, byteorder=byteorder) == -2
+
+
+class TestFloatOps:
+    @pytest.mark.parametrize(["attr", "size"], [("float32", 4), ("float64", 8)])
+    @pytest.mark.parametrize("byteorder", ["little", "big"])
+    def test_roundtrip(self, attr: str, size: int, byteorder: str):
+        fmt = ("<" if byteorder == "little" else ">") + ("f" if size == 4 else "d")
+        with BytesIO(b"\0" * (size + 1)) as h:
+            ops = getattr(BinarySerializer(h), attr)
+            ops.write(1.5, 1, byteorder=byteorder)
+            assert h.getvalue()[1:] == struct.pack(fmt, 1.5)
+            assert ops.read(1, byteorder=byteorder) == 1.5
+            ops.write_be(-0.25, 1)
+            assert ops.read_be(1) == -0.25
+            ops.write_le(2.0, 1)
+            assert ops.read_le(1) == 2.0
+
+    def test_unpack_mismatch(self):
+        with BytesIO() as h:
+            with pytest.raises(MismatchError):
+                BinarySerializer(h).float32.unpack(b"\0\0")
+
+    def test_unsupported_size(self):
+        with BytesIO() as h:
+            with pytest.raises(RelicToolError):
+                _FloatOps(BinarySerializer(h), 2)
+
+
 class TestIntOps:
     def test_read_size_none(self):
         with BytesIO() as h:
@@ -846,6 +1315,83 @@ class TestBinaryWindow:
             result = window.read(1)
             assert result == b"x"
 
+    def test_nested_flattened(self):
+        buffer = b"archive|folder|file|chunk"
+        with BytesIO(buffer) as h:
+            window = BinaryWindow(h, 8, 17)
+            for start in (7, 5, 1):
+                window = BinaryWindow(window, start, 32)
+            assert window._handle is h
+            assert window._start == 21
+            assert window._size == 4  # clamped to the parent's bounds
+            assert window.read() == b"hunk"
+
+    def test_nested_wrapper_flattened(self):
+        with BytesIO(b"\0\0xd") as h:
+            window = BinaryWindow(BinaryWrapper(h, name="wrapped"), 2, 2)
+            assert window._handle is h
+            assert window.name == "wrapped"
+            assert window.read() == b"xd"
+
+    def test_nested_name(self):
+        with BytesIO(b"\0\0xd") as h:
+            window = BinaryWindow(BinaryWrapper(h, name="wrapped"), 2, 2, name="window")
+            assert window._handle is h
+            assert window.name == "window"
+
+    def test_nested_write_bounds(self):
+        with BytesIO(b"\0" * 8) as h:
+            window = BinaryWindow(BinaryWindow(h, 2, 4), 1, 8)
+            with pytest.raises(RelicToolError):
+                window.write(b"\1" * 4)
+            window.write(b"\1" * 3)
+            assert h.getvalue() == b"\0\0\0\1\1\1\0\0"
+
+    def test_sequential_skips_seek(self):
+        with _SeekCountingBytesIO(b"0123456789") as h:
+            window = BinaryWindow(h, 2, 6)
+            assert [window.read(2) for _ in range(3)] == [b"23", b"45", b"67"]
+            assert h.seeks == 1
+
+    def test_foreign_seek(self):
+        with _SeekCountingBytesIO(b"0123456789") as h:
+            window = BinaryWindow(h, 2, 6)
+            assert window.read(2) == b"23"
+            h.seek(0)
+            assert window.read(2) == b"45"
+            window.write(b"xy")
+            assert h.getvalue() == b"012345xy89"
+            assert h.seeks == 3
+
+    @pytest.mark.parametrize("nested", [True, False])
+    def test_owned_skips_tell(self, nested: bool):
+        # Nothing else may move a handle the window owns; so its known position is trusted
+        h = _SeekCountingBytesIO(b"0123456789")
+        parent = BinaryWindow(h, 1, 8, close_parent=True) if nested else h
+        window = BinaryWindow(parent, 1 if nested else 2, 6, close_parent=True)
+        assert [window.read(2) for _ in range(3)] == [b"23", b"45", b"67"]
+        assert (h.seeks, h.tells) == (1, 0)
+        window.close()
+        assert h.closed
+
+    def test_nested_not_owned(self):
+        with _SeekCountingBytesIO(b"0123456789") as h:
+            window = BinaryWindow(BinaryWindow(h, 1, 8), 1, 6, close_parent=True)
+            assert window.read(2) == b"23"
+            h.seek(0)
+            assert window.read(2) == b"45"
+
+    @pytest.mark.parametrize("close_parent", [True, False])
+    def test_nested_close(self, close_parent: bool):
+        with BytesIO(b"\0" * 8) as h:
+            parent = BinaryWindow(h, 2, 4)
+            window = BinaryWindow(parent, 1, 2, close_parent=close_parent)
+            window.close()
+            assert parent.closed is close_parent
+            assert h.closed is False
+            parent.close()
+            assert window.closed is True
+
 
 class TestCStringOps:
     @contextlib.contextmanager
@@ -902,3 +1448,1496 @@ class TestCStringOps:
         expected = buffer.encode("ascii")
         result = _CStringOps.pack(buffer, "ascii", None)
         assert result == expected
+
+    @pytest.mark.parametrize("encoding", ["ascii", "utf-8", "utf-16-le", "utf-32-le"])
+    def test_read_terminated(self, encoding: str):
+        value = "ForTheEmperor"
+        terminator = _CStringOps.terminator(encoding)
+        buffer = value.encode(encoding) + terminator + b"Trailing"
+        with self.get_ops(buffer) as (_, ops):
+            result, consumed = ops.read_terminated(0, encoding=encoding)
+            assert result == value
+            assert consumed == len(value.encode(encoding)) + len(terminator)
+
+    def test_read_terminated_misaligned(self):
+        # Encodes to 00 01 01 00 00 01 00 00; the 00 00 straddling two characters must not match
+        value = "\u0100\u0001\u0100"
+        buffer = value.encode("utf-16-le") + b"\0\0"
+        with self.get_ops(buffer) as (_, ops):
+            assert ops.read_terminated(0, encoding="utf-16-le") == (value, 8)
+
+    def test_read_terminated_chunked(self):
+        value = "Blood" * 10_000
+        stream = _CountingBytesIO(value.encode("ascii") + b"\0")
+        ops = _CStringOps(BinarySerializer(stream))
+        assert ops.read_terminated(0, encoding="ascii") == (value, len(value) + 1)
+        assert stream.reads < 16  # blocks grow; not one read per byte or per 64 bytes
+
+    def test_read_terminated_mapped(self):
+        value = "ForTheEmperor"
+        with TempFileHandle() as file:
+            with file.open("wb") as h:
+                h.write(b"Skip" + value.encode("utf-16-le") + b"\0\0")
+            with MappedSource.open(file.path) as source:
+                ops = _CStringOps(BinarySerializer(source))
+                result = ops.read_terminated(4, encoding="utf-16-le")
+                assert result == (value, len(value) * 2 + 2)
+                with pytest.raises(RelicToolError):
+                    ops.read_terminated(4, encoding="utf-16-le", max_len=4)
+
+    def test_read_terminated_max_len(self):
+        with self.get_ops(b"Blood\0") as (_, ops):
+            assert ops.read_terminated(0, encoding="ascii", max_len=5) == ("Blood", 6)
+            with pytest.raises(RelicToolError):
+                ops.read_terminated(0, encoding="ascii", max_len=4)
+
+    def test_read_terminated_unterminated(self):
+        with self.get_ops(b"Blood" * 100) as (_, ops):
+            with pytest.raises(RelicToolError):
+                ops.read_terminated(0, encoding="ascii")
+
+    def test_write_terminated(self):
+        with self.get_ops() as (s, ops):
+            assert ops.write_terminated("Blood", 0, encoding="utf-16-le") == 12
+            assert s.getvalue() == "Blood\0".encode("utf-16-le")
+            assert ops.read_terminated(0, encoding="utf-16-le") == ("Blood", 12)
+
+
+class TestPositionalIO:
+    _BUFFER = b"ForTheEmperor" * 64
+
+    @contextlib.contextmanager
+    def _get_file(self, mode: str = "rb", buffering: int = -1):
+        with TempFileHandle() as file:
+            with file.open("wb") as h:
+                h.write(self._BUFFER)
+            with open(file.path, mode, buffering=buffering) as h:
+                yield h
+
+    def test_bytesio_not_positional(self):
+        with BytesIO(self._BUFFER) as h:
+            assert _PositionalIO(h).positional is False
+
+    def test_wrapper_not_positional(self):
+        with self._get_file() as h:
+            assert _PositionalIO(BinaryWrapper(h, close_parent=False)).positional is False
+
+    @pytest.mark.parametrize("module", [gzip, bz2, lzma])
+    def test_compressed_file_not_positional(self, module: Any):
+        # Compressed files expose the descriptor of the compressed file; reads must decompress
+        with TempFileHandle() as file:
+            with module.open(file.path, "wb") as h:
+                h.write(self._BUFFER)
+            with module.open(file.path, "rb") as h:
+                assert _PositionalIO(h).positional is False
+                assert BinarySerializer(h).read_bytes(0, 10) == self._BUFFER[:10]
+                assert BinaryWindow(h, 3, 10).read() == self._BUFFER[3:13]
+
+    def test_spooled_file_not_positional(self):
+        with tempfile.SpooledTemporaryFile() as h:
+            h.write(self._BUFFER)
+            assert _PositionalIO(h).positional is False
+            assert h._rolled is False  # fileno() was not called
+            assert BinarySerializer(h).read_bytes(3, 4) == self._BUFFER[3:7]
+
+    @pytest.mark.skipif(not hasattr(os, "pread"), reason="Positional IO unsupported")
+    def test_window_read_does_not_move_parent(self):
+        with self._get_file() as h:
+            h.seek(7)
+            window = BinaryWindow(h, 3, 10)
+            window.seek(2)
+            assert window.read(4) == self._BUFFER[5:9]
+            assert window.tell() == 6
+            assert h.tell() == 7
+
+    @pytest.mark.parametrize("positional", [True, False])
+    def test_parent_position(self, positional: bool):
+        # The parent's pointer is only preserved by positional IO
+        with self._get_file() as f, BytesIO(self._BUFFER) as b:
+            h = f if positional else b
+            assert _PositionalIO(h).positional is (positional and hasattr(os, "pread"))
+            h.seek(7)
+            assert BinaryWindow(h, 3, 10).read(4) == self._BUFFER[3:7]
+            assert BinarySerializer(h).read_bytes(20, 4) == self._BUFFER[20:24]
+            expected = 7 if _PositionalIO(h).positional else 24
+            assert h.tell() == expected
+
+    @pytest.mark.parametrize("buffering", [0, -1])
+    def test_window_write(self, buffering: int):
+        with self._get_file("r+b", buffering) as h:
+            window = BinaryWindow(h, 3, 4)
+            window.write(b"Hive")
+            assert window.read() == b""
+            window.seek(0)
+            assert window.read() == b"Hive"
+            h.flush()
+            h.seek(0)
+            assert h.read(8) == b"ForHivem"
+
+    @pytest.mark.parametrize("buffering", [0, -1])
+    def test_write_only(self, buffering: int):
+        with TempFileHandle() as file:
+            with open(file.path, "wb", buffering=buffering) as h:
+                h.write(self._BUFFER)  # may still be buffered
+                BinarySerializer(h).write_bytes(b"Hive", 3)
+                BinaryWindow(h, 9, 4).write(b"Ork!")
+            with file.open("rb") as h:
+                assert h.read(16) == b"ForHivempOrk!For"
+
+    @pytest.mark.parametrize("buffering", [0, -1])
+    def test_serializer_read_after_write(self, buffering: int):
+        with self._get_file("r+b", buffering) as h:
+            serializer = BinarySerializer(h)
+            serializer.write_bytes(b"Hive", 3)
+            assert serializer.read_bytes(0, 8) == b"ForHivem"
+
+    @pytest.mark.skipif(not hasattr(os, "pread"), reason="Positional IO unsupported")
+    def test_closed_handle(self):
+        with self._get_file("r+b", buffering=0) as h:
+            positional = _PositionalIO(h)
+            h.close()
+            # The descriptor may now belong to an unrelated file
+            with TempFileHandle() as file:
+                with file.open("w+b") as other:
+                    other.write(b"Heresy")
+                    other.flush()
+                    with pytest.raises(ValueError):
+                        positional.read(0, 6)
+                    with pytest.raises(ValueError):
+                        positional.readinto(memoryview(bytearray(6)), 0)
+                    with pytest.raises(ValueError):
+                        positional.write(b"Purity", 0)
+                    with pytest.raises(ValueError):
+                        positional.writev([b"Pur", b"ity"], 0)
+                    other.seek(0)
+                    assert other.read() == b"Heresy"
+
+    def test_closed_not_positional(self):
+        with self._get_file() as h:
+            h.close()
+            assert _PositionalIO(h).positional is False
+
+    def test_pipe_not_positional(self):
+        read_fd, write_fd = os.pipe()
+        with open(read_fd, "rb") as h, open(write_fd, "wb"):
+            assert _PositionalIO(h).positional is False
+
+    def test_pread_unsupported(self, monkeypatch):
+        monkeypatch.setattr("relic.core.lazyio._HAS_PREAD", False)
+        with self._get_file() as h:
+            assert _PositionalIO(h).positional is False
+
+    @pytest.mark.skipif(not hasattr(os, "pread"), reason="Positional IO unsupported")
+    def test_read(self):
+        with self._get_file() as h:
+            positional = _PositionalIO(h)
+            assert positional.read(len(self._BUFFER) - 5) == self._BUFFER[-5:]
+            assert positional.read(len(self._BUFFER) - 5, 10) == self._BUFFER[-5:]
+            assert positional.read(len(self._BUFFER) + 5) == b""
+
+    @pytest.mark.skipif(not hasattr(os, "pread"), reason="Positional IO unsupported")
+    def test_short_reads(self, monkeypatch):
+        pread = os.pread
+        monkeypatch.setattr(os, "pread", lambda fd, size, offset: pread(fd, min(size, 3), offset))
+        with self._get_file() as h:
+            assert _PositionalIO(h).read(7, 20) == self._BUFFER[7:27]
+
+    def test_threaded_reads(self):
+        size = 13
+        with self._get_file() as h:
+            serializer = BinarySerializer(h)
+
+            def _read(i: int) -> bytes:
+                return BinaryWindow(h, i * size, size).read() + serializer.read_bytes(
+                    i * size, size
+                )
+
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                results = list(pool.map(_read, range(len(self._BUFFER) // size)))
+            assert all(result == b"ForTheEmperor" * 2 for result in results)
+
+
+class TestMappedSource:
+    _BUFFER = b"BloodForTheBloodGod"
+
+    @contextlib.contextmanager
+    def _get_source(self, buffer: bytes = _BUFFER):
+        with TempFileHandle() as file:
+            with file.open("wb") as h:
+                h.write(buffer)
+            with MappedSource.open(file.path) as source:
+                yield source
+
+    def test_requires_fileno(self):
+        with BytesIO(self._BUFFER) as h:
+            with pytest.raises(RelicToolError):
+                MappedSource(h)
+
+    def test_requires_plain_file(self):
+        with TempFileHandle() as file:
+            with gzip.open(file.path, "wb") as h:
+                h.write(self._BUFFER)
+            with gzip.open(file.path, "rb") as h:
+                with pytest.raises(RelicToolError):
+                    MappedSource(h, close_parent=False)
+
+    def test_requires_open_file(self):
+        with TempFileHandle() as file:
+            with file.open("wb") as h:
+                h.write(self._BUFFER)
+            h = open(file.path, "rb")
+            h.close()
+            with pytest.raises(RelicToolError):
+                MappedSource(h)
+
+    def test_open_closes_on_error(self, monkeypatch):
+        handles = []
+
+        def _open(*args: Any) -> Any:
+            handles.append(open(*args))
+            return handles[-1]
+
+        def _mmap(*args: Any, **kwargs: Any) -> Any:
+            raise OSError("Cannot map")
+
+        with TempFileHandle() as file:
+            with file.open("wb") as h:
+                h.write(self._BUFFER)
+            monkeypatch.setattr("relic.core.lazyio.open", _open, raising=False)
+            monkeypatch.setattr("relic.core.lazyio.mmap.mmap", _mmap)
+            with pytest.raises(OSError):
+                MappedSource.open(file.path)
+            assert len(handles) == 1 and handles[0].closed
+
+    def test_seek(self):
+        with self._get_source() as source:
+            assert source.seek(5) == 5
+            assert source.seek(3, os.SEEK_CUR) == 8
+            assert source.read(3) == b"The"
+            with pytest.raises(ValueError):
+                source.seek(0, 3)
+            with pytest.raises(RelicToolError):
+                source.seek(-20, os.SEEK_CUR)
+            assert source.tell() == 11
+
+    def test_empty(self):
+        with self._get_source(b"") as source:
+            assert source.size == 0
+            assert source.read() == b""
+            assert bytes(source.view()) == b""
+            assert source.find(b"\0") == -1
+
+    def test_read_seek(self):
+        with self._get_source() as source:
+            assert source.read(5) == b"Blood"
+            assert source.tell() == 5
+            source.seek(-3, os.SEEK_END)
+            assert source.read() == b"God"
+            assert source.read() == b""
+
+    def test_read_at(self):
+        with self._get_source() as source:
+            assert source.read_at(5, 3) == b"For"
+            assert source.tell() == 0
+
+    def test_view(self):
+        with self._get_source() as source:
+            with source.view(8, 3) as view:
+                assert view.readonly
+                assert view == b"The"
+
+    def test_close_with_view(self):
+        with self._get_source() as source:
+            view = source.view()
+            source.close()
+            assert source.closed
+            assert view == self._BUFFER
+
+    @pytest.mark.parametrize("buffer", [_BUFFER, b""])
+    def test_closed(self, buffer: bytes):
+        with self._get_source(buffer) as source:
+            window = BinaryWindow(source, 5, 3)
+            serializer = BinarySerializer(source)
+            source.close()
+            for read in (
+                source.read,
+                lambda: source.readinto(bytearray(3)),
+                lambda: source.read_at(5, 3),
+                source.view,
+                lambda: source.find(b"God"),
+                window.read,
+                lambda: serializer.read_bytes(5, 3),
+            ):
+                with pytest.raises(ValueError):
+                    read()
+
+    def test_not_writable(self):
+        with self._get_source() as source:
+            assert source.writable() is False
+            with pytest.raises(NotImplementedError):
+                source.write(b"Khorne")
+
+    def test_window(self):
+        with self._get_source() as source:
+            window = BinaryWindow(source, 11, 5)
+            assert window.read(3) == b"Blo"
+            assert window.read() == b"od"
+            assert source.tell() == 0
+
+    def test_serializer(self):
+        with self._get_source() as source:
+            serializer = BinarySerializer(source)
+            assert serializer._cache is None
+            assert serializer.read_bytes(16, 3) == b"God"
+
+    def test_read_chunks(self):
+        with self._get_source() as source:
+            chunks = list(read_chunks(source, 5, 11, chunk_size=4))
+            assert chunks == [b"ForT", b"heBl", b"ood"]
+
+
+class TestReadInto:
+    _BUFFER = b"LoremIpsumDolorSitAmet"
+
+    def test_wrapper(self):
+        with BytesIO(self._BUFFER) as h:
+            wrapper = BinaryWrapper(h, close_parent=False)
+            buffer = bytearray(5)
+            assert wrapper.readinto(buffer) == 5
+            assert buffer == b"Lorem"
+            assert wrapper.readinto1(buffer) == 5
+            assert buffer == b"Ipsum"
+
+    @pytest.mark.parametrize("mapped", [True, False])
+    def test_window_bounds(self, mapped: bool):
+        with TempFileHandle() as file:
+            with file.open("wb") as h:
+                h.write(self._BUFFER)
+            with (MappedSource.open(file.path) if mapped else file.open("rb")) as h:
+                window = BinaryWindow(h, 5, 5)
+                buffer = bytearray(b"\0" * 8)
+                assert window.readinto(buffer) == 5
+                assert buffer == b"Ipsum\0\0\0"
+                assert window.readinto1(buffer) == 0
+
+    def test_read_only_handle(self):
+        # Handles without readinto/readinto1 are read into via read
+        class _ReadOnly:
+            def __init__(self, buffer: bytes):
+                self._handle = BytesIO(buffer)
+
+            def read(self, size: int = -1) -> bytes:
+                return self._handle.read(size)
+
+        wrapper = BinaryWrapper(_ReadOnly(self._BUFFER), close_parent=False)
+        buffer = bytearray(5)
+        assert wrapper.readinto(buffer) == 5
+        assert buffer == b"Lorem"
+        assert wrapper.readinto1(buffer) == 5
+        assert buffer == b"Ipsum"
+
+    def test_mapped(self):
+        with TempFileHandle() as file:
+            with file.open("wb") as h:
+                h.write(self._BUFFER)
+            with MappedSource.open(file.path) as source:
+                source.seek(5)
+                buffer = bytearray(5)
+                assert source.readinto(buffer) == 5
+                assert buffer == b"Ipsum"
+                assert source.readinto1(buffer) == 5
+                assert buffer == b"Dolor"
+                assert source.tell() == 15
+
+    @pytest.mark.skipif(not hasattr(os, "pread"), reason="Positional IO unsupported")
+    @pytest.mark.parametrize("preadv", [True, False])
+    def test_positional(self, preadv: bool, monkeypatch):
+        if not preadv:
+            monkeypatch.setattr("relic.core.lazyio._HAS_PREADV", False)
+        with TempFileHandle() as file:
+            with file.open("wb") as h:
+                h.write(self._BUFFER)
+            with open(file.path, "r+b") as h:
+                h.seek(0, os.SEEK_END)
+                h.write(b"!")  # buffered; must be flushed before reading
+                positional = _PositionalIO(h)
+                buffer = bytearray(b"\0" * 8)
+                assert positional.readinto(memoryview(buffer), 18) == 5
+                assert buffer == b"Amet!\0\0\0"
+
+    def test_window_fallback(self):
+        with BytesIO(self._BUFFER) as h:
+            window = BinaryWindow(h, 10, 5)
+            buffer = bytearray(3)
+            assert window.readinto(buffer) == 3
+            assert buffer == b"Dol"
+            assert window.tell() == 3
+
+    def test_zlib(self):
+        with BytesIO(_zcomp(self._BUFFER)) as h:
+            reader = ZLibFileReader(h)
+            buffer = bytearray(16)
+            assert reader.readinto(buffer) == 16
+            assert buffer == self._BUFFER[:16]
+            assert reader.readinto1(buffer) == len(self._BUFFER) - 16
+            assert buffer[:6] == self._BUFFER[16:]
+
+    def test_read_chunks_buffer(self):
+        with BytesIO(self._BUFFER) as h:
+            buffer = bytearray(4)
+            chunks = [
+                bytes(chunk) for chunk in read_chunks(h, 5, 10, buffer=buffer)
+            ]
+            assert chunks == [b"Ipsu", b"mDol", b"or"]
+
+    def test_read_chunks_buffer_unbounded(self):
+        with BytesIO(self._BUFFER) as h:
+            h.seek(17)
+            chunks = [bytes(chunk) for chunk in read_chunks(h, buffer=bytearray(4))]
+            assert chunks == [b"tAme", b"t"]
+
+    def test_read_chunks_buffer_bytes(self):
+        chunks = list(read_chunks(self._BUFFER, 5, 10, buffer=bytearray(4)))
+        assert all(isinstance(chunk, memoryview) for chunk in chunks)
+        assert b"".join(chunks) == b"IpsumDolor"
+
+    def test_read_chunks_empty_buffer(self):
+        with pytest.raises(RelicToolError):
+            list(read_chunks(self._BUFFER, buffer=bytearray()))
+
+    @pytest.mark.parametrize("dest_size", [0, 4, 32])
+    def test_chunk_copy_grows(self, dest_size: int):
+        with BytesIO(self._BUFFER) as h:
+            dest = bytearray(b"\1" * dest_size)
+            chunk_copy(h, dest, 5, 10, 2, chunk_size=3)
+            expected = bytearray(b"\1" * dest_size)
+            expected[2:12] = b"IpsumDolor"
+            assert dest == expected
+
+    def test_chunk_copy_short_read(self):
+        with BytesIO(self._BUFFER) as h:
+            dest = bytearray()
+            chunk_copy(h, dest, 17, 64)
+            assert dest == b"tAmet"
+
+
+class _CountingBytesIO(BytesIO):
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.reads = 0
+
+    def read(self, *args: Any) -> bytes:
+        self.reads += 1
+        return super().read(*args)
+
+    def readinto(self, *args: Any) -> int:
+        self.reads += 1
+        return super().readinto(*args)
+
+
+class _SeekCountingBytesIO(BytesIO):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.seeks = 0
+        self.tells = 0
+
+    def seek(self, *args, **kwargs):
+        self.seeks += 1
+        return super().seek(*args, **kwargs)
+
+    def tell(self):
+        self.tells += 1
+        return super().tell()
+
+
+class TestReadMany:
+    _BUFFER = bytes(range(256)) * 64
+
+    @pytest.mark.parametrize(
+        ["ranges", "max_gap", "reads"],
+        [
+            ([(0, 4), (4, 4), (8, 4)], 0, 1),
+            ([(8, 4), (0, 4), (4, 8)], 0, 1),
+            ([(0, 4), (16, 4)], 0, 2),
+            ([(0, 4), (16, 4)], 12, 1),
+            ([(1024, 4), (0, 4), (16, 4), (1020, 8)], 16, 2),
+            ([(0, 0), (4, 0)], 0, 0),
+            ([], 0, 0),
+        ],
+    )
+    def test_read_many(self, ranges, max_gap: int, reads: int):
+        with _CountingBytesIO(self._BUFFER) as h:
+            serializer = BinarySerializer(h, cacheable=False)
+            results = serializer.read_many(ranges, max_gap=max_gap)
+            assert results == [self._BUFFER[o : o + s] for o, s in ranges]
+            assert h.reads == reads
+
+    def test_read_many_positional(self):
+        ranges = [(4000, 16), (0, 8), (8, 8), (12000, 4)]
+        with TempFileHandle() as file:
+            with file.open("wb") as h:
+                h.write(self._BUFFER)
+            with file.open("rb") as h:
+                serializer = BinarySerializer(h)
+                results = serializer.read_many(ranges)
+                assert results == [self._BUFFER[o : o + s] for o, s in ranges]
+
+    def test_read_many_cached(self):
+        with _CountingBytesIO(self._BUFFER) as h:
+            serializer = BinarySerializer(h, cacheable=True)
+            serializer.read_many([(0, 4), (64, 4)], max_gap=0)
+            h.reads = 0
+            results = serializer.read_many([(64, 4), (0, 4)], max_gap=0)
+            assert results == [self._BUFFER[64:68], self._BUFFER[0:4]]
+            assert h.reads == 0
+
+    @pytest.mark.parametrize("exact_size", [True, False])
+    def test_read_many_short(self, exact_size: bool):
+        size = len(self._BUFFER)
+        with BytesIO(self._BUFFER) as h:
+            serializer = BinarySerializer(h, cacheable=False)
+            ranges = [(0, 4), (size - 2, 4)]
+            if exact_size:
+                with pytest.raises(MismatchError):
+                    serializer.read_many(ranges, max_gap=size)
+            else:
+                results = serializer.read_many(ranges, exact_size=False, max_gap=size)
+                assert results == [self._BUFFER[:4], self._BUFFER[-2:]]
+
+
+class TestByteCache:
+    def test_lru_eviction(self):
+        cache = ByteCache(max_bytes=8)
+        cache.put("a", b"1234")
+        cache.put("b", b"5678")
+        assert cache.get("a") == b"1234"  # 'b' is now least recently used
+        cache.put("c", b"9")
+        assert "b" not in cache
+        assert "a" in cache and "c" in cache
+        stats = cache.stats
+        assert stats.evictions == 1
+        assert stats.resident_bytes == 5
+        assert stats.max_bytes == 8
+
+    def test_oversized(self):
+        cache = ByteCache(max_bytes=2)
+        cache.put("a", b"123")
+        assert len(cache) == 0
+        assert cache.stats.resident_bytes == 0
+
+    def test_replace(self):
+        cache = ByteCache(max_bytes=None)
+        cache.put("a", b"123")
+        cache.put("a", b"12")
+        assert cache.stats.resident_bytes == 2
+
+    def test_update(self):
+        cache = ByteCache(max_bytes=None)
+        cache.update("a", b"123")  # not cached; ignored
+        assert "a" not in cache
+        cache.put("a", b"123")
+        cache.put("b", b"4")
+        cache.update("a", b"12")
+        assert cache.items() == [("a", b"12"), ("b", b"4")]  # not marked as recently used
+        assert cache.stats.resident_bytes == 3
+
+    def test_hits_misses(self):
+        cache = ByteCache()
+        assert cache.get("a") is None
+        cache.put("a", b"")
+        assert cache.get("a") == b""
+        stats = cache.stats
+        assert (stats.hits, stats.misses) == (1, 1)
+        assert stats.hit_rate == 0.5
+
+    def test_peek(self):
+        cache = ByteCache(max_bytes=8)
+        cache.put("a", b"1234")
+        cache.put("b", b"5678")
+        assert cache.peek("a") == b"1234"  # does not mark 'a' as recently used
+        assert cache.peek("c") is None
+        cache.put("c", b"9")
+        assert "a" not in cache
+        assert (cache.stats.hits, cache.stats.misses) == (0, 0)
+
+    def test_discard_clear(self):
+        cache = ByteCache()
+        cache.put("a", b"123")
+        cache.put("b", b"456")
+        cache.discard("a")
+        cache.discard("missing")
+        assert cache.stats.resident_bytes == 3
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.stats.resident_bytes == 0
+
+    def test_negative_budget(self):
+        with pytest.raises(RelicToolError):
+            ByteCache(-1)
+
+    def test_empty_hit_rate(self):
+        assert CacheStats().hit_rate == 0.0
+
+    def test_serializer_budget(self):
+        with BytesIO(b"bobloblawlawblog") as h:
+            serializer = BinarySerializer(h, cacheable=True, cache_size=8)
+            serializer.read_bytes(0, 4)
+            serializer.read_bytes(4, 4)
+            serializer.read_bytes(0, 4)
+            serializer.read_bytes(8, 4)
+            stats = serializer.cache_stats
+            assert (stats.hits, stats.misses, stats.evictions) == (1, 3, 1)
+            assert stats.resident_bytes == 8
+
+    def test_serializer_uncached_stats(self):
+        with BytesIO() as h:
+            assert BinarySerializer(h, cacheable=False).cache_stats is None
+
+
+class TestBlockCache:
+    _BUFFER = bytes(range(256)) * 4
+
+    @contextlib.contextmanager
+    def _get_serializer(self, block_size: int = 64, **kwargs: Any):
+        with _CountingBytesIO(self._BUFFER) as h:
+            yield h, BinarySerializer(
+                h, cacheable=True, block_size=block_size, **kwargs
+            )
+
+    def test_sub_range_hit(self):
+        with self._get_serializer() as (h, serializer):
+            assert serializer.read_bytes(0, 64) == self._BUFFER[:64]
+            assert serializer.uint32.read(8) == int.from_bytes(
+                self._BUFFER[8:12], "little"
+            )
+            assert serializer.c_string.read(20, 3, encoding="latin-1") == "\x14\x15\x16"
+            assert h.reads == 1
+
+    def test_cross_block(self):
+        with self._get_serializer() as (h, serializer):
+            assert serializer.read_bytes(60, 72) == self._BUFFER[60:132]
+            assert h.reads == 1
+            assert serializer.read_bytes(100, 28) == self._BUFFER[100:128]
+            assert h.reads == 1
+            assert serializer.cache_stats.resident_bytes == 192
+
+    def test_end_of_stream(self):
+        size = len(self._BUFFER)
+        with self._get_serializer(block_size=100) as (h, serializer):
+            assert serializer.read_bytes(size - 4, 4) == self._BUFFER[-4:]
+            assert serializer.read_bytes(size - 2, 8, exact_size=False) == (
+                self._BUFFER[-2:]
+            )
+            assert h.reads == 1
+            with pytest.raises(MismatchError):
+                serializer.read_bytes(size - 2, 8)
+
+    def test_read_many(self):
+        with self._get_serializer() as (h, serializer):
+            ranges = [(130, 4), (0, 4), (4, 60)]
+            results = serializer.read_many(ranges, max_gap=0)
+            assert results == [self._BUFFER[o : o + s] for o, s in ranges]
+            assert h.reads == 2
+            assert serializer.read_bytes(140, 4) == self._BUFFER[140:144]
+            assert serializer.read_many(ranges) == results
+            assert h.reads == 2
+
+    def test_budget(self):
+        with self._get_serializer(block_size=64, cache_size=128) as (h, serializer):
+            for offset in range(0, 256, 64):
+                serializer.read_bytes(offset, 4)
+            stats = serializer.cache_stats
+            assert stats.evictions == 2
+            assert stats.resident_bytes == 128
+
+    def test_invalid_block_size(self):
+        with BytesIO() as h:
+            with pytest.raises(RelicToolError):
+                BinarySerializer(h, cacheable=True, block_size=0)
+
+
+class TestWriteThroughCache:
+    _BUFFER = bytes(range(128))
+
+    @pytest.fixture(params=[None, 16], ids=["Range", "Block"])
+    def block_size(self, request) -> Optional[int]:
+        yield request.param
+
+    @contextlib.contextmanager
+    def _get_serializer(self, block_size: Optional[int], buffer: bytes = _BUFFER):
+        with BytesIO(buffer) as h:
+            yield h, BinarySerializer(h, cacheable=True, block_size=block_size)
+
+    def test_overlapping_write(self, block_size: Optional[int]):
+        with self._get_serializer(block_size) as (h, serializer):
+            assert serializer.read_bytes(8, 16) == self._BUFFER[8:24]
+            serializer.write_bytes(b"\xff" * 8, 4)
+            serializer.uint32.write(0xDEADBEEF, 20)
+            expected = h.getvalue()
+            assert serializer.read_bytes(8, 16) == expected[8:24]
+            assert serializer.cache_stats.misses == 1
+
+    def test_read_modify_write(self, block_size: Optional[int]):
+        with self._get_serializer(block_size) as (h, serializer):
+            for _ in range(4):
+                value = serializer.uint32.read(32)
+                serializer.uint32.write(value + 1, 32)
+            assert serializer.uint32.read(32) == int.from_bytes(
+                self._BUFFER[32:36], "little"
+            ) + 4
+            assert h.getvalue()[32:36] == serializer.read_bytes(32, 4)
+
+    def test_extend_past_end(self, block_size: Optional[int]):
+        with self._get_serializer(block_size, b"\1" * 10) as (h, serializer):
+            assert serializer.read_bytes(8, 8, exact_size=False) == b"\1\1"
+            serializer.write_bytes(b"\2\2", 10)
+            assert serializer.read_bytes(8, 8, exact_size=False) == b"\1\1\2\2"
+
+    def test_write_past_end_with_hole(self, block_size: Optional[int]):
+        with self._get_serializer(block_size, b"\1" * 10) as (h, serializer):
+            assert serializer.read_bytes(8, 8, exact_size=False) == b"\1\1"
+            serializer.write_bytes(b"\2", 12)
+            assert serializer.read_bytes(8, 8, exact_size=False) == b"\1\1\0\0\2"
+
+    def test_write_does_not_scan_cache(self, block_size: Optional[int], monkeypatch):
+        with self._get_serializer(block_size) as (h, serializer):
+            for offset in range(0, 120, 4):
+                serializer.uint32.read(offset)
+            monkeypatch.setattr(ByteCache, "items", None)  # patching must not snapshot the cache
+            serializer.uint32.write(0xDEADBEEF, 20)
+            serializer.write_bytes(b"\xff" * 6, 126, size=6)
+            expected = h.getvalue()
+            for offset in range(0, 120, 4):
+                assert serializer.read_bytes(offset, 4) == expected[offset : offset + 4]
+            assert serializer.read_bytes(124, 8) == expected[124:132]
+
+    def test_empty_write(self, block_size: Optional[int]):
+        with self._get_serializer(block_size) as (h, serializer):
+            assert serializer.read_bytes(8, 16) == self._BUFFER[8:24]
+            assert serializer.write_bytes(b"", 12) == 0
+            assert serializer.read_bytes(8, 16) == self._BUFFER[8:24]
+
+    def test_large_write(self, block_size: Optional[int]):
+        # The write spans more blocks than are cached, and blocks which are not cached
+        with self._get_serializer(block_size) as (h, serializer):
+            assert serializer.read_bytes(40, 4) == self._BUFFER[40:44]
+            assert serializer.read_bytes(120, 4) == self._BUFFER[120:124]
+            serializer.write_bytes(b"\xff" * 100, 10)
+            assert serializer.read_bytes(40, 4) == b"\xff" * 4
+            assert serializer.read_bytes(120, 4) == self._BUFFER[120:124]
+            assert serializer.read_bytes(108, 4) == b"\xff" * 2 + self._BUFFER[110:112]
+
+    def test_write_past_cached(self, block_size: Optional[int]):
+        with self._get_serializer(block_size) as (h, serializer):
+            assert serializer.read_bytes(8, 32) == self._BUFFER[8:40]
+            serializer.write_bytes(b"\xff" * 20, 36)
+            assert serializer.read_bytes(8, 32) == self._BUFFER[8:36] + b"\xff" * 4
+            assert serializer.read_bytes(52, 8) == b"\xff" * 4 + self._BUFFER[56:60]
+
+    def test_evict_sorted_keys(self):
+        with BytesIO(self._BUFFER) as h:
+            serializer = BinarySerializer(h, cacheable=True, cache_size=8)
+            serializer.uint32.read(0)
+            serializer.uint32.write(1, 64)  # sorts the keys
+            serializer.uint32.read(8)
+            serializer.uint32.read(16)  # evicts (0, 4)
+            assert serializer._cache._keys == [(8, 4), (16, 4)]
+
+    def test_reads_do_not_sort_keys(self):
+        with self._get_serializer(None) as (h, serializer):
+            for offset in (64, 8, 32):
+                serializer.uint32.read(offset)
+            assert serializer._cache._keys is None
+            serializer.uint32.write(0xDEADBEEF, 30)
+            assert serializer._cache._keys == [(8, 4), (32, 4), (64, 4)]
+            serializer.uint32.read(16)
+            assert serializer._cache._keys == [(8, 4), (16, 4), (32, 4), (64, 4)]
+            assert serializer.read_bytes(32, 4) == h.getvalue()[32:36]
+
+    def test_random_writes(self, block_size: Optional[int]):
+        rng = random.Random(7)
+        with BytesIO(bytes(range(256)) * 4) as h:
+            # A small budget so reads are evicted while writes are applied
+            serializer = BinarySerializer(
+                h, cacheable=True, cache_size=256, block_size=block_size
+            )
+            ranges = [(rng.randrange(1100), rng.randrange(1, 48)) for _ in range(200)]
+            for offset, size in ranges:
+                serializer.read_bytes(offset, size, exact_size=False)
+                value = rng.randbytes(rng.randrange(1, 16))
+                serializer.write_bytes(value, rng.randrange(1100))
+                expected = h.getvalue()
+                for o, n in ranges[:10]:
+                    result = serializer.read_bytes(o, n, exact_size=False)
+                    assert result == expected[o : o + n]
+
+
+class _WriteCountingBytesIO(BytesIO):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.writes = 0
+
+    def write(self, *args, **kwargs):
+        self.writes += 1
+        return super().write(*args, **kwargs)
+
+
+class TestWriteBehind:
+    _BUFFER = bytes(range(64))
+
+    def test_coalesce(self):
+        with _WriteCountingBytesIO(self._BUFFER) as h:
+            serializer = BinarySerializer(h, write_behind=1024)
+            for offset in range(16, 32, 4):
+                serializer.write_bytes(b"\xff" * 4, offset)
+            serializer.write_bytes(b"\xee" * 4, 0)
+            assert h.writes == 0
+            assert h.getvalue() == self._BUFFER
+            serializer.flush()
+            assert h.writes == 2
+            expected = b"\xee" * 4 + self._BUFFER[4:16] + b"\xff" * 16 + self._BUFFER[32:]
+            assert h.getvalue() == expected
+
+    def test_overlapping(self):
+        with BytesIO(self._BUFFER) as h:
+            serializer = BinarySerializer(h, write_behind=1024)
+            serializer.write_bytes(b"\1" * 8, 8)
+            serializer.write_bytes(b"\2" * 8, 20)
+            serializer.write_bytes(b"\3" * 8, 12)  # bridges both writes
+            expected = bytearray(self._BUFFER)
+            expected[8:16] = b"\1" * 8
+            expected[20:28] = b"\2" * 8
+            expected[12:20] = b"\3" * 8
+            assert serializer.read_bytes(0, 64) == expected
+            serializer.close()
+            assert h.getvalue() == expected
+
+    def test_reads_see_pending(self):
+        with BytesIO(self._BUFFER) as h:
+            serializer = BinarySerializer(h, cacheable=True, write_behind=1024)
+            assert serializer.uint32.read(4) == int.from_bytes(self._BUFFER[4:8], "little")
+            serializer.uint32.write(0xDEADBEEF, 4)
+            assert serializer.uint32.read(4) == 0xDEADBEEF
+            assert serializer.read_many([(0, 6), (60, 8)], exact_size=False) == [
+                self._BUFFER[:4] + b"\xef\xbe",
+                self._BUFFER[60:],
+            ]
+            serializer.write_bytes(b"\1\1", 66)  # past the end, leaving a hole
+            assert serializer.read_bytes(62, 8, exact_size=False) == self._BUFFER[62:] + b"\0\0\1\1"
+            serializer.flush()
+            assert h.getvalue()[62:] == self._BUFFER[62:] + b"\0\0\1\1"
+            assert serializer.uint32.read(4) == 0xDEADBEEF
+
+    @pytest.mark.parametrize("block_size", [None, 16])
+    def test_reads_in_gap(self, block_size: Optional[int]):
+        # Reads between the end of the stream and a pending write must match the flushed stream
+        ranges = [(64, 2), (65, 4), (60, 8), (70, 4), (72, 8), (80, 4)]
+        with BytesIO(self._BUFFER) as h:
+            serializer = BinarySerializer(
+                h, cacheable=True, block_size=block_size, write_behind=1024
+            )
+            serializer.write_bytes(b"\1\1", 72)
+            pending = [serializer.read_bytes(o, n, exact_size=False) for o, n in ranges]
+            assert serializer.read_many(ranges, exact_size=False) == pending
+            serializer.flush()
+            flushed = h.getvalue()
+            assert pending == [flushed[o : o + n] for o, n in ranges]
+            assert pending[0] == b"\0\0"
+
+    def test_threshold(self):
+        with _WriteCountingBytesIO(self._BUFFER) as h:
+            serializer = BinarySerializer(h, write_behind=8)
+            serializer.write_bytes(b"\1" * 8, 0)
+            assert h.writes == 0
+            serializer.write_bytes(b"\1" * 4, 8)
+            assert h.writes == 1
+            assert h.getvalue()[:12] == b"\1" * 12
+
+    @pytest.mark.parametrize("pwritev", [True, False])
+    @pytest.mark.parametrize("buffering", [0, -1])
+    def test_positional(self, tmp_path, monkeypatch, buffering: int, pwritev: bool):
+        if not pwritev:
+            monkeypatch.setattr("relic.core.lazyio._HAS_PWRITEV", False)
+        path = tmp_path / "write_behind.bin"
+        path.write_bytes(self._BUFFER)
+        with open(path, "r+b", buffering=buffering) as h:
+            serializer = BinarySerializer(h, write_behind=1024)
+            for offset in range(0, 64, 2):
+                serializer.write_bytes(b"\xaa", offset)
+            serializer.close()
+            assert not h.closed
+        assert path.read_bytes()[::2] == b"\xaa" * 32
+        assert path.read_bytes()[1::2] == self._BUFFER[1::2]
+
+    @pytest.mark.skipif(not hasattr(os, "pwritev"), reason="Vectored positional IO unsupported")
+    def test_short_pwritev(self, tmp_path, monkeypatch):
+        pwritev = os.pwritev
+        # Only the first buffer of each call is written
+        monkeypatch.setattr(os, "pwritev", lambda fd, buffers, offset: pwritev(fd, buffers[:1], offset))
+        path = tmp_path / "write_behind.bin"
+        path.write_bytes(self._BUFFER)
+        with open(path, "r+b", buffering=0) as h:
+            serializer = BinarySerializer(h, write_behind=1024)
+            for offset in range(8, 16, 2):
+                serializer.write_bytes(b"\xaa\xbb", offset)
+            serializer.close()
+        assert path.read_bytes() == self._BUFFER[:8] + b"\xaa\xbb" * 4 + self._BUFFER[16:]
+
+    def test_sequential_reads_pending(self):
+        with BytesIO(self._BUFFER) as h:
+            serializer = BinarySerializer(h, write_behind=1024)
+            for offset in range(8, 16, 2):
+                serializer.write_bytes(b"\xaa\xbb", offset)
+            serializer.write_bytes(b"", 32)  # ignored
+            assert serializer.read_bytes(6, 12) == self._BUFFER[6:8] + b"\xaa\xbb" * 4 + self._BUFFER[16:18]
+            serializer.flush()
+            assert h.getvalue()[6:18] == self._BUFFER[6:8] + b"\xaa\xbb" * 4 + self._BUFFER[16:18]
+
+    def test_negative_budget(self):
+        with pytest.raises(RelicToolError):
+            BinarySerializer(BytesIO(), write_behind=-1)
+
+    def test_close_parent(self):
+        h = BytesIO(self._BUFFER)
+        serializer = BinarySerializer(h, close_parent=True, write_behind=1024)
+        serializer.write_bytes(b"\0", 0)
+        serializer.close()
+        assert h.closed
+
+
+class TestReadAhead:
+    _BUFFER = bytes(range(256)) * 256  # 64 KiB
+
+    @contextlib.contextmanager
+    def _get_serializer(self, read_ahead: int, **kwargs: Any):
+        with _CountingBytesIO(self._BUFFER) as h:
+            yield h, BinarySerializer(h, read_ahead=read_ahead, **kwargs)
+
+    def test_scattered(self):
+        with self._get_serializer(16 * 1024) as (h, serializer):
+            for offset in (64, 8, 1000, 12, 4000, 512):
+                assert serializer.uint32.read(offset) == int.from_bytes(
+                    self._BUFFER[offset : offset + 4], "little"
+                )
+            assert h.reads == 1
+
+    def test_sequential_grows(self):
+        with self._get_serializer(16 * 1024) as (h, serializer):
+            for offset in range(0, len(self._BUFFER), 4):
+                assert serializer.read_bytes(offset, 4) == self._BUFFER[offset : offset + 4]
+            # 4 + 8 + 16 + 16 + 16 + 16 KiB windows
+            assert h.reads == 6
+
+    def test_streaming(self):
+        with self._get_serializer(16 * 1024) as (h, serializer):
+            for offset in range(0, len(self._BUFFER), 16 * 1024):
+                assert serializer.read_bytes(offset, 16 * 1024) == self._BUFFER[offset : offset + 16 * 1024]
+            assert h.reads == 4
+            assert serializer._read_ahead._buffer[1] == b""
+
+    def test_end_of_stream(self):
+        with self._get_serializer(16 * 1024) as (h, serializer):
+            end = len(self._BUFFER)
+            assert serializer.read_bytes(end - 2, 4, exact_size=False) == self._BUFFER[-2:]
+            assert serializer.read_bytes(end, 4, exact_size=False) == b""
+            assert h.reads == 1
+            serializer.write_bytes(b"\1\2", end)
+            assert serializer.read_bytes(end - 2, 4) == self._BUFFER[-2:] + b"\1\2"
+
+    def test_write_coherent(self):
+        with self._get_serializer(16 * 1024, cacheable=False) as (h, serializer):
+            assert serializer.uint32.read(16) == int.from_bytes(self._BUFFER[16:20], "little")
+            serializer.uint32.write(0xDEADBEEF, 16)
+            assert serializer.uint32.read(16) == 0xDEADBEEF
+            assert h.reads == 1
+
+    def test_write_elsewhere(self):
+        with self._get_serializer(16 * 1024, cacheable=False) as (h, serializer):
+            assert serializer.uint32.read(16) == int.from_bytes(self._BUFFER[16:20], "little")
+            serializer.uint32.write(0xDEADBEEF, 32 * 1024)
+            assert serializer.uint32.read(16) == int.from_bytes(self._BUFFER[16:20], "little")
+            assert h.reads == 1
+
+    def test_read_to_end(self):
+        with self._get_serializer(16 * 1024, cacheable=False) as (h, serializer):
+            assert serializer.read_bytes(60 * 1024, -1, exact_size=False) == self._BUFFER[60 * 1024 :]
+
+    def test_invalid_size(self):
+        with BytesIO() as h:
+            with pytest.raises(RelicToolError):
+                BinarySerializer(h, read_ahead=0)
+
+
+class TestBinaryCursor:
+    # uint32, int16, 2 pad bytes, c-string(6), uint16
+    _RECORD = (
+        (1234).to_bytes(4, "little")
+        + (-5).to_bytes(2, "little", signed=True)
+        + b"\0\0"
+        + b"abc\0\0\0"
+        + (7).to_bytes(2, "little")
+    )
+
+    def test_decode(self):
+        with _CountingBytesIO(b"\xff" * 3 + self._RECORD * 32) as h:
+            cursor = BinarySerializer(h).cursor(3)
+            for _ in range(32):
+                assert cursor.uint32() == 1234
+                assert cursor.int16() == -5
+                cursor.skip(2)
+                assert cursor.c_string(6, encoding="ascii", padding="\0") == "abc"
+                assert cursor.uint16() == 7
+            assert cursor.tell() == 3 + len(self._RECORD) * 32
+            assert h.reads == 1
+            with pytest.raises(MismatchError):
+                cursor.bytes(1)
+
+    def test_align(self):
+        with BytesIO(bytes(range(32))) as h:
+            cursor = BinarySerializer(h).cursor(1)
+            assert cursor.align(4) == 4
+            assert cursor.align(4) == 4
+            assert cursor.bytes(2) == b"\4\5"
+            assert cursor.align(8) == 8
+            assert cursor.uint16("big") == 0x0809
+            with pytest.raises(RelicToolError):
+                cursor.align(0)
+
+    def test_read_int(self):
+        with BytesIO(self._RECORD) as h:
+            cursor = BinarySerializer(h).cursor()
+            assert cursor.read_int(3) == 1234
+            assert cursor.read_int(3, byteorder="big", signed=True) == 0xFBFF
+            with pytest.raises(RelicToolError):
+                cursor.seek(-1)
+            assert cursor.tell() == 6
+
+    def test_invalid_buffer_size(self):
+        with BytesIO(self._RECORD) as h:
+            with pytest.raises(RelicToolError):
+                BinarySerializer(h).cursor(buffer_size=0)
+
+    def test_small_buffer(self):
+        with _CountingBytesIO(self._RECORD * 4) as h:
+            cursor = BinarySerializer(h).cursor(buffer_size=4)
+            for _ in range(4):
+                assert cursor.uint32() == 1234
+                assert cursor.int32() == 0xFFFB
+                cursor.skip(len(self._RECORD) - 8)
+            assert h.reads == 8
+
+    def test_sees_writes(self):
+        with BytesIO(self._RECORD) as h:
+            serializer = BinarySerializer(h)
+            cursor = serializer.cursor()
+            assert cursor.uint32() == 1234
+            serializer.int16.write(42, 4)
+            assert cursor.int16() == 42
+            cursor.seek(0)
+            assert cursor.uint32() == 1234
+
+    def test_sized_fields(self):
+        buffer = struct.pack("<BbQqfd", 200, -3, 2**63, -(2**40), 0.5, -1.25)
+        with BytesIO(buffer) as h:
+            cursor = BinarySerializer(h).cursor()
+            assert cursor.uint8() == 200
+            assert cursor.int8() == -3
+            assert cursor.uint64() == 2**63
+            assert cursor.int64() == -(2**40)
+            assert cursor.float32() == 0.5
+            assert cursor.float64() == -1.25
+            with pytest.raises(MismatchError):
+                cursor.uint16()
+
+
+class TestArrays:
+    @pytest.mark.parametrize(
+        ["dtype", "fmt", "values"],
+        [
+            ("u8", "B", [0, 1, 255]),
+            ("i16", "h", [-1, 2, -32768]),
+            ("u32", "I", [1, 2**32 - 1, 1234]),
+            ("i64", "q", [-(2**40), 7, 0]),
+            ("f32", "f", [0.5, -2.0, 8.25]),
+            ("f64", "d", [0.1, -1e300, 3.0]),
+        ],
+    )
+    @pytest.mark.parametrize("byteorder", ["little", "big"])
+    def test_roundtrip(self, dtype: str, fmt: str, values: list, byteorder: str):
+        prefix = "<" if byteorder == "little" else ">"
+        packed = struct.pack(f"{prefix}{len(values)}{fmt}", *values)
+        with BytesIO(b"\0" + packed) as h:
+            serializer = BinarySerializer(h)
+            result = serializer.read_array(1, len(values), dtype, byteorder)
+            assert isinstance(result, array.array)
+            assert result.tolist() == values
+            h.seek(0)
+            h.truncate()
+            assert serializer.write_array(result, 0, dtype, byteorder) == len(packed)
+            assert h.getvalue() == packed
+            assert result.tolist() == values  # the caller's array is not swapped in place
+
+    def test_write_iterable(self):
+        with BytesIO() as h:
+            BinarySerializer(h).write_array(range(4), 0, "u16", "big")
+            assert h.getvalue() == b"\0\0\0\1\0\2\0\3"
+
+    def test_short_read(self):
+        with BytesIO(b"\0" * 7) as h:
+            with pytest.raises(MismatchError):
+                BinarySerializer(h).read_array(0, 2, "u32")
+
+    def test_invalid_dtype(self):
+        with BytesIO(b"\0" * 8) as h:
+            with pytest.raises(RelicToolError):
+                BinarySerializer(h).read_array(0, 2, "u24")
+
+    def test_no_platform_typecode(self, monkeypatch):
+        class _Array:
+            itemsize = 3
+
+            def __init__(self, typecode: str):
+                pass
+
+        monkeypatch.setattr(array, "array", _Array)
+        with pytest.raises(RelicToolError):
+            _array_typecode("u32")
+
+
+class TestStructLayout:
+    _LAYOUT = StructLayout(
+        [
+            ("name", CStringConverter("ascii", "\0", 8), 8),
+            ("magic", ByteConverter, 0, 4),
+            StructField("version", "u16", 4),
+            ("flags", IntConverter(1), 6),
+            ("size", IntConverter(4, "big"), 20),
+            ("ratio", "f32", 16),
+        ],
+        size=32,
+        name="Header",
+    )
+
+    _BUFFER = (
+        b"RELI"
+        + struct.pack("<HB", 3, 0x80)
+        + b"\0"
+        + b"archive\0"
+        + struct.pack("<f", 0.5)
+        + struct.pack(">I", 1234)
+        + b"\0" * 8
+    )
+
+    def test_compile(self):
+        assert self._LAYOUT.size == 32
+        assert self._LAYOUT.struct.format == "<4sHB1x8sf4s8x"
+        assert self._LAYOUT.record._fields == (
+            "magic",
+            "version",
+            "flags",
+            "name",
+            "ratio",
+            "size",
+        )
+
+    def test_unpack(self):
+        record = self._LAYOUT.unpack(b"\xff" + self._BUFFER, 1)
+        assert record == (b"RELI", 3, 0x80, "archive", 0.5, 1234)
+        assert record.name == "archive"
+        assert type(record).__name__ == "Header"
+
+    def test_pack(self):
+        record = self._LAYOUT.unpack(self._BUFFER)
+        assert self._LAYOUT.pack(record) == self._BUFFER
+        buffer = bytearray(b"\xff" * 33)
+        self._LAYOUT.pack_into(buffer, 1, record._replace(version=4))
+        assert buffer[1:] == self._BUFFER[:4] + b"\4" + self._BUFFER[5:]
+
+    def test_read_write(self):
+        with _CountingBytesIO(b"\0" * 4 + self._BUFFER) as h:
+            serializer = BinarySerializer(h)
+            record = self._LAYOUT.read(serializer, 4)
+            assert h.reads == 1
+            assert self._LAYOUT.write(serializer, 0, record._replace(size=7)) == 32
+            assert self._LAYOUT.read(serializer, 0).size == 7
+
+    def test_numpy_dtype(self):
+        np = pytest.importorskip("numpy")
+        dtype = self._LAYOUT.numpy_dtype()
+        assert dtype.itemsize == 32
+        assert dtype["magic"] == np.dtype("S4")
+        assert dtype["name"] == np.dtype("S8")
+        assert dtype["size"] == np.dtype(">u4")
+        table = np.frombuffer(self._BUFFER, dtype=dtype)
+        assert table["magic"][0] == b"RELI"
+        assert table["size"][0] == 1234
+
+    def test_exact_size(self):
+        layout = StructLayout([("a", "u32", 0), ("b", "u16", 4)], size=6)
+        assert layout.struct.format == "<IH"
+        assert layout.size == 6
+
+    def test_pack_size_mismatch(self):
+        record = self._LAYOUT.unpack(self._BUFFER)._replace(magic=b"RELIC")
+        with pytest.raises(RelicSerializationSizeError):
+            self._LAYOUT.pack(record)
+
+    @pytest.mark.parametrize(
+        ["fields", "size"],
+        [
+            ([("a", "u32", 0), ("b", "u16", 2)], None),  # overlap
+            ([("a", ByteConverter, 0)], None),  # unknown size
+            ([("a", "u24", 0)], None),  # unknown type
+            ([("a", "u32", 0)], 2),  # too small
+        ],
+    )
+    def test_invalid(self, fields, size):
+        with pytest.raises(RelicToolError):
+            StructLayout(fields, size=size)
+
+
+class TestRecordArray:
+    _LAYOUT = StructLayout([("id", "u32", 0), ("size", "u16", 4)], size=8)
+    _COUNT = 1000
+
+    @contextlib.contextmanager
+    def _get_array(self, **kwargs: Any):
+        buffer = b"\xff" * 3 + b"".join(
+            self._LAYOUT.pack((i, i % 7)) for i in range(self._COUNT)
+        )
+        with _CountingBytesIO(buffer) as h:
+            serializer = BinarySerializer(h, cacheable=False)
+            yield h, RecordArray(serializer, 3, self._COUNT, self._LAYOUT, **kwargs)
+
+    def test_lazy(self):
+        with self._get_array() as (h, records):
+            assert len(records) == self._COUNT
+            assert h.reads == 0
+            assert records[500] == (500, 500 % 7)
+            assert records[-1].id == self._COUNT - 1
+            assert h.reads == 2
+
+    @pytest.mark.parametrize(["count", "stride"], [(-1, None), (1, 0)])
+    def test_invalid(self, count: int, stride: Optional[int]):
+        with BytesIO() as h:
+            with pytest.raises(RelicToolError):
+                RecordArray(BinarySerializer(h), 0, count, self._LAYOUT, stride=stride)
+
+    def test_index_error(self):
+        with self._get_array() as (_, records):
+            with pytest.raises(IndexError):
+                _ = records[self._COUNT]
+            with pytest.raises(IndexError):
+                _ = records[-self._COUNT - 1]
+
+    def test_iter_chunked(self):
+        with self._get_array(chunk_size=80) as (h, records):
+            assert [record.id for record in records] == list(range(self._COUNT))
+            assert h.reads == self._COUNT // 10
+
+    @pytest.mark.parametrize(
+        "index", [slice(10, 20), slice(None, None, 3), slice(900, 100, -7), slice(5, 5)]
+    )
+    def test_slice(self, index: slice):
+        with self._get_array(chunk_size=64) as (h, records):
+            view = records[index]
+            assert isinstance(view, RecordArray)
+            assert h.reads == 0
+            expected = list(range(self._COUNT))[index]
+            assert [record.id for record in view] == expected
+            assert [view[i].id for i in range(len(view))] == expected
+
+    def test_stride(self):
+        with self._get_array(stride=16) as (_, records):
+            assert len(records[: self._COUNT // 2]) == self._COUNT // 2
+            assert [record.id for record in records[: self._COUNT // 2]] == list(
+                range(0, self._COUNT, 2)
+            )
+
+    def test_to_columns(self):
+        with self._get_array() as (h, records):
+            columns = records.to_columns()
+            assert h.reads == 1
+            assert isinstance(columns["id"], array.array)
+            assert columns["id"].tolist() == list(range(self._COUNT))
+            assert columns["size"].tolist() == [i % 7 for i in range(self._COUNT)]
+            assert records[::-5].to_columns()["id"].tolist() == list(range(self._COUNT))[::-5]
+            assert records[:0].to_columns() == {"id": array.array(columns["id"].typecode), "size": array.array(columns["size"].typecode)}
+
+    def test_to_columns_converters(self):
+        layout = StructLayout(
+            [("name", CStringConverter("ascii", "\0", 4), 0), ("big", IntConverter(2, "big"), 4)]
+        )
+        with BytesIO(b"ab\0\0\0\1cd\0\0\1\0") as h:
+            records = RecordArray(BinarySerializer(h), 0, 2, layout)
+            columns = records.to_columns()
+            assert columns["name"] == ["ab", "cd"]
+            assert columns["big"].tolist() == [1, 256]
+
+    def test_to_numpy(self):
+        np = pytest.importorskip("numpy")
+        with self._get_array() as (h, records):
+            table = records.to_numpy()
+            assert h.reads == 1
+            assert table["id"].tolist() == list(range(self._COUNT))
+            large = table[table["size"] > 5]
+            assert large["id"].tolist() == [i for i in range(self._COUNT) if i % 7 > 5]
+            assert records[900:100:-7].to_numpy()["id"].tolist() == list(range(self._COUNT))[900:100:-7]
+            assert table.dtype == records.layout.numpy_dtype()
+            assert isinstance(table, np.ndarray)
+
+    def test_to_numpy_mapped(self, tmp_path):
+        pytest.importorskip("numpy")
+        path = tmp_path / "table.bin"
+        path.write_bytes(b"".join(self._LAYOUT.pack((i, i % 7)) for i in range(self._COUNT)))
+        with MappedSource.open(path) as source:
+            table = RecordArray(BinarySerializer(source), 0, self._COUNT, self._LAYOUT).to_numpy()
+            assert table["id"][-1] == self._COUNT - 1
+            del table
+
+    def test_to_numpy_mapped_pending_writes(self, tmp_path):
+        pytest.importorskip("numpy")
+        path = tmp_path / "table.bin"
+        path.write_bytes(b"".join(self._LAYOUT.pack((i, i % 7)) for i in range(self._COUNT)))
+        with MappedSource.open(path) as source:
+            serializer = BinarySerializer(source, write_behind=1024)
+            serializer.write_bytes(self._LAYOUT.pack((0xDEAD, 0)), self._LAYOUT.size * 3)
+            table = RecordArray(serializer, 0, self._COUNT, self._LAYOUT).to_numpy()
+            assert table["id"][:4].tolist() == [0, 1, 2, 0xDEAD]
+            del table
+
+    @pytest.mark.parametrize("index", [slice(-2000, None, -1), slice(5, 5), slice(2000, None)])
+    def test_empty_slice(self, index: slice):
+        with self._get_array() as (h, records):
+            empty = records[index]
+            assert len(empty) == 0
+            assert list(empty) == []
+            columns = empty.to_columns()
+            assert list(columns) == ["id", "size"]
+            assert all(len(column) == 0 for column in columns.values())
+            assert h.reads == 0
+
+    def test_empty_slice_to_numpy(self):
+        pytest.importorskip("numpy")
+        with self._get_array() as (h, records):
+            table = records[-2000::-1].to_numpy()
+            assert table.shape == (0,)
+            assert table.dtype == records.layout.numpy_dtype()
+            assert h.reads == 0
+
+    def test_to_numpy_missing(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "numpy", None)
+        with self._get_array() as (_, records):
+            with pytest.raises(RelicToolError):
+                records.to_numpy()
+
+
+class TestStringTable:
+    _NAMES = ["data", "textures", "data", "", "sounds", "textures"]
+
+    @contextlib.contextmanager
+    def _get_table(self, names: List[str], encoding: str = "ascii", tail: bytes = b""):
+        terminator = _CStringOps.terminator(encoding)
+        blob = b"".join(name.encode(encoding) + terminator for name in names) + tail
+        with _CountingBytesIO(b"Head" + blob) as h:
+            yield h, StringTable(
+                BinarySerializer(h, cacheable=False), 4, len(blob), encoding=encoding
+            )
+
+    def test_lazy(self):
+        with self._get_table(self._NAMES) as (h, table):
+            assert h.reads == 0
+            assert table[0] == "data"
+            assert table[5] == "textures"
+            assert len(table) == len(self._NAMES)
+            assert h.reads == 1
+
+    def test_iter(self):
+        with self._get_table(self._NAMES) as (_, table):
+            assert list(table.values()) == self._NAMES
+            assert list(table) == [0, 5, 14, 19, 20, 27]
+
+    def test_interned(self):
+        with self._get_table(self._NAMES) as (_, table):
+            assert table[0] is table[14]
+            assert table[5] is table[27]
+
+    def test_mid_string(self):
+        with self._get_table(self._NAMES) as (_, table):
+            assert table[9] == "ures"
+            assert 9 in table
+            assert 9 not in list(table)
+
+    def test_encoding(self):
+        with self._get_table(self._NAMES, "utf-16-le") as (_, table):
+            assert table.encoding == "utf-16-le"
+            assert list(table.values()) == self._NAMES
+            assert table[10] == "textures"
+
+    def test_missing(self):
+        with self._get_table(self._NAMES, tail=b"unterminated") as (_, table):
+            assert len(table) == len(self._NAMES)
+            with pytest.raises(KeyError):
+                _ = table[1000]
+            with pytest.raises(RelicToolError):
+                _ = table[40]
+            assert 36 not in table
+            assert "data" not in table
+
+    def test_negative_size(self):
+        with BytesIO() as h:
+            with pytest.raises(RelicToolError):
+                StringTable(BinarySerializer(h), 0, -1)
+
+    def test_invalidate(self):
+        with self._get_table(self._NAMES) as (h, table):
+            assert table[0] == "data"
+            h.seek(4)
+            h.write(b"atad")
+            assert table[0] == "data"
+            table.invalidate()
+            assert table[0] == "atad"
+            assert h.reads == 2
+
+
+class TestStringPoolBuilder:
+    _NAMES = ["texturedata", "data", "sounds", "data", "", "ata", "textures"]
+
+    def test_dedup(self):
+        pool = StringPoolBuilder()
+        pool.extend(self._NAMES)
+        assert len(pool) == 6
+        assert "data" in pool
+        buffer, offsets = pool.build()
+        assert buffer == b"texturedata\0data\0sounds\0\0ata\0textures\0"
+        assert list(offsets) == ["texturedata", "data", "sounds", "", "ata", "textures"]
+        assert offsets["sounds"] == 17
+
+    def test_share_suffixes(self):
+        pool = StringPoolBuilder(share_suffixes=True)
+        pool.extend(self._NAMES)
+        buffer, offsets = pool.build()
+        assert buffer == b"texturedata\0sounds\0textures\0"
+        assert offsets == {
+            "texturedata": 0,
+            "data": 7,
+            "sounds": 12,
+            "": 11,
+            "ata": 8,
+            "textures": 19,
+        }
+
+    @pytest.mark.parametrize("share_suffixes", [False, True])
+    @pytest.mark.parametrize("encoding", ["ascii", "utf-16-le"])
+    def test_round_trip(self, encoding: str, share_suffixes: bool):
+        pool = StringPoolBuilder(encoding, share_suffixes=share_suffixes)
+        assert pool.encoding == encoding
+        pool.extend(self._NAMES)
+        with _WriteCountingBytesIO() as h:
+            serializer = BinarySerializer(h)
+            offsets = pool.write(serializer, 4)
+            assert h.writes == 1
+            buffer = h.getvalue()
+            table = StringTable(serializer, 4, len(buffer) - 4, encoding=encoding)
+            for name, offset in offsets.items():
+                assert table[offset] == name